@@ -39,15 +39,55 @@ class Settings(BaseSettings):
         REDIS_DB (int): The Redis database number.
         QDRANT_HOST (str): The Qdrant host.
         QDRANT_PORT (int): The Qdrant port.
+        QDRANT_PREFER_GRPC (bool): Whether to talk to Qdrant over gRPC instead of HTTP.
+        QDRANT_GRPC_PORT (int): The Qdrant gRPC port.
+        QDRANT_WRITE_BATCH_SIZE (int): Number of points buffered per Qdrant upload.
+        QDRANT_WRITE_PARALLELISM (int): Max number of Qdrant uploads in flight per sync.
         TEXT2VEC_INFERENCE_URL (str): The URL for text2vec-transformers inference service.
+        TEXT2VEC_MAX_CONCURRENCY (int): Max concurrent requests to the text2vec service.
+        TEXT2VEC_BATCH_SIZE (int): Max texts sent per batch to the text2vec service.
+        TEXT2VEC_BATCH_ENDPOINT (Optional[str]): Path of a batch endpoint that accepts
+            {"texts": [...]} and returns {"vectors": [...]}. Without it, texts of a batch are
+            sent as concurrent single-text requests.
         OPENAI_API_KEY (Optional[str]): The OpenAI API key.
         MISTRAL_API_KEY (Optional[str]): The Mistral AI API key.
+        MISTRAL_OCR_CONCURRENCY (int): Max number of page batches of a PDF sent to Mistral OCR
+            at the same time.
         FIRECRAWL_API_KEY (Optional[str]): The FireCrawl API key.
         TEMPORAL_HOST (str): The Temporal server hostname.
         TEMPORAL_PORT (int): The Temporal server port.
         TEMPORAL_NAMESPACE (str): The Temporal namespace.
         TEMPORAL_TASK_QUEUE (str): The Temporal task queue name.
         TEMPORAL_ENABLED (bool): Whether Temporal is enabled.
+        SYNC_ENTITY_BATCH_SIZE (int): Max number of entities processed together in one batch.
+        SYNC_ENTITY_BATCH_MAX_WAIT_MS (int): Max milliseconds to wait for a batch to fill up.
+        SYNC_ENTITY_HASH_PRELOAD_MAX_ENTITIES (int): Syncs with at most this many stored
+            entities load all entity hashes into memory at job start (0 disables preloading).
+        SYNC_ENTITY_HASH_COMMIT_BATCH_SIZE (int): Number of written entities after which the
+            destinations are flushed and the hashes of the entities they applied are stored.
+        SYNC_FILE_DOWNLOAD_CONCURRENCY (int): Max number of files a sync downloads at the same
+            time.
+        EMBEDDING_BATCH_SIZE (int): Max number of texts sent in one coalesced embedding request.
+        EMBEDDING_BATCH_MAX_TOKENS (int): Max estimated tokens in one coalesced embedding request.
+        EMBEDDING_BATCH_MAX_WAIT_MS (int): Max milliseconds texts wait for a batch to fill up.
+        EMBEDDING_CACHE_BACKEND (str): Where embedding vectors are cached, one of
+            "lru" (in-process), "redis", "postgres" or "none".
+        EMBEDDING_CACHE_MAX_SIZE (int): Max number of vectors kept by the in-process cache.
+        EMBEDDING_CACHE_MAX_ROWS (int): Max number of vectors kept by the Postgres cache.
+        EMBEDDING_CACHE_TTL_SECONDS (int): Seconds after which cached vectors expire (0 = never).
+        SQL_SOURCE_BATCH_SIZE (int): Number of rows fetched per query by the database sources.
+        SOURCE_RATE_LIMIT_BACKEND (str): Where source rate limit buckets are kept, either
+            "local" (per process) or "redis" (shared by all workers).
+        PROCESS_POOL_WORKERS (int): Worker processes for chunking and document conversion
+            (0 = run them in threads).
+        PROCESS_POOL_TASK_TIMEOUT (int): Seconds a chunking or conversion task may take.
+        CHUNKING_MODE (str): How text too large for one chunk is split, either "structural"
+            (on markdown structure within a token budget, locally) or "semantic" (Chonkie's
+            SemanticChunker, which embeds every sentence window remotely).
+        CONVERSION_CACHE_BACKEND (str): Where converted documents are cached by checksum, one of
+            "disk", "postgres" or "none".
+        CONVERSION_CACHE_DIR (str): Directory of the disk conversion cache.
+        CONVERSION_CACHE_MAX_BYTES (int): Max total size of the cached conversions.
 
         # Custom deployment URLs
         API_FULL_URL (Optional[str]): The full URL for the API.
@@ -95,11 +135,19 @@ class Settings(BaseSettings):
 
     QDRANT_HOST: Optional[str] = None
     QDRANT_PORT: Optional[int] = None
+    QDRANT_PREFER_GRPC: bool = False
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_WRITE_BATCH_SIZE: int = 256
+    QDRANT_WRITE_PARALLELISM: int = 4
     TEXT2VEC_INFERENCE_URL: str = "http://localhost:9878"
+    TEXT2VEC_MAX_CONCURRENCY: int = 8
+    TEXT2VEC_BATCH_SIZE: int = 32
+    TEXT2VEC_BATCH_ENDPOINT: Optional[str] = None
 
     OPENAI_API_KEY: Optional[str] = None
     ANTHROPIC_API_KEY: Optional[str] = None
     MISTRAL_API_KEY: Optional[str] = None
+    MISTRAL_OCR_CONCURRENCY: int = 4
     FIRECRAWL_API_KEY: Optional[str] = None
 
     AZURE_KEYVAULT_NAME: Optional[str] = None
@@ -111,6 +159,28 @@ class Settings(BaseSettings):
     TEMPORAL_TASK_QUEUE: str = "airweave-sync-queue"
     TEMPORAL_ENABLED: bool = False
 
+    # Sync pipeline configuration
+    SYNC_ENTITY_BATCH_SIZE: int = 64
+    SYNC_ENTITY_BATCH_MAX_WAIT_MS: int = 200
+    SYNC_ENTITY_HASH_PRELOAD_MAX_ENTITIES: int = 100_000
+    SYNC_ENTITY_HASH_COMMIT_BATCH_SIZE: int = 1000
+    SYNC_FILE_DOWNLOAD_CONCURRENCY: int = 8
+    EMBEDDING_BATCH_SIZE: int = 256
+    EMBEDDING_BATCH_MAX_TOKENS: int = 200_000
+    EMBEDDING_BATCH_MAX_WAIT_MS: int = 50
+    EMBEDDING_CACHE_BACKEND: str = "lru"
+    EMBEDDING_CACHE_MAX_SIZE: int = 10_000
+    EMBEDDING_CACHE_MAX_ROWS: int = 1_000_000
+    EMBEDDING_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    SQL_SOURCE_BATCH_SIZE: int = 1000
+    SOURCE_RATE_LIMIT_BACKEND: str = "local"
+    PROCESS_POOL_WORKERS: int = 2
+    PROCESS_POOL_TASK_TIMEOUT: int = 600
+    CHUNKING_MODE: str = "structural"
+    CONVERSION_CACHE_BACKEND: str = "disk"
+    CONVERSION_CACHE_DIR: str = "/tmp/airweave/conversion_cache"
+    CONVERSION_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
+
     # Custom deployment URLs - these are used to override the default URLs to allow
     # for custom domains in custom deployments
     API_FULL_URL: Optional[str] = None
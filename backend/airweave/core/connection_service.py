@@ -3,7 +3,6 @@
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-import httpx
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,6 +10,7 @@ from airweave import crud, schemas
 from airweave.core import credentials
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.core.shared_models import ConnectionStatus, SyncStatus
 from airweave.db.unit_of_work import UnitOfWork
@@ -466,7 +466,7 @@ class ConnectionService:
             HTTPException: If the token is invalid
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client_pool.client() as client:
                 headers = {
                     "Authorization": f"Bearer {token}",
                     "Content-Type": "application/json",
@@ -4,8 +4,10 @@ from .crud_api_key import api_key
 from .crud_chat import chat
 from .crud_collection import collection
 from .crud_connection import connection
+from .crud_conversion_cache import conversion_cache
 from .crud_dag import sync_dag
 from .crud_destination import destination
+from .crud_embedding_cache import embedding_cache
 from .crud_embedding_model import embedding_model
 from .crud_entity import entity
 from .crud_entity_definition import entity_definition
@@ -15,6 +17,7 @@ from .crud_organization import organization
 from .crud_source import source
 from .crud_source_connection import source_connection
 from .crud_sync import sync
+from .crud_sync_cursor import sync_cursor
 from .crud_sync_job import sync_job
 from .crud_transformer import transformer
 from .crud_user import user
@@ -28,7 +31,9 @@ __all__ = [
     "chat_message",
     "chunk",
     "connection",
+    "conversion_cache",
     "destination",
+    "embedding_cache",
     "embedding_model",
     "entity_definition",
     "entity_relation",
@@ -39,6 +44,7 @@ __all__ = [
     "source_connection",
     "sync",
     "sync_dag",
+    "sync_cursor",
     "sync_job",
     "transformer",
     "user",
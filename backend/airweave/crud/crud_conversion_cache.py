@@ -0,0 +1,132 @@
+"""CRUD operations for cached file conversions."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.crud._base_system import CRUDBaseSystem
+from airweave.db.unit_of_work import UnitOfWork
+from airweave.models.conversion_cache import ConversionCacheEntry
+from airweave.schemas.conversion_cache import (
+    ConversionCacheEntryCreate,
+    ConversionCacheEntryUpdate,
+)
+
+
+class CRUDConversionCache(
+    CRUDBaseSystem[ConversionCacheEntry, ConversionCacheEntryCreate, ConversionCacheEntryUpdate]
+):
+    """CRUD operations for cached file conversions."""
+
+    async def get_text(
+        self,
+        db: AsyncSession,
+        cache_key: str,
+        *,
+        uow: Optional[UnitOfWork] = None,
+    ) -> Optional[str]:
+        """Get a cached conversion and mark it as recently used.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            cache_key (str): The cache key to look up.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+        -------
+            Optional[str]: The cached markdown, or None if it is not cached.
+
+        """
+        stmt = (
+            update(ConversionCacheEntry)
+            .where(ConversionCacheEntry.cache_key == cache_key)
+            .values(modified_at=datetime.utcnow())
+            .returning(ConversionCacheEntry.text_content)
+        )
+        result = await db.execute(stmt)
+        text_content = result.scalar_one_or_none()
+
+        if not uow:
+            await db.commit()
+        return text_content
+
+    async def upsert_text(
+        self,
+        db: AsyncSession,
+        *,
+        cache_key: str,
+        text_content: str,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Insert or refresh a cached conversion.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            cache_key (str): The cache key of the conversion.
+            text_content (str): The converted markdown.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        now = datetime.utcnow()
+        stmt = insert(ConversionCacheEntry).values(
+            cache_key=cache_key,
+            text_content=text_content,
+            size=len(text_content.encode("utf-8")),
+            created_at=now,
+            modified_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ConversionCacheEntry.cache_key],
+            set_={
+                "text_content": stmt.excluded.text_content,
+                "size": stmt.excluded.size,
+                "modified_at": stmt.excluded.modified_at,
+            },
+        )
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
+    async def evict_to_size(
+        self,
+        db: AsyncSession,
+        *,
+        max_size: int,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Delete the least recently used conversions beyond a total size.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            max_size (int): Maximum total size of the cached markdown in bytes.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        # Running total of the sizes from the most to the least recently used entry
+        running_size = (
+            select(
+                ConversionCacheEntry.id,
+                func.sum(ConversionCacheEntry.size)
+                .over(order_by=ConversionCacheEntry.modified_at.desc())
+                .label("running_size"),
+            )
+        ).subquery()
+        stmt = delete(ConversionCacheEntry).where(
+            ConversionCacheEntry.id.in_(
+                select(running_size.c.id).where(running_size.c.running_size > max_size)
+            )
+        )
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
+
+conversion_cache = CRUDConversionCache(ConversionCacheEntry)
@@ -0,0 +1,138 @@
+"""CRUD operations for cached embeddings."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, any_, bindparam, delete, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.crud._base_system import CRUDBaseSystem
+from airweave.db.unit_of_work import UnitOfWork
+from airweave.models.embedding_cache import EmbeddingCacheEntry
+from airweave.schemas.embedding_cache import EmbeddingCacheEntryCreate, EmbeddingCacheEntryUpdate
+
+
+class CRUDEmbeddingCache(
+    CRUDBaseSystem[EmbeddingCacheEntry, EmbeddingCacheEntryCreate, EmbeddingCacheEntryUpdate]
+):
+    """CRUD operations for cached embeddings."""
+
+    async def get_vectors(
+        self,
+        db: AsyncSession,
+        cache_keys: list[str],
+        not_before: Optional[datetime] = None,
+    ) -> dict[str, bytes]:
+        """Get the cached vectors for many cache keys in a single query.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            cache_keys (list[str]): The cache keys to look up.
+            not_before (Optional[datetime]): Ignore entries written before this time.
+
+        Returns:
+        -------
+            dict[str, bytes]: A mapping of cache key to packed vector. Missing keys are absent.
+
+        """
+        if not cache_keys:
+            return {}
+
+        stmt = select(EmbeddingCacheEntry.cache_key, EmbeddingCacheEntry.vector).where(
+            EmbeddingCacheEntry.cache_key
+            == any_(bindparam("cache_keys", cache_keys, type_=ARRAY(String)))
+        )
+        if not_before is not None:
+            stmt = stmt.where(EmbeddingCacheEntry.modified_at >= not_before)
+
+        result = await db.execute(stmt)
+        return dict(result.all())
+
+    async def upsert_vectors(
+        self,
+        db: AsyncSession,
+        *,
+        vectors: dict[str, bytes],
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Insert or refresh many cached vectors with a single statement.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            vectors (dict[str, bytes]): A mapping of cache key to packed vector.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        if not vectors:
+            return
+
+        now = datetime.utcnow()
+        stmt = insert(EmbeddingCacheEntry).values(
+            [
+                {"cache_key": cache_key, "vector": vector, "created_at": now, "modified_at": now}
+                for cache_key, vector in vectors.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmbeddingCacheEntry.cache_key],
+            set_={"vector": stmt.excluded.vector, "modified_at": stmt.excluded.modified_at},
+        )
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
+    async def evict_to_count(
+        self,
+        db: AsyncSession,
+        *,
+        max_count: int,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Delete the least recently written vectors beyond a number of entries.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            max_count (int): Maximum number of cached vectors.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        surplus = (
+            select(EmbeddingCacheEntry.id)
+            .order_by(EmbeddingCacheEntry.modified_at.desc())
+            .offset(max_count)
+        )
+        stmt = delete(EmbeddingCacheEntry).where(EmbeddingCacheEntry.id.in_(surplus))
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
+    async def remove_expired(
+        self,
+        db: AsyncSession,
+        *,
+        before: datetime,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Delete all cached vectors that were last written before a given time.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            before (datetime): Entries last written before this time are deleted.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        stmt = delete(EmbeddingCacheEntry).where(EmbeddingCacheEntry.modified_at < before)
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
+
+embedding_cache = CRUDEmbeddingCache(EmbeddingCacheEntry)
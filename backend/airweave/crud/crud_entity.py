@@ -4,10 +4,13 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import UUID as SQLUUID
+from sqlalchemy import String, any_, bindparam, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.crud._base_organization import CRUDBaseOrganization
+from airweave.db.unit_of_work import UnitOfWork
 from airweave.models.entity import Entity
 from airweave.schemas.entity import EntityCreate, EntityUpdate
 
@@ -26,6 +29,178 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         result = await db.execute(stmt)
         return result.unique().scalars().one_or_none()
 
+    async def get_hashes_by_entity_ids(
+        self,
+        db: AsyncSession,
+        entity_ids: list[str],
+        sync_id: UUID,
+    ) -> dict[str, tuple[UUID, str]]:
+        """Get the stored id and hash for many entity ids within a sync in a single query.
+
+        The entity ids are sent as one array parameter (`entity_id = ANY(...)`), so the
+        statement stays the same regardless of how many ids are looked up.
+
+        Returns:
+            A mapping of entity_id to (db id, hash). Entity ids without a stored row are absent.
+        """
+        if not entity_ids:
+            return {}
+
+        stmt = select(Entity.entity_id, Entity.id, Entity.hash).where(
+            Entity.sync_id == sync_id,
+            Entity.entity_id == any_(bindparam("entity_ids", entity_ids, type_=ARRAY(String))),
+        )
+        result = await db.execute(stmt)
+        return {entity_id: (db_id, hash_) for entity_id, db_id, hash_ in result.all()}
+
+    async def get_ids_by_entity_id_prefixes(
+        self,
+        db: AsyncSession,
+        prefixes: list[str],
+        sync_id: UUID,
+    ) -> dict[str, UUID]:
+        """Get the stored ids of the entities of a sync whose entity_id starts with a prefix.
+
+        Returns:
+            A mapping of entity_id to db id.
+        """
+        if not prefixes:
+            return {}
+
+        stmt = select(Entity.entity_id, Entity.id).where(
+            Entity.sync_id == sync_id,
+            or_(*[Entity.entity_id.startswith(prefix, autoescape=True) for prefix in prefixes]),
+        )
+        result = await db.execute(stmt)
+        return dict(result.all())
+
+    async def get_hashes_by_sync_id(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+    ) -> dict[str, tuple[UUID, str]]:
+        """Get the stored id and hash of every entity of a sync.
+
+        Returns:
+            A mapping of entity_id to (db id, hash).
+        """
+        stmt = select(Entity.entity_id, Entity.id, Entity.hash).where(Entity.sync_id == sync_id)
+        result = await db.execute(stmt)
+        return {entity_id: (db_id, hash_) for entity_id, db_id, hash_ in result.all()}
+
+    async def bulk_upsert(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: list[EntityCreate],
+        organization_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> dict[str, UUID]:
+        """Insert or update many entities with a single statement.
+
+        Uses `INSERT ... ON CONFLICT (sync_id, entity_id) DO UPDATE`, so existing rows get
+        the new hash and sync job id while new rows are created. If an entity id occurs more
+        than once, the last occurrence wins.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            objs_in (list[EntityCreate]): The entities to insert or update.
+            organization_id (UUID): The UUID of the organization.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+        -------
+            dict[str, UUID]: A mapping of entity_id to the id of the stored row.
+
+        """
+        if not objs_in:
+            return {}
+
+        rows_by_key = {}
+        for obj_in in objs_in:
+            row = obj_in.model_dump()
+            row["organization_id"] = organization_id
+            rows_by_key[(row["sync_id"], row["entity_id"])] = row
+
+        stmt = insert(Entity).values(list(rows_by_key.values()))
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_sync_id_entity_id",
+            set_={
+                "hash": stmt.excluded.hash,
+                "sync_job_id": stmt.excluded.sync_job_id,
+                "modified_at": stmt.excluded.modified_at,
+            },
+        ).returning(Entity.entity_id, Entity.id)
+
+        result = await db.execute(stmt)
+        db_entity_ids = dict(result.all())
+
+        if not uow:
+            await db.commit()
+        return db_entity_ids
+
+    async def bulk_update_sync_job_id(
+        self,
+        db: AsyncSession,
+        *,
+        ids: list[UUID],
+        sync_job_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Mark many entities as seen by a sync job with a single statement.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            ids (list[UUID]): The ids of the entities to update.
+            sync_job_id (UUID): The sync job that encountered the entities.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        if not ids:
+            return
+
+        stmt = (
+            update(Entity)
+            .where(Entity.id == any_(bindparam("ids", ids, type_=ARRAY(SQLUUID))))
+            .values(sync_job_id=sync_job_id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
+    async def bulk_remove(
+        self,
+        db: AsyncSession,
+        *,
+        ids: list[UUID],
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Delete many entities by id with a single statement.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            ids (list[UUID]): The ids of the entities to delete.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        if not ids:
+            return
+
+        stmt = (
+            delete(Entity)
+            .where(Entity.id == any_(bindparam("ids", ids, type_=ARRAY(SQLUUID))))
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
     async def update_job_id(
         self,
         db: AsyncSession,
@@ -0,0 +1,68 @@
+"""CRUD operations for sync cursors."""
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.crud._base_system import CRUDBaseSystem
+from airweave.db.unit_of_work import UnitOfWork
+from airweave.models.sync_cursor import SyncCursor
+from airweave.schemas.sync_cursor import SyncCursorCreate, SyncCursorUpdate
+
+
+class CRUDSyncCursor(CRUDBaseSystem[SyncCursor, SyncCursorCreate, SyncCursorUpdate]):
+    """CRUD operations for sync cursors."""
+
+    async def get_by_sync_id(self, db: AsyncSession, sync_id: UUID) -> Optional[SyncCursor]:
+        """Get the cursor of a sync.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+
+        Returns:
+        -------
+            Optional[SyncCursor]: The cursor, or None if no job of the sync stored one yet.
+
+        """
+        result = await db.execute(select(SyncCursor).where(SyncCursor.sync_id == sync_id))
+        return result.scalar_one_or_none()
+
+    async def upsert(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        cursor_data: dict[str, Any],
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Create or replace the cursor of a sync.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+            cursor_data (dict[str, Any]): The JSON serializable cursor state.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        """
+        now = datetime.utcnow()
+        stmt = insert(SyncCursor).values(
+            sync_id=sync_id, cursor_data=cursor_data, created_at=now, modified_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SyncCursor.sync_id],
+            set_={"cursor_data": stmt.excluded.cursor_data, "modified_at": now},
+        )
+        await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+
+
+sync_cursor = CRUDSyncCursor(SyncCursor)
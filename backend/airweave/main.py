@@ -25,12 +25,14 @@ from airweave.api.router import TrailingSlashRouter
 from airweave.api.v1.api import api_router
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException, PermissionException
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.db.init_db import init_db
 from airweave.db.session import AsyncSessionLocal
 from airweave.platform.db_sync import sync_platform_components
 from airweave.platform.entities._base import ensure_file_entity_models
 from airweave.platform.scheduler import platform_scheduler
+from airweave.platform.utils.process_pool import shutdown_process_pool
 
 
 @asynccontextmanager
@@ -56,6 +58,12 @@ async def lifespan(app: FastAPI):
     # Stop the sync scheduler
     await platform_scheduler.stop()
 
+    # Close pooled HTTP connections
+    await http_client_pool.close()
+
+    # Stop the chunking and conversion worker processes
+    shutdown_process_pool()
+
 
 # Create FastAPI app with our custom router and disable FastAPI's built-in redirects
 app = FastAPI(
@@ -4,8 +4,10 @@ from .api_key import APIKey
 from .chat import Chat, ChatMessage
 from .collection import Collection
 from .connection import Connection
+from .conversion_cache import ConversionCacheEntry
 from .dag import DagEdge, DagNode, SyncDag
 from .destination import Destination
+from .embedding_cache import EmbeddingCacheEntry
 from .embedding_model import EmbeddingModel
 from .entity import Entity
 from .entity_definition import EntityDefinition
@@ -16,6 +18,7 @@ from .source import Source
 from .source_connection import SourceConnection
 from .sync import Sync
 from .sync_connection import SyncConnection
+from .sync_cursor import SyncCursor
 from .sync_job import SyncJob
 from .transformer import Transformer
 from .user import User
@@ -28,9 +31,11 @@ __all__ = [
     "Collection",
     "Entity",
     "Connection",
+    "ConversionCacheEntry",
     "DagNode",
     "DagEdge",
     "Destination",
+    "EmbeddingCacheEntry",
     "EmbeddingModel",
     "EntityDefinition",
     "EntityRelation",
@@ -40,6 +45,7 @@ __all__ = [
     "SourceConnection",
     "Sync",
     "SyncConnection",
+    "SyncCursor",
     "SyncDag",
     "SyncJob",
     "Transformer",
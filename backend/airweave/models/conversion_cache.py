@@ -0,0 +1,18 @@
+"""Conversion cache model."""
+
+from sqlalchemy import Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import Base
+
+
+class ConversionCacheEntry(Base):
+    """Cached markdown of a converted file, addressed by file checksum and converter."""
+
+    __tablename__ = "conversion_cache"
+
+    cache_key: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)
+    text_content: Mapped[str] = mapped_column(Text, nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("ix_conversion_cache_modified_at", "modified_at"),)
@@ -0,0 +1,17 @@
+"""Embedding cache model."""
+
+from sqlalchemy import Index, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import Base
+
+
+class EmbeddingCacheEntry(Base):
+    """Cached embedding vector, addressed by embedding model and text hash."""
+
+    __tablename__ = "embedding_cache"
+
+    cache_key: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    __table_args__ = (Index("ix_embedding_cache_modified_at", "modified_at"),)
@@ -0,0 +1,22 @@
+"""Sync cursor model."""
+
+from uuid import UUID
+
+from sqlalchemy import JSON, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import Base
+
+
+class SyncCursor(Base):
+    """Source position (watermarks, delta tokens) persisted between the jobs of a sync."""
+
+    __tablename__ = "sync_cursor"
+
+    sync_id: Mapped[UUID] = mapped_column(
+        ForeignKey("sync.id", ondelete="CASCADE", name="fk_sync_cursor_sync_id"),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
+    cursor_data: Mapped[dict] = mapped_column(JSON, nullable=False, default={})
@@ -13,6 +13,7 @@ from airweave import crud, schemas
 from airweave.core import credentials
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException, TokenRefreshError
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.core.shared_models import ConnectionStatus
 from airweave.db.unit_of_work import UnitOfWork
@@ -335,7 +336,7 @@ class OAuth2Service:
         oauth2_service_logger.info(f"Making token request to: {url}")
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client_pool.client() as client:
                 oauth2_service_logger.info(f"Sending POST request with data: {payload}")
                 response = await client.post(url, headers=headers, data=payload)
 
@@ -583,7 +584,7 @@ class OAuth2Service:
         )
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client_pool.client() as client:
                 response = await client.post(
                     integration_config.backend_url, headers=headers, data=payload
                 )
@@ -126,7 +126,17 @@ class MondayConfig(SourceConfig):
 class MySQLConfig(SourceConfig):
     """MySQL configuration schema."""
 
-    pass
+    incremental_column: str = Field(
+        default="",
+        title="Incremental Column",
+        description=(
+            "Column that is updated whenever a row changes (e.g. 'updated_at'). Tables with "
+            "this column are synced incrementally: later syncs only read rows changed since "
+            "the previous sync, and deleted rows are found by reading only the primary keys. "
+            "Tables without a primary key are always read completely. "
+            "Leave empty to read all rows on every sync."
+        ),
+    )
 
 
 class NotionConfig(SourceConfig):
@@ -184,7 +194,18 @@ class CTTIConfig(SourceConfig):
 class PostgreSQLConfig(SourceConfig):
     """Postgres configuration schema."""
 
-    pass
+    incremental_column: str = Field(
+        default="",
+        title="Incremental Column",
+        description=(
+            "Column that is updated whenever a row changes (e.g. 'updated_at'). Tables with "
+            "this column are synced incrementally: later syncs only read rows changed since "
+            "the previous sync, and deleted rows are found by reading only the primary keys. "
+            "Tables without a primary key are always read completely. Use "
+            "'xmin' to track changes of every table with the PostgreSQL row version instead. "
+            "Leave empty to read all rows on every sync."
+        ),
+    )
 
 
 class SlackConfig(SourceConfig):
@@ -199,10 +220,20 @@ class SQLServerConfig(SourceConfig):
     pass
 
 
-class SQliteConfig(SourceConfig):
-    """SQlite configuration schema."""
+class SQLiteConfig(SourceConfig):
+    """SQLite configuration schema."""
 
-    pass
+    incremental_column: str = Field(
+        default="",
+        title="Incremental Column",
+        description=(
+            "Column that is updated whenever a row changes (e.g. 'updated_at'). Tables with "
+            "this column are synced incrementally: later syncs only read rows changed since "
+            "the previous sync, and deleted rows are found by reading only the primary keys. "
+            "Tables without a primary key are always read completely. "
+            "Leave empty to read all rows on every sync."
+        ),
+    )
 
 
 class StripeConfig(SourceConfig):
@@ -2,7 +2,7 @@
 
 import json
 from abc import ABC, abstractmethod
-from typing import ClassVar, List
+from typing import ClassVar, List, Optional
 from uuid import UUID
 
 from airweave import schemas
@@ -35,14 +35,24 @@ class BaseDestination(ABC):
         """Bulk insert entities into the destination."""
         pass
 
+    async def flush(self) -> set[str]:
+        """Write any buffered entities and wait until all writes are applied.
+
+        Destinations that write synchronously have nothing to flush.
+
+        Returns:
+            set[str]: Parent entity IDs whose buffered writes failed since the last flush
+        """
+        return set()
+
     @abstractmethod
     async def delete(self, db_entity_id: UUID) -> None:
         """Delete a single entity from the destination."""
         pass
 
     @abstractmethod
-    async def bulk_delete(self, entity_ids: list[str]) -> None:
-        """Bulk delete entities from the destination."""
+    async def bulk_delete(self, entity_ids: list[str], sync_id: UUID) -> None:
+        """Bulk delete entities of a sync from the destination."""
         pass
 
     @abstractmethod
@@ -51,10 +61,26 @@ class BaseDestination(ABC):
         pass
 
     @abstractmethod
-    async def bulk_delete_by_parent_id(self, parent_id: UUID) -> None:
-        """Bulk delete entities from the destination by parent ID and entity ID."""
+    async def bulk_delete_by_parent_id(
+        self, parent_id: str, sync_id: UUID, exclude_ids: Optional[list[UUID]] = None
+    ) -> None:
+        """Bulk delete entities from the destination by parent ID and sync ID.
+
+        Entities whose ID is in `exclude_ids` are kept.
+        """
         pass
 
+    async def bulk_delete_by_parent_ids(
+        self, parent_ids: list[str], sync_id: UUID, exclude_ids: Optional[list[UUID]] = None
+    ) -> None:
+        """Bulk delete the entities of many parents from the destination.
+
+        Entities whose ID is in `exclude_ids` are kept. Destinations that can delete by a
+        filter on many parent IDs override this to use a single request.
+        """
+        for parent_id in parent_ids:
+            await self.bulk_delete_by_parent_id(parent_id, sync_id, exclude_ids=exclude_ids)
+
     @abstractmethod
     async def search(self, query_vector: list[float]) -> None:
         """Search for a sync_id in the destination."""
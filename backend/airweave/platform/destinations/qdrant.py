@@ -1,5 +1,6 @@
 """Qdrant destination implementation."""
 
+import asyncio
 from uuid import UUID
 
 from qdrant_client import AsyncQdrantClient
@@ -13,6 +14,12 @@ from airweave.platform.decorators import destination
 from airweave.platform.destinations._base import VectorDBDestination
 from airweave.platform.entities._base import ChunkEntity
 
+# Payload fields used in delete filters, indexed as keywords in every collection
+PAYLOAD_INDEX_FIELDS = ("sync_id", "entity_id", "parent_entity_id")
+
+# Collections whose payload indexes were verified by this process
+_indexed_collections: set[str] = set()
+
 
 @destination("Qdrant", "qdrant", AuthType.config_class, "QdrantAuthConfig", labels=["Vector"])
 class QdrantDestination(VectorDBDestination):
@@ -31,6 +38,16 @@ class QdrantDestination(VectorDBDestination):
         self.client: AsyncQdrantClient | None = None
         self.vector_size: int = 384  # Default vector size
 
+        # Write buffer: points are uploaded in batches of `write_batch_size` without
+        # waiting for them to be applied, with up to `write_parallelism` uploads in flight
+        self.write_batch_size: int = settings.QDRANT_WRITE_BATCH_SIZE
+        self.write_parallelism: int = settings.QDRANT_WRITE_PARALLELISM
+        self._point_buffer: list[rest.PointStruct] = []
+        self._upload_tasks: set[asyncio.Task] = set()
+        self._upload_semaphore: asyncio.Semaphore | None = None
+        self._failed_entity_ids: set[str] = set()
+        self._last_unconfirmed_point: rest.PointStruct | None = None
+
     @classmethod
     async def create(cls, collection_id: UUID) -> "QdrantDestination":
         """Create a new Qdrant destination.
@@ -58,6 +75,13 @@ class QdrantDestination(VectorDBDestination):
         # Initialize client
         await instance.connect_to_qdrant()
 
+        # Collections created before payload indexes existed get them on first use
+        if instance.collection_name not in _indexed_collections:
+            try:
+                await instance.ensure_payload_indexes()
+            except Exception as e:
+                logger.warning(f"Could not ensure payload indexes for {collection_id}: {e}")
+
         return instance
 
     @classmethod
@@ -82,8 +106,10 @@ class QdrantDestination(VectorDBDestination):
 
                 client_config = {
                     "location": location,
-                    "prefer_grpc": False,  # Use HTTP by default
+                    "prefer_grpc": settings.QDRANT_PREFER_GRPC,  # HTTP unless configured
                 }
+                if settings.QDRANT_PREFER_GRPC:
+                    client_config["grpc_port"] = settings.QDRANT_GRPC_PORT
 
                 if location[-4:] != ":6333":
                     # allow railway to work
@@ -171,6 +197,7 @@ class QdrantDestination(VectorDBDestination):
             # Check if collection exists
             if await self.collection_exists(self.collection_name):
                 logger.info(f"Collection {self.collection_name} already exists.")
+                await self.ensure_payload_indexes()
                 return
 
             logger.info(f"Creating collection {self.collection_name}...")
@@ -188,10 +215,64 @@ class QdrantDestination(VectorDBDestination):
                 on_disk_payload=True,  # Store payload on disk to save memory
             )
 
+            # Index the fields used by delete filters while the collection is still empty
+            await self._create_payload_indexes(list(PAYLOAD_INDEX_FIELDS), wait=True)
+
         except Exception as e:
             if "already exists" not in str(e):
                 raise
 
+    async def ensure_payload_indexes(self) -> None:
+        """Create the payload indexes that are missing from an existing collection.
+
+        Indexes on existing collections are built in the background by Qdrant, so this
+        does not wait for them. Does nothing if the collection does not exist yet.
+        """
+        await self.ensure_client_readiness()
+
+        if not await self.collection_exists(self.collection_name):
+            return
+
+        collection_info = await self.client.get_collection(self.collection_name)
+        indexed_fields = set(collection_info.payload_schema or {})
+        missing_fields = [field for field in PAYLOAD_INDEX_FIELDS if field not in indexed_fields]
+        if missing_fields:
+            logger.info(
+                f"Creating payload indexes {missing_fields} for collection {self.collection_name}"
+            )
+            await self._create_payload_indexes(missing_fields, wait=False)
+
+        _indexed_collections.add(self.collection_name)
+
+    async def _create_payload_indexes(self, field_names: list[str], wait: bool) -> None:
+        """Create keyword payload indexes on the given fields."""
+        for field_name in field_names:
+            await self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=rest.PayloadSchemaType.KEYWORD,
+                wait=wait,
+            )
+        _indexed_collections.add(self.collection_name)
+
+    @staticmethod
+    def _get_payload(entity: ChunkEntity) -> dict:
+        """Get the point payload for an entity.
+
+        `to_storage_dict` strips sync metadata from chunk entities, but the delete
+        operations filter on `sync_id` and `parent_entity_id`, so those are kept.
+
+        Args:
+            entity (ChunkEntity): The entity to build the payload for.
+
+        Returns:
+            dict: The payload to store with the point.
+        """
+        payload = entity.to_storage_dict()
+        payload["sync_id"] = str(entity.sync_id) if entity.sync_id else None
+        payload["parent_entity_id"] = entity.parent_entity_id
+        return payload
+
     async def insert(self, entity: ChunkEntity) -> None:
         """Insert a single entity into Qdrant.
 
@@ -201,7 +282,7 @@ class QdrantDestination(VectorDBDestination):
         await self.ensure_client_readiness()
 
         # Use the entity's to_storage_dict method to get properly serialized data
-        data_object = entity.to_storage_dict()
+        data_object = self._get_payload(entity)
 
         # Use the entity's vector directly
         if not hasattr(entity, "vector") or entity.vector is None:
@@ -222,6 +303,10 @@ class QdrantDestination(VectorDBDestination):
     async def bulk_insert(self, entities: list[ChunkEntity]) -> None:
         """Bulk insert entities into Qdrant.
 
+        Points are added to the write buffer, which is uploaded in batches of
+        `write_batch_size` without waiting for Qdrant to apply them. Call `flush` to
+        upload the remaining points and wait until all writes are applied.
+
         Args:
             entities (list[ChunkEntity]): The entities to insert.
         """
@@ -234,7 +319,7 @@ class QdrantDestination(VectorDBDestination):
         point_structs = []
         for entity in entities:
             # Use the entity's to_storage_dict method to get properly serialized data
-            entity_data = entity.to_storage_dict()
+            entity_data = self._get_payload(entity)
 
             # Use the entity's vector directly
             if not hasattr(entity, "vector") or entity.vector is None:
@@ -254,11 +339,78 @@ class QdrantDestination(VectorDBDestination):
             logger.warning("No valid entities to insert")
             return
 
-        # Bulk upsert
+        self._point_buffer.extend(point_structs)
+        while len(self._point_buffer) >= self.write_batch_size:
+            batch = self._point_buffer[: self.write_batch_size]
+            self._point_buffer = self._point_buffer[self.write_batch_size :]
+            await self._start_upload(batch)
+
+    async def flush(self) -> set[str]:
+        """Upload the buffered points and wait until all writes are applied.
+
+        In-flight uploads are awaited first. The remaining points are then upserted with
+        `wait=True`, which acts as a barrier: Qdrant applies updates in order, so once it
+        returns every earlier non-blocking upsert has been applied too.
+
+        Returns:
+            set[str]: Parent entity IDs of the points whose background upload failed since
+                the last flush
+
+        Raises:
+            Exception: If the barrier upsert fails, as no earlier write is confirmed then
+        """
+        # Uploads started by concurrent bulk inserts while waiting are awaited as well
+        while self._upload_tasks:
+            await asyncio.gather(*self._upload_tasks, return_exceptions=True)
+        failed_entity_ids, self._failed_entity_ids = self._failed_entity_ids, set()
+
+        if self._point_buffer:
+            points, self._point_buffer = self._point_buffer, []
+        elif self._last_unconfirmed_point is not None:
+            # Re-upsert the last uploaded point, which is idempotent, as a barrier
+            points = [self._last_unconfirmed_point]
+        else:
+            return failed_entity_ids
+
+        await self.ensure_client_readiness()
+        await self._upsert_points(points, wait=True)
+        self._last_unconfirmed_point = None
+        return failed_entity_ids
+
+    async def _start_upload(self, points: list[rest.PointStruct]) -> None:
+        """Upload a batch of points in the background, without waiting for it to be applied.
+
+        Waits for a free upload slot if `write_parallelism` uploads are already in flight.
+        """
+        if self._upload_semaphore is None:
+            self._upload_semaphore = asyncio.Semaphore(self.write_parallelism)
+
+        await self._upload_semaphore.acquire()
+        task = asyncio.create_task(self._upload(points))
+        self._upload_tasks.add(task)
+        task.add_done_callback(self._upload_tasks.discard)
+
+    async def _upload(self, points: list[rest.PointStruct]) -> None:
+        """Upload a batch of points and release its upload slot."""
+        try:
+            await self._upsert_points(points, wait=False)
+            self._last_unconfirmed_point = points[-1]
+        except Exception as e:
+            logger.error(f"Error uploading {len(points)} points to Qdrant: {e}")
+            # Reported by the next flush, so only the entities of this upload are retried
+            self._failed_entity_ids.update(
+                point.payload.get("parent_entity_id") or point.payload.get("entity_id")
+                for point in points
+            )
+        finally:
+            self._upload_semaphore.release()
+
+    async def _upsert_points(self, points: list[rest.PointStruct], wait: bool) -> None:
+        """Upsert points into the collection."""
         operation_response = await self.client.upsert(
             collection_name=self.collection_name,
-            points=point_structs,
-            wait=True,  # Wait for operation to complete
+            points=points,
+            wait=wait,
         )
 
         if hasattr(operation_response, "errors") and operation_response.errors:
@@ -325,14 +477,18 @@ class QdrantDestination(VectorDBDestination):
             wait=True,  # Wait for operation to complete
         )
 
-    async def bulk_delete_by_parent_id(self, parent_id: str, sync_id: str) -> None:
+    async def bulk_delete_by_parent_id(
+        self, parent_id: str, sync_id: str, exclude_ids: list[UUID] | None = None
+    ) -> None:
         """Bulk delete entities from Qdrant by parent ID and sync ID.
 
-        This deletes all entities that have the specified parent_entity_id and sync_id.
+        This deletes all entities that have the specified parent_entity_id and sync_id,
+        except the points listed in `exclude_ids`.
 
         Args:
             parent_id (str): The parent ID to delete children for.
             sync_id (str): The sync ID.
+            exclude_ids (list[UUID] | None): IDs of points to keep.
         """
         if not parent_id:
             return
@@ -350,6 +506,8 @@ class QdrantDestination(VectorDBDestination):
                 {"key": "sync_id", "match": {"value": sync_id_str}},
             ]
         }
+        if exclude_ids:
+            filter_condition["must_not"] = [{"has_id": [str(point_id) for point_id in exclude_ids]}]
 
         # Use try-except to handle any filter validation errors
         try:
@@ -369,6 +527,41 @@ class QdrantDestination(VectorDBDestination):
             # Fallback to a different approach if needed
             raise
 
+    async def bulk_delete_by_parent_ids(
+        self, parent_ids: list[str], sync_id: str, exclude_ids: list[UUID] | None = None
+    ) -> None:
+        """Bulk delete the entities of many parents from Qdrant with a single request.
+
+        Args:
+            parent_ids (list[str]): The parent IDs to delete children for.
+            sync_id (str): The sync ID.
+            exclude_ids (list[UUID] | None): IDs of points to keep.
+        """
+        if not parent_ids:
+            return
+
+        await self.ensure_client_readiness()
+
+        qdrant_filter = rest.Filter(
+            must=[
+                rest.FieldCondition(
+                    key="parent_entity_id",
+                    match=rest.MatchAny(any=[str(parent_id) for parent_id in parent_ids]),
+                ),
+                rest.FieldCondition(key="sync_id", match=rest.MatchValue(value=str(sync_id))),
+            ],
+            must_not=(
+                [rest.HasIdCondition(has_id=[str(point_id) for point_id in exclude_ids])]
+                if exclude_ids
+                else None
+            ),
+        )
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=rest.FilterSelector(filter=qdrant_filter),
+            wait=True,
+        )
+
     async def search(self, query_vector: list[float]) -> list[dict]:
         """Search for a sync_id in the destination.
 
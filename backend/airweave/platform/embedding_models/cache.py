@@ -0,0 +1,406 @@
+"""Content-addressed embedding cache.
+
+Vectors are cached by embedding model and the SHA-256 of the embedded text, so unchanged
+chunks of updated entities and boilerplate repeated across entities (signatures, footers,
+templates) are embedded only once.
+"""
+
+import base64
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import PrivateAttr
+
+from airweave import crud
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+from airweave.db.session import get_db_context
+from airweave.platform.sync.pubsub import SyncProgress
+
+from ._base import BaseEmbeddingModel
+
+
+def _pack_vector(vector: List[float]) -> bytes:
+    """Pack a vector into compact float32 bytes."""
+    return array("f", vector).tobytes()
+
+
+def _unpack_vector(data: bytes) -> List[float]:
+    """Unpack float32 bytes into a vector."""
+    vector = array("f")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class EmbeddingCacheBackend(ABC):
+    """Storage backend for cached embedding vectors."""
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Get the cached vectors for the given keys.
+
+        Args:
+            keys: The cache keys to look up
+
+        Returns:
+            A mapping of cache key to vector. Missing or expired keys are absent.
+        """
+        pass
+
+    @abstractmethod
+    async def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """Store vectors in the cache.
+
+        Args:
+            vectors: A mapping of cache key to vector
+        """
+        pass
+
+
+class LRUEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """In-process cache that evicts the least recently used vectors beyond `max_size`.
+
+    Vectors are kept packed as float32 bytes, which takes about 6 KB per 1536-dim vector.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        """Initialize the LRU cache.
+
+        Args:
+            max_size: Maximum number of cached vectors
+            ttl: Optional number of seconds after which a vector expires
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Get the cached vectors for the given keys."""
+        now = time.monotonic()
+        found = {}
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            expires_at, vector = entry
+            if expires_at < now:
+                del self._entries[key]
+                continue
+            self._entries.move_to_end(key)
+            found[key] = _unpack_vector(vector)
+        return found
+
+    async def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """Store vectors in the cache, evicting the least recently used ones if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl else float("inf")
+        for key, vector in vectors.items():
+            self._entries[key] = (expires_at, _pack_vector(vector))
+            self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class RedisEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Cache shared between workers, stored in Redis with a TTL per vector.
+
+    Size based eviction is left to the Redis `maxmemory-policy`. Redis errors are logged
+    and treated as cache misses, so an unavailable Redis never fails a sync.
+    """
+
+    def __init__(self, ttl: Optional[int] = None, prefix: str = "embedding_cache:"):
+        """Initialize the Redis cache.
+
+        Args:
+            ttl: Optional number of seconds after which a vector expires
+            prefix: Prefix for the Redis keys
+        """
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Get the cached vectors for the given keys."""
+        if not keys:
+            return {}
+
+        try:
+            values = await redis_client.client.mget([self.prefix + key for key in keys])
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup in Redis failed: {e}")
+            return {}
+
+        # The client decodes responses, so vectors are stored base64 encoded
+        return {
+            key: _unpack_vector(base64.b64decode(value))
+            for key, value in zip(keys, values, strict=True)
+            if value is not None
+        }
+
+    async def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """Store vectors in the cache."""
+        if not vectors:
+            return
+
+        try:
+            async with redis_client.client.pipeline(transaction=False) as pipe:
+                for key, vector in vectors.items():
+                    value = base64.b64encode(_pack_vector(vector)).decode("ascii")
+                    pipe.set(self.prefix + key, value, ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache write to Redis failed: {e}")
+
+
+class PostgresEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Persistent cache stored in the `embedding_cache` table.
+
+    Expired vectors are ignored on read. After writes, at most once per
+    `EVICTION_INTERVAL` seconds, expired vectors are deleted and the least recently written
+    vectors beyond `max_size` are evicted. Database errors are logged and treated as cache
+    misses.
+    """
+
+    EVICTION_INTERVAL = 60.0
+
+    # Shared by all instances, so concurrent syncs do not each run the eviction
+    _last_eviction: float = float("-inf")
+
+    def __init__(self, max_size: int, ttl: Optional[int] = None):
+        """Initialize the Postgres cache.
+
+        Args:
+            max_size: Maximum number of cached vectors
+            ttl: Optional number of seconds after which a vector expires
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+
+    def _not_before(self) -> Optional[datetime]:
+        """Get the oldest write time of a vector that has not expired yet."""
+        if not self.ttl:
+            return None
+        return datetime.utcnow() - timedelta(seconds=self.ttl)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Get the cached vectors for the given keys."""
+        if not keys:
+            return {}
+
+        try:
+            async with get_db_context() as db:
+                vectors = await crud.embedding_cache.get_vectors(
+                    db, keys, not_before=self._not_before()
+                )
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup in Postgres failed: {e}")
+            return {}
+        return {key: _unpack_vector(data) for key, data in vectors.items()}
+
+    async def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """Store vectors in the cache."""
+        if not vectors:
+            return
+
+        try:
+            async with get_db_context() as db:
+                await crud.embedding_cache.upsert_vectors(
+                    db, vectors={key: _pack_vector(vector) for key, vector in vectors.items()}
+                )
+                await self._evict(db)
+        except Exception as e:
+            logger.warning(f"Embedding cache write to Postgres failed: {e}")
+
+    async def _evict(self, db) -> None:
+        """Delete expired vectors and bound the table, unless that was done recently."""
+        now = time.monotonic()
+        if now - PostgresEmbeddingCacheBackend._last_eviction < self.EVICTION_INTERVAL:
+            return
+        PostgresEmbeddingCacheBackend._last_eviction = now
+
+        not_before = self._not_before()
+        if not_before is not None:
+            await crud.embedding_cache.remove_expired(db, before=not_before)
+        await crud.embedding_cache.evict_to_count(db, max_count=self.max_size)
+
+
+class CachedEmbeddingModel(BaseEmbeddingModel):
+    """Embedding model wrapper that only embeds texts missing from the cache.
+
+    Cache keys combine the model name, its vector dimensions and the SHA-256 of the text.
+    The number of cache hits and misses is tracked in `hits` and `misses`, and added to the
+    progress of the sync (if given) as `embedding_cache_hits` and `embedding_cache_misses`.
+    All-zero vectors, which models return for texts they failed to embed, are not cached.
+    """
+
+    inner_model: BaseEmbeddingModel
+    backend: EmbeddingCacheBackend
+    hits: int = 0
+    misses: int = 0
+
+    _key_prefix: str = PrivateAttr(default="")
+    _progress: Optional[SyncProgress] = PrivateAttr(default=None)
+
+    class Config:
+        """Pydantic config."""
+
+        arbitrary_types_allowed = True
+
+    def __init__(
+        self,
+        inner_model: BaseEmbeddingModel,
+        backend: EmbeddingCacheBackend,
+        progress: Optional[SyncProgress] = None,
+    ):
+        """Initialize the cache around an embedding model.
+
+        Args:
+            inner_model: The embedding model used for cache misses
+            backend: The storage backend for cached vectors
+            progress: Optional progress of the sync to report cache hits and misses to
+        """
+        super().__init__(
+            inner_model=inner_model,
+            backend=backend,
+            model_name=inner_model.model_name,
+            vector_dimensions=inner_model.vector_dimensions,
+            enabled=inner_model.enabled,
+        )
+        self._key_prefix = f"{inner_model.model_name}:{inner_model.vector_dimensions}:"
+        self._progress = progress
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked up texts that were served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _cache_key(self, text: str) -> str:
+        """Get the cache key of a text."""
+        return self._key_prefix + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def embed(
+        self,
+        text: str,
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[float]:
+        """Embed a single text string, using the cached vector if available.
+
+        Args:
+            text: The text to embed
+            model: Optional specific model to use (bypasses the cache)
+            encoding_format: Format of the embedding (non-default values bypass the cache)
+            dimensions: Vector dimensions (bypasses the cache)
+
+        Returns:
+            List of embedding values
+        """
+        if model or dimensions or encoding_format != "float":
+            return await self.inner_model.embed(text, model, encoding_format, dimensions)
+
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Embed multiple text strings, only sending cache misses to the wrapped model.
+
+        Args:
+            texts: List of texts to embed
+            model: Optional specific model to use (bypasses the cache)
+            encoding_format: Format of the embedding (non-default values bypass the cache)
+            dimensions: Vector dimensions (bypasses the cache)
+
+        Returns:
+            List of embedding vectors, in the same order as `texts`
+        """
+        if model or dimensions or encoding_format != "float":
+            return await self.inner_model.embed_many(texts, model, encoding_format, dimensions)
+
+        if not texts:
+            return []
+
+        keys = [self._cache_key(text) for text in texts]
+        vectors = await self.backend.get_many(list(dict.fromkeys(keys)))
+
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in vectors}
+        await self._count(hits=len(texts) - len(missing), misses=len(missing))
+
+        if missing:
+            new_vectors = dict(
+                zip(
+                    missing.keys(),
+                    await self.inner_model.embed_many(list(missing.values())),
+                    strict=True,
+                )
+            )
+            # Zero vectors are fallbacks for failed texts, which must be embedded again
+            await self.backend.set_many(
+                {key: vector for key, vector in new_vectors.items() if any(vector)}
+            )
+            vectors.update(new_vectors)
+
+        logger.info(
+            f"Embedding cache served {len(texts) - len(missing)}/{len(texts)} texts "
+            f"(hit rate {self.hit_rate:.1%})"
+        )
+        return [vectors[key] for key in keys]
+
+    async def _count(self, hits: int, misses: int) -> None:
+        """Count cache hits and misses, also in the progress of the sync."""
+        self.hits += hits
+        self.misses += misses
+        if self._progress is not None:
+            if hits:
+                await self._progress.increment("embedding_cache_hits", hits)
+            if misses:
+                await self._progress.increment("embedding_cache_misses", misses)
+
+    async def close(self) -> None:
+        """Close the wrapped model."""
+        close = getattr(self.inner_model, "close", None)
+        if close is not None:
+            await close()
+
+
+_lru_backend: Optional[LRUEmbeddingCacheBackend] = None
+
+
+def get_embedding_cache_backend() -> Optional[EmbeddingCacheBackend]:
+    """Get the embedding cache backend configured in the settings.
+
+    The in-process LRU backend is shared by all syncs running in this process.
+
+    Returns:
+        The configured backend, or None if embedding caching is disabled.
+    """
+    global _lru_backend
+
+    backend = settings.EMBEDDING_CACHE_BACKEND
+    ttl = settings.EMBEDDING_CACHE_TTL_SECONDS or None
+
+    if backend == "lru":
+        if _lru_backend is None:
+            _lru_backend = LRUEmbeddingCacheBackend(
+                max_size=settings.EMBEDDING_CACHE_MAX_SIZE, ttl=ttl
+            )
+        return _lru_backend
+    if backend == "redis":
+        return RedisEmbeddingCacheBackend(ttl=ttl)
+    if backend == "postgres":
+        return PostgresEmbeddingCacheBackend(max_size=settings.EMBEDDING_CACHE_MAX_ROWS, ttl=ttl)
+    if backend == "none":
+        return None
+
+    raise ValueError(f"Unknown embedding cache backend: {backend}")
@@ -0,0 +1,190 @@
+"""Embedding request coalescer.
+
+Sync workers embed the chunks of a single entity at a time, which results in many tiny
+embedding requests. The coalescer sits in front of an embedding model, buffers the texts of
+concurrent callers and sends them to the wrapped model as one batched request.
+"""
+
+import asyncio
+from typing import List, Optional, Set, Tuple
+
+from pydantic import PrivateAttr
+
+from airweave.core.logging import logger
+
+from ._base import BaseEmbeddingModel
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheaply estimate the number of tokens in a text (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class EmbeddingCoalescer(BaseEmbeddingModel):
+    """Embedding model wrapper that merges concurrent requests into batched calls.
+
+    Texts are buffered until the batch holds `max_batch_size` texts, would exceed
+    `max_batch_tokens` estimated tokens, or `max_wait` seconds have passed since the first
+    text was buffered. The batch is then embedded with a single call to the wrapped model
+    and each caller receives the vectors for its own texts, in order.
+
+    Requests that override the model, encoding format or dimensions bypass the buffer.
+    """
+
+    inner_model: BaseEmbeddingModel
+    max_batch_size: int = 256
+    max_batch_tokens: int = 200_000
+    max_wait: float = 0.05
+
+    _pending: List[Tuple[str, asyncio.Future]] = PrivateAttr(default_factory=list)
+    _pending_tokens: int = PrivateAttr(default=0)
+    _flush_timer: Optional[asyncio.TimerHandle] = PrivateAttr(default=None)
+    _flush_tasks: Set[asyncio.Task] = PrivateAttr(default_factory=set)
+
+    class Config:
+        """Pydantic config."""
+
+        arbitrary_types_allowed = True
+
+    def __init__(self, inner_model: BaseEmbeddingModel, **kwargs):
+        """Initialize the coalescer around an embedding model.
+
+        Args:
+            inner_model: The embedding model that performs the actual requests
+            **kwargs: Optional batching limits (max_batch_size, max_batch_tokens, max_wait)
+        """
+        super().__init__(
+            inner_model=inner_model,
+            model_name=inner_model.model_name,
+            vector_dimensions=inner_model.vector_dimensions,
+            enabled=inner_model.enabled,
+            **kwargs,
+        )
+
+    async def embed(
+        self,
+        text: str,
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[float]:
+        """Embed a single text string as part of the next batch.
+
+        Args:
+            text: The text to embed
+            model: Optional specific model to use (bypasses batching)
+            encoding_format: Format of the embedding (non-default values bypass batching)
+            dimensions: Vector dimensions (bypasses batching)
+
+        Returns:
+            List of embedding values
+        """
+        if model or dimensions or encoding_format != "float":
+            return await self.inner_model.embed(text, model, encoding_format, dimensions)
+
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Embed multiple text strings as part of the next batch(es).
+
+        Args:
+            texts: List of texts to embed
+            model: Optional specific model to use (bypasses batching)
+            encoding_format: Format of the embedding (non-default values bypass batching)
+            dimensions: Vector dimensions (bypasses batching)
+
+        Returns:
+            List of embedding vectors, in the same order as `texts`
+        """
+        if model or dimensions or encoding_format != "float":
+            return await self.inner_model.embed_many(texts, model, encoding_format, dimensions)
+
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            tokens = _estimate_tokens(text)
+            if self._pending and self._pending_tokens + tokens > self.max_batch_tokens:
+                self._flush()
+
+            future = loop.create_future()
+            self._pending.append((text, future))
+            self._pending_tokens += tokens
+            futures.append(future)
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+
+        if self._pending and self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.max_wait, self._flush)
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _flush(self) -> None:
+        """Send the buffered texts to the wrapped model in a background task."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending, self._pending_tokens = self._pending, [], 0
+        task = asyncio.create_task(self._send_batch(batch))
+        # Keep a reference so the task is not garbage collected while running
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed a batch with one call and resolve each caller's future.
+
+        Identical texts within the batch are only sent once.
+        """
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        logger.info(
+            f"Flushing coalesced embedding batch of {len(batch)} texts ({len(unique_texts)} unique)"
+        )
+
+        try:
+            vectors = await self.inner_model.embed_many(unique_texts)
+            if len(vectors) != len(unique_texts):
+                raise ValueError(
+                    f"Embedding model returned {len(vectors)} vectors for {len(unique_texts)} texts"
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        vectors_by_text = dict(zip(unique_texts, vectors, strict=True))
+        for text, future in batch:
+            # Callers that were cancelled while waiting no longer need a result
+            if not future.done():
+                future.set_result(vectors_by_text[text])
+
+    async def close(self) -> None:
+        """Flush any buffered texts, wait for in-flight batches and close the wrapped model."""
+        self._flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+        close = getattr(self.inner_model, "close", None)
+        if close is not None:
+            await close()
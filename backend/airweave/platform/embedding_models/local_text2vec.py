@@ -1,9 +1,10 @@
 """Local text2vec model for embedding."""
 
+import asyncio
 from typing import List, Optional
 
 import httpx
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from airweave.core.config import settings
 from airweave.core.logging import logger
@@ -26,16 +27,41 @@ class LocalText2Vec(BaseEmbeddingModel):
     inference_url: str = Field(default="", description="URL of the inference API")
     vector_dimensions: int = 384  # MiniLM-L6-v2 dimensions
     enabled: bool = True
+    max_concurrency: int = Field(default=8, description="Max concurrent inference requests")
+    batch_size: int = Field(default=32, description="Max texts per batch request")
+    batch_endpoint: Optional[str] = Field(
+        default=None, description="Path of a batch endpoint, if the inference API has one"
+    )
+
+    _client: Optional[httpx.AsyncClient] = PrivateAttr(default=None)
+    _semaphore: Optional[asyncio.Semaphore] = PrivateAttr(default=None)
 
     def model_post_init(self, __context) -> None:
-        """Post initialization hook to set the inference URL from settings.
+        """Post initialization hook to set the inference URL and limits from settings.
 
         This runs after Pydantic validation but before the model is used.
         """
         super().model_post_init(__context)
         self.inference_url = settings.TEXT2VEC_INFERENCE_URL
+        self.max_concurrency = settings.TEXT2VEC_MAX_CONCURRENCY
+        self.batch_size = settings.TEXT2VEC_BATCH_SIZE
+        self.batch_endpoint = settings.TEXT2VEC_BATCH_ENDPOINT
         logger.info(f"Text2Vec model using inference URL: {self.inference_url}")
 
+    async def get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client for inference API calls."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_concurrency,
+                    max_connections=self.max_concurrency,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(60.0),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
     async def embed(
         self,
         text: str,
@@ -64,10 +90,47 @@ class LocalText2Vec(BaseEmbeddingModel):
             # Return zero vector for empty text
             return [0.0] * self.vector_dimensions
 
-        async with httpx.AsyncClient() as client:
+        client = await self.get_client()
+        async with self._semaphore:
             response = await client.post(f"{self.inference_url}/vectors", json={"text": text})
+        response.raise_for_status()
+        return response.json()["vector"]
+
+    async def _embed_one(self, client: httpx.AsyncClient, text: str) -> List[float]:
+        """Embed a single non-empty text, falling back to a zero vector on failure."""
+        try:
+            async with self._semaphore:
+                response = await client.post(f"{self.inference_url}/vectors/", json={"text": text})
             response.raise_for_status()
             return response.json()["vector"]
+        except Exception as e:
+            logger.error(f"Error embedding text: {e}")
+            # Return zero vector for failed embedding
+            return [0.0] * self.vector_dimensions
+
+    async def _embed_batch(self, client: httpx.AsyncClient, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of non-empty texts.
+
+        Uses a single request to the batch endpoint if one is configured. If there is none,
+        or the batch request fails, every text is embedded with its own request instead.
+        """
+        if self.batch_endpoint and len(texts) > 1:
+            try:
+                async with self._semaphore:
+                    response = await client.post(
+                        f"{self.inference_url}{self.batch_endpoint}", json={"texts": texts}
+                    )
+                response.raise_for_status()
+                vectors = response.json()["vectors"]
+                if len(vectors) == len(texts):
+                    return vectors
+                logger.error(
+                    f"Batch endpoint returned {len(vectors)} vectors for {len(texts)} texts"
+                )
+            except Exception as e:
+                logger.error(f"Error embedding batch, retrying texts individually: {e}")
+
+        return await asyncio.gather(*(self._embed_one(client, text) for text in texts))
 
     async def embed_many(
         self,
@@ -78,6 +141,10 @@ class LocalText2Vec(BaseEmbeddingModel):
     ) -> List[List[float]]:
         """Embed multiple text strings using the local text2vec model.
 
+        Non-empty texts are sent in batches of `batch_size`, running at most
+        `max_concurrency` requests at a time. Empty texts and texts that fail to embed get
+        a zero vector.
+
         Args:
             texts: List of texts to embed
             model: Optional model override (defaults to self.model_name)
@@ -85,7 +152,7 @@ class LocalText2Vec(BaseEmbeddingModel):
             dimensions: Vector dimensions (defaults to self.vector_dimensions)
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in the same order as `texts`
         """
         if not texts:
             return []
@@ -96,25 +163,29 @@ class LocalText2Vec(BaseEmbeddingModel):
         if dimensions:
             raise ValueError("Dimensions override not supported for local text2vec")
 
-        # Create result list with same order as input
-        result = []
-
-        # Process each text individually since batch endpoint isn't available
-        async with httpx.AsyncClient() as client:
-            for text in texts:
-                if text.strip():
-                    try:
-                        response = await client.post(
-                            f"{self.inference_url}/vectors/", json={"text": text}
-                        )
-                        response.raise_for_status()
-                        result.append(response.json()["vector"])
-                    except Exception as e:
-                        logger.error(f"Error embedding text: {e}")
-                        # Return zero vector for failed embedding
-                        result.append([0.0] * self.vector_dimensions)
-                else:
-                    # Return zero vector for empty text
-                    result.append([0.0] * self.vector_dimensions)
+        # Return zero vector for empty text
+        result = [[0.0] * self.vector_dimensions for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        if not indices:
+            return result
+
+        client = await self.get_client()
+        batches = [
+            indices[start : start + self.batch_size]
+            for start in range(0, len(indices), self.batch_size)
+        ]
+        batch_vectors = await asyncio.gather(
+            *(self._embed_batch(client, [texts[i] for i in batch]) for batch in batches)
+        )
+
+        for batch, vectors in zip(batches, batch_vectors, strict=True):
+            for i, vector in zip(batch, vectors, strict=True):
+                result[i] = vector
 
         return result
+
+    async def close(self):
+        """Clean up the client when done."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
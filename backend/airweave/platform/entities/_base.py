@@ -7,10 +7,19 @@ import os
 import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, Field, PrivateAttr, create_model
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 of a file, reading it in chunks to keep memory use constant."""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
 
 
 class DestinationAction(str, Enum):
@@ -292,24 +301,64 @@ class FileEntity(BaseEntity):
     checksum: Optional[str] = Field(None, description="File checksum/hash if available")
     total_size: Optional[int] = Field(None, description="Total size of the file in bytes")
 
+    # Download deferred by the source until the sync knows the file changed
+    _download: Optional[Callable[[], Awaitable[Optional["FileEntity"]]]] = PrivateAttr(None)
+
+    def get_version_token(self) -> Optional[str]:
+        """Get a token from the source that changes whenever the file content changes.
+
+        Sources whose API reports such a token, like a content hash or an eTag, override this
+        so unchanged files are recognized without downloading them.
+        """
+        return None
+
+    def defer_download(self, download: Callable[[], Awaitable[Optional["FileEntity"]]]) -> None:
+        """Set the download to run once the sync has determined the file changed.
+
+        Args:
+            download: Downloads the file and returns the entity, or None if it failed
+        """
+        self._download = download
+
+    @property
+    def download_pending(self) -> bool:
+        """Whether the file still has to be downloaded before it can be processed."""
+        return self._download is not None
+
+    async def download(self) -> Optional["FileEntity"]:
+        """Run the deferred download, if any.
+
+        Returns:
+            The downloaded entity, or None if the download failed
+        """
+        download, self._download = self._download, None
+        if download is None:
+            return self
+        return await download()
+
     def hash(self) -> str:
         """Hash the file entity.
 
-        For files, we try the following strategies in order:
-        1. If local_path is available, compute hash from actual file contents
-        2. If checksum is available, use it as part of metadata hash
-        3. Fall back to parent hash method using all metadata
+        Files with a version token are hashed by the token, so they do not have to be
+        downloaded. Otherwise the hash is the SHA-256 of the downloaded file contents, which
+        the file manager computes while downloading and stores as `checksum`.
         """
         if getattr(self, "_hash", None):
             return self._hash
 
+        version_token = self.get_version_token()
+        if version_token:
+            self._hash = hashlib.sha256(f"version:{version_token}".encode()).hexdigest()
+            return self._hash
+
         if self.local_path:
-            # If we have the actual file, compute hash from its contents
+            # The checksum of a downloaded file is the SHA-256 of its contents
+            if self.checksum:
+                self._hash = self.checksum
+                return self._hash
             try:
-                with open(self.local_path, "rb") as f:
-                    content = f.read()
-                    self._hash = hashlib.sha256(content).hexdigest()
-                    return self._hash
+                self._hash = file_sha256(self.local_path)
+                return self._hash
             except Exception:
                 # If file read fails, fall through to next method
                 pass
@@ -146,3 +146,7 @@ class DropboxFileEntity(FileEntity):
     has_explicit_shared_members: Optional[bool] = Field(
         None, description="Whether file has explicit shared members"
     )
+
+    def get_version_token(self) -> Optional[str]:
+        """Get the Dropbox content hash."""
+        return self.content_hash
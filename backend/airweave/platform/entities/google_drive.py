@@ -81,6 +81,12 @@ class GoogleDriveFileEntity(FileEntity):
         None, description="MD5 checksum for the content of the file."
     )
 
+    def get_version_token(self) -> Optional[str]:
+        """Get the MD5 checksum, or the modification time of Google Docs without one."""
+        if self.md5_checksum:
+            return self.md5_checksum
+        return self.modified_time.isoformat() if self.modified_time else None
+
     def model_dump(self, *args, **kwargs) -> dict[str, Any]:
         """Override model_dump to convert size to string."""
         data = super().model_dump(*args, **kwargs)
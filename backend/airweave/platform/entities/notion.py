@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
-from airweave.platform.entities._base import ChunkEntity, FileEntity
+from airweave.platform.entities._base import ChunkEntity, FileEntity, file_sha256
 
 
 class NotionDatabaseEntity(ChunkEntity):
@@ -106,14 +106,10 @@ class NotionFileEntity(FileEntity):
             return self._hash
 
         if hasattr(self, "local_path") and self.local_path:
-            # If we have the actual file, compute hash from its contents
+            # If we have the actual file, use the checksum of its contents
             try:
-                import hashlib
-
-                with open(self.local_path, "rb") as f:
-                    content = f.read()
-                    self._hash = hashlib.sha256(content).hexdigest()
-                    return self._hash
+                self._hash = self.checksum or file_sha256(self.local_path)
+                return self._hash
             except Exception:
                 # If file read fails, fall through to next method
                 pass
@@ -107,3 +107,7 @@ class OneDriveDriveItemEntity(FileEntity):
             data["metadata"]["mimeType"] = data["file"]["mimeType"]
 
         super().__init__(**data)
+
+    def get_version_token(self) -> Optional[str]:
+        """Get the cTag, which only changes with the content, or the eTag without one."""
+        return self.ctag or self.etag
@@ -1,7 +1,7 @@
 """Base classes and interfaces for document conversion."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Set, Union
+from typing import Any, ClassVar, Dict, Optional, Set, Union
 
 
 class DocumentConverterResult:
@@ -20,7 +20,8 @@ class DocumentConverterResult:
             title: The document title if available
             text_content: The extracted text content in markdown format
             file_path: The path to the original file
-            metadata: Additional metadata extracted from the document
+            metadata: Additional metadata extracted from the document,
+                `cacheable` is False for degraded results that must not be cached
         """
         self.title: Optional[str] = title
         self.text_content: str = text_content
@@ -31,6 +32,14 @@ class DocumentConverterResult:
 class DocumentConverter(ABC):
     """Abstract base class for all document converters."""
 
+    # Bump when the output of the converter changes, so cached conversions are not reused
+    VERSION: ClassVar[str] = "1"
+
+    @property
+    def cache_version(self) -> str:
+        """Version of the output of this converter, part of the conversion cache key."""
+        return self.VERSION
+
     @abstractmethod
     async def convert(self, local_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
         """Convert a document to markdown text.
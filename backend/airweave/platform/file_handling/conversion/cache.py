@@ -0,0 +1,211 @@
+"""Content-addressed cache of document conversions.
+
+Converted markdown is cached by the SHA-256 of the file and the converter name and version,
+so byte-identical files are converted (and OCR'd or described by an LLM) only once, even
+when they reappear under another ID or in another collection.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import aiofiles
+
+from airweave import crud
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.db.session import get_db_context
+from airweave.platform.file_handling.conversion._base import DocumentConverter
+
+
+def conversion_cache_key(checksum: str, converter: DocumentConverter) -> str:
+    """Get the cache key of a file converted by a converter.
+
+    Args:
+        checksum: The SHA-256 of the file contents
+        converter: The converter that converts the file
+
+    Returns:
+        A key that changes with the file contents, the converter and its version
+    """
+    return f"{type(converter).__name__}:{converter.cache_version}:{checksum}"
+
+
+class ConversionCacheBackend(ABC):
+    """Storage backend for converted markdown."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Get the cached markdown of a key.
+
+        Args:
+            key: The cache key to look up
+
+        Returns:
+            The markdown, or None if it is not cached
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, text_content: str) -> None:
+        """Store markdown in the cache, evicting the least recently used entries if full.
+
+        Args:
+            key: The cache key
+            text_content: The converted markdown
+        """
+        pass
+
+
+class DiskConversionCacheBackend(ConversionCacheBackend):
+    """Cache stored as files in a local directory, bounded by their total size.
+
+    Reading an entry refreshes its modification time, and at most once every
+    `EVICTION_INTERVAL` seconds the entries that were used least recently are deleted until
+    the directory fits in `max_size` bytes. Disk errors are logged and treated as cache misses.
+    """
+
+    EVICTION_INTERVAL = 60.0
+
+    # Shared by all instances, so concurrent writes do not each scan the directory
+    _last_eviction: float = float("-inf")
+
+    def __init__(self, directory: str, max_size: int):
+        """Initialize the disk cache.
+
+        Args:
+            directory: Directory to store the cached markdown in
+            max_size: Maximum total size of the cached markdown in bytes
+        """
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Get the file path of a cache key."""
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get the cached markdown of a key."""
+        path = self._path(key)
+        try:
+            async with aiofiles.open(path, "r", encoding="utf-8") as f:
+                text_content = await f.read()
+            os.utime(path)
+            return text_content
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Conversion cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, text_content: str) -> None:
+        """Store markdown in the cache, evicting the least recently used entries if full."""
+        path = self._path(key)
+        # Unique per write, since coroutines of the same process may store the same key
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            async with aiofiles.open(temp_path, "w", encoding="utf-8") as f:
+                await f.write(text_content)
+            # Rename atomically, so readers never see a partial entry
+            os.replace(temp_path, path)
+            await self._maybe_evict()
+        except Exception as e:
+            logger.warning(f"Conversion cache write failed: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    async def _maybe_evict(self) -> None:
+        """Bound the cache in a thread, unless that was done recently."""
+        now = time.monotonic()
+        if now - DiskConversionCacheBackend._last_eviction < self.EVICTION_INTERVAL:
+            return
+        DiskConversionCacheBackend._last_eviction = now
+        await asyncio.to_thread(self._evict)
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in `max_size`."""
+        entries = []
+        total_size = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+class PostgresConversionCacheBackend(ConversionCacheBackend):
+    """Persistent cache shared by all workers, stored in the `conversion_cache` table.
+
+    The least recently used entries are deleted once the cached markdown exceeds `max_size`
+    bytes. Database errors are logged and treated as cache misses.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize the Postgres cache.
+
+        Args:
+            max_size: Maximum total size of the cached markdown in bytes
+        """
+        self.max_size = max_size
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get the cached markdown of a key."""
+        try:
+            async with get_db_context() as db:
+                return await crud.conversion_cache.get_text(db, key)
+        except Exception as e:
+            logger.warning(f"Conversion cache lookup in Postgres failed: {e}")
+            return None
+
+    async def set(self, key: str, text_content: str) -> None:
+        """Store markdown in the cache, evicting the least recently used entries if full."""
+        try:
+            async with get_db_context() as db:
+                await crud.conversion_cache.upsert_text(
+                    db, cache_key=key, text_content=text_content
+                )
+                await crud.conversion_cache.evict_to_size(db, max_size=self.max_size)
+        except Exception as e:
+            logger.warning(f"Conversion cache write to Postgres failed: {e}")
+
+
+_disk_backend: Optional[DiskConversionCacheBackend] = None
+
+
+def get_conversion_cache_backend() -> Optional[ConversionCacheBackend]:
+    """Get the conversion cache backend configured in the settings.
+
+    Returns:
+        The configured backend, or None if conversion caching is disabled.
+    """
+    global _disk_backend
+
+    backend = settings.CONVERSION_CACHE_BACKEND
+    max_size = settings.CONVERSION_CACHE_MAX_BYTES
+
+    if backend == "disk":
+        if _disk_backend is None:
+            _disk_backend = DiskConversionCacheBackend(settings.CONVERSION_CACHE_DIR, max_size)
+        return _disk_backend
+    if backend == "postgres":
+        return PostgresConversionCacheBackend(max_size)
+    if backend == "none":
+        return None
+
+    raise ValueError(f"Unknown conversion cache backend: {backend}")
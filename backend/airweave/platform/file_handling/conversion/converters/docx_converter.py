@@ -10,6 +10,95 @@ from airweave.platform.file_handling.conversion._base import (
     DocumentConverter,
     DocumentConverterResult,
 )
+from airweave.platform.utils.process_pool import run_in_process
+
+
+def _python_docx_to_markdown(local_path: str) -> Tuple[str, Optional[str]]:
+    """Convert DOCX using python-docx library.
+
+    Args:
+        local_path: Path to the DOCX file
+
+    Returns:
+        Tuple of (markdown_content, title)
+    """
+    import docx
+
+    md_content = ""
+    title = None
+
+    doc = docx.Document(local_path)
+
+    # Try to extract title from core properties
+    if doc.core_properties.title:
+        title = doc.core_properties.title
+
+    # Process paragraphs
+    for para in doc.paragraphs:
+        if para.text:
+            # Check if it's a heading
+            if para.style.name.startswith("Heading"):
+                level = (
+                    int(para.style.name.replace("Heading", ""))
+                    if para.style.name != "Heading"
+                    else 1
+                )
+                md_content += f"\n{'#' * level} {para.text}\n"
+            else:
+                md_content += f"{para.text}\n\n"
+
+    # Process tables
+    for table in doc.tables:
+        md_table = []
+        # Add header row
+        header_row = []
+        for cell in table.rows[0].cells:
+            header_row.append(cell.text.strip())
+        md_table.append("| " + " | ".join(header_row) + " |")
+        md_table.append("|" + "|".join(["---" for _ in header_row]) + "|")
+
+        # Add data rows
+        for row in table.rows[1:]:
+            cells = [cell.text.strip() for cell in row.cells]
+            md_table.append("| " + " | ".join(cells) + " |")
+
+        md_content += "\n" + "\n".join(md_table) + "\n\n"
+
+    return md_content, title
+
+
+def _mammoth_to_markdown(local_path: str) -> str:
+    """Convert DOCX using mammoth library.
+
+    Args:
+        local_path: Path to the DOCX file
+
+    Returns:
+        Markdown content
+    """
+    import mammoth
+
+    with open(local_path, "rb") as docx_file:
+        result = mammoth.convert_to_markdown(docx_file)
+        return result.value
+
+
+def _pandoc_to_markdown(local_path: str) -> str:
+    """Convert DOCX file to markdown using pandoc.
+
+    Args:
+        local_path: Path to the DOCX file
+
+    Returns:
+        Markdown content
+    """
+    if not shutil.which("pandoc"):
+        raise RuntimeError("Pandoc is not installed")
+
+    with tempfile.NamedTemporaryFile(suffix=".md") as temp_file:
+        subprocess.run(["pandoc", local_path, "-o", temp_file.name], check=True)
+        with open(temp_file.name, "r") as f:
+            return f.read()
 
 
 class DocxConverter(DocumentConverter):
@@ -31,12 +120,15 @@ class DocxConverter(DocumentConverter):
 
         md_content = ""
         title = None
+        # Results of the fallback libraries differ, so only python-docx output is cached
+        cacheable = True
 
         try:
             # Try using python-docx first
             try:
                 md_content, title = await self._convert_with_python_docx(local_path)
             except ImportError:
+                cacheable = False
                 # Fall back to mammoth if python-docx is not available
                 try:
                     md_content = await self._convert_with_mammoth(local_path)
@@ -51,15 +143,18 @@ class DocxConverter(DocumentConverter):
                             text_content=(
                                 "DOCX conversion requires python-docx, mammoth, or pandoc."
                             ),
+                            metadata={"cacheable": False},
                         )
         except Exception as e:
             logger.error(f"Error converting DOCX: {str(e)}")
             return None
 
-        return DocumentConverterResult(title=title, text_content=md_content.strip())
+        return DocumentConverterResult(
+            title=title, text_content=md_content.strip(), metadata={"cacheable": cacheable}
+        )
 
     async def _convert_with_python_docx(self, local_path: str) -> Tuple[str, Optional[str]]:
-        """Convert DOCX using python-docx library.
+        """Convert DOCX using python-docx library in the process pool.
 
         Args:
             local_path: Path to the DOCX file
@@ -67,52 +162,10 @@ class DocxConverter(DocumentConverter):
         Returns:
             Tuple of (markdown_content, title)
         """
-        import docx
-
-        md_content = ""
-        title = None
-
-        doc = docx.Document(local_path)
-
-        # Try to extract title from core properties
-        if doc.core_properties.title:
-            title = doc.core_properties.title
-
-        # Process paragraphs
-        for para in doc.paragraphs:
-            if para.text:
-                # Check if it's a heading
-                if para.style.name.startswith("Heading"):
-                    level = (
-                        int(para.style.name.replace("Heading", ""))
-                        if para.style.name != "Heading"
-                        else 1
-                    )
-                    md_content += f"\n{'#' * level} {para.text}\n"
-                else:
-                    md_content += f"{para.text}\n\n"
-
-        # Process tables
-        for table in doc.tables:
-            md_table = []
-            # Add header row
-            header_row = []
-            for cell in table.rows[0].cells:
-                header_row.append(cell.text.strip())
-            md_table.append("| " + " | ".join(header_row) + " |")
-            md_table.append("|" + "|".join(["---" for _ in header_row]) + "|")
-
-            # Add data rows
-            for row in table.rows[1:]:
-                cells = [cell.text.strip() for cell in row.cells]
-                md_table.append("| " + " | ".join(cells) + " |")
-
-            md_content += "\n" + "\n".join(md_table) + "\n\n"
-
-        return md_content, title
+        return await run_in_process(_python_docx_to_markdown, local_path)
 
     async def _convert_with_mammoth(self, local_path: str) -> str:
-        """Convert DOCX using mammoth library.
+        """Convert DOCX using mammoth library in the process pool.
 
         Args:
             local_path: Path to the DOCX file
@@ -120,14 +173,10 @@ class DocxConverter(DocumentConverter):
         Returns:
             Markdown content
         """
-        import mammoth
-
-        with open(local_path, "rb") as docx_file:
-            result = mammoth.convert_to_markdown(docx_file)
-            return result.value
+        return await run_in_process(_mammoth_to_markdown, local_path)
 
     async def _convert_with_pandoc(self, local_path: str) -> str:
-        """Convert DOCX file to markdown using pandoc.
+        """Convert DOCX file to markdown using pandoc in the process pool.
 
         Args:
             local_path: Path to the DOCX file
@@ -135,10 +184,4 @@ class DocxConverter(DocumentConverter):
         Returns:
             Markdown content
         """
-        if not shutil.which("pandoc"):
-            raise RuntimeError("Pandoc is not installed")
-
-        with tempfile.NamedTemporaryFile(suffix=".md") as temp_file:
-            subprocess.run(["pandoc", local_path, "-o", temp_file.name], check=True)
-            with open(temp_file.name, "r") as f:
-                return f.read()
+        return await run_in_process(_pandoc_to_markdown, local_path)
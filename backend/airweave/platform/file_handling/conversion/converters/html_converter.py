@@ -32,6 +32,8 @@ class HtmlConverter(DocumentConverter):
 
         md_content = ""
         title = None
+        # Results of the fallback tools differ, so only html2text output is cached
+        cacheable = True
 
         try:
             # Try using html2text
@@ -56,6 +58,7 @@ class HtmlConverter(DocumentConverter):
 
         except ImportError:
             # Fall back to pandoc if html2text is not available
+            cacheable = False
             try:
                 if shutil.which("pandoc"):
                     with tempfile.NamedTemporaryFile(suffix=".md") as temp_file:
@@ -94,9 +97,12 @@ class HtmlConverter(DocumentConverter):
                             text_content=(
                                 "HTML conversion requires html2text, pandoc, or BeautifulSoup."
                             ),
+                            metadata={"cacheable": False},
                         )
             except Exception as e:
                 logger.error(f"Error converting HTML with external tools: {str(e)}")
                 return None
 
-        return DocumentConverterResult(title=title, text_content=md_content.strip())
+        return DocumentConverterResult(
+            title=title, text_content=md_content.strip(), metadata={"cacheable": cacheable}
+        )
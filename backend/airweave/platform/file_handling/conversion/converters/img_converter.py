@@ -113,7 +113,11 @@ class AsyncImageConverter(DocumentConverter):
             logger.warning(f"No content extracted from image {local_path}")
             return None
 
-        return DocumentConverterResult(title=None, text_content=md_content.strip())
+        # Without the OCR text, or the description that was asked for, the result is degraded
+        cacheable = not self.mistral_client and not (self.openai_client and not llm_description)
+        return DocumentConverterResult(
+            title=None, text_content=md_content.strip(), metadata={"cacheable": cacheable}
+        )
 
     def _has_minimum_viable_capabilities(self) -> bool:
         """Check if we have enough capabilities for a meaningful conversion.
@@ -1,8 +1,12 @@
 """PDF to Markdown converter with Mistral OCR support."""
 
+import asyncio
+import math
 import os
 import tempfile
-from typing import Any, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
+
+import aiofiles
 
 from airweave.core.config import settings
 from airweave.core.logging import logger
@@ -10,6 +14,7 @@ from airweave.platform.file_handling.conversion._base import (
     DocumentConverter,
     DocumentConverterResult,
 )
+from airweave.platform.utils.process_pool import run_in_process
 
 # Initialize Mistral client if API key is available
 mistral_client = None
@@ -22,6 +27,129 @@ if hasattr(settings, "MISTRAL_API_KEY") and settings.MISTRAL_API_KEY:
 MAX_MISTRAL_FILE_SIZE = 50 * 1024 * 1024
 
 
+def _pypdf_to_markdown(local_path: str) -> Tuple[str, Optional[str]]:
+    """Extract the text of a PDF with PyPDF2.
+
+    Args:
+        local_path: Path to the PDF file
+
+    Returns:
+        Tuple of (markdown_content, title)
+
+    Raises:
+        ImportError: If PyPDF2 is not installed
+    """
+    import PyPDF2
+
+    md_content = ""
+    title = None
+
+    with open(local_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+
+        # Try to extract title from metadata
+        if reader.metadata and hasattr(reader.metadata, "title"):
+            title = reader.metadata.title
+
+        # Extract text from each page
+        for _i, page in enumerate(reader.pages):
+            page_text = page.extract_text()
+            if page_text:
+                md_content += f"{page_text}"
+
+    return md_content.strip(), title
+
+
+def _write_pages(reader, start_idx: int, end_idx: int, path: str) -> Tuple[int, int, str]:
+    """Write a range of pages of a PDF to a new file.
+
+    Returns:
+        Tuple of (start page index, end page index, path of the file)
+    """
+    from PyPDF2 import PdfWriter
+
+    writer = PdfWriter()
+    for i in range(start_idx, end_idx):
+        writer.add_page(reader.pages[i])
+    with open(path, "wb") as batch_file:
+        writer.write(batch_file)
+    return start_idx, end_idx, path
+
+
+def _split_pdf(
+    pdf_path: str, temp_dir: str, max_batch_size: int
+) -> Tuple[Optional[str], List[Tuple[int, int, str]]]:
+    """Split a PDF into batch files under the Mistral size limit.
+
+    Batches that are still too large are split into single pages.
+
+    Args:
+        pdf_path: Path to the PDF file
+        temp_dir: Directory to write the batch files to
+        max_batch_size: Maximum size of a batch file in bytes
+
+    Returns:
+        Tuple of (title, batches), with (start page index, end page index, path) per batch
+        in page order
+    """
+    import PyPDF2
+
+    batches = []
+    with open(pdf_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        title = None
+        if reader.metadata and hasattr(reader.metadata, "title"):
+            title = reader.metadata.title
+
+        # Calculate pages per batch to stay under the limit (with 10% buffer)
+        num_pages = len(reader.pages)
+        avg_page_size = os.path.getsize(pdf_path) / num_pages if num_pages > 0 else 0
+        pages_per_batch = max(1, int((max_batch_size * 0.9) / avg_page_size)) if num_pages else 1
+        logger.info(f"PDF has {num_pages} pages, avg {avg_page_size / 1024 / 1024:.2f}MB per page")
+        logger.info(f"Processing in batches of {pages_per_batch} pages")
+
+        for start_idx in range(0, num_pages, pages_per_batch):
+            end_idx = min(start_idx + pages_per_batch, num_pages)
+            batch = _write_pages(
+                reader, start_idx, end_idx, os.path.join(temp_dir, f"batch_{start_idx + 1}.pdf")
+            )
+
+            # Check if the batch file is still under the limit
+            batch_size = os.path.getsize(batch[2])
+            if batch_size > max_batch_size and end_idx - start_idx > 1:
+                logger.warning(
+                    f"Batch of pages {start_idx + 1}-{end_idx} "
+                    f"({batch_size / 1024 / 1024:.2f}MB) exceeds limit"
+                )
+                os.remove(batch[2])
+                batches.extend(
+                    _write_pages(reader, i, i + 1, os.path.join(temp_dir, f"page_{i + 1}.pdf"))
+                    for i in range(start_idx, end_idx)
+                )
+            else:
+                batches.append(batch)
+
+    return title, batches
+
+
+def _split_pages(
+    pdf_path: str, temp_dir: str, start_idx: int, end_idx: int
+) -> List[Tuple[int, int, str]]:
+    """Write each page in a range of a PDF to its own file.
+
+    Returns:
+        (page index, page index + 1, path) per page
+    """
+    import PyPDF2
+
+    with open(pdf_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        return [
+            _write_pages(reader, i, i + 1, os.path.join(temp_dir, f"page_{i + 1}.pdf"))
+            for i in range(start_idx, end_idx)
+        ]
+
+
 class PdfConverter(DocumentConverter):
     """Converts PDF files to Markdown using Mistral OCR or falls back to PyPDF2."""
 
@@ -29,6 +157,11 @@ class PdfConverter(DocumentConverter):
         """Initialize the PDF converter with Mistral client if API key is available."""
         self.mistral_client = mistral_client
 
+    @property
+    def cache_version(self) -> str:
+        """Version of the output, which differs between Mistral OCR and PyPDF2."""
+        return f"{self.VERSION}-{'mistral' if self.mistral_client else 'pypdf'}"
+
     async def convert(self, local_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
         """Convert a PDF file to markdown using Mistral OCR when available.
 
@@ -43,35 +176,44 @@ class PdfConverter(DocumentConverter):
         if extension.lower() != ".pdf":
             return None
 
-        # Try Mistral OCR first if available
+        # Try Mistral OCR first if available, a PyPDF2 fallback is not cached as OCR output
+        cacheable = True
         if self.mistral_client:
             try:
-                md_content, title = await self._convert_with_mistral(local_path)
-                return DocumentConverterResult(title=title, text_content=md_content)
+                md_content, title, complete = await self._convert_with_mistral(local_path)
+                # Pages that failed OCR are missing, so the result must not be cached
+                return DocumentConverterResult(
+                    title=title, text_content=md_content, metadata={"cacheable": complete}
+                )
             except Exception as e:
                 logger.error(f"Error converting PDF with Mistral OCR: {str(e)}")
                 logger.info("Falling back to PyPDF2")
+                cacheable = False
 
         # Fall back to PyPDF2
         try:
             md_content, title = await self._convert_with_pypdf(local_path)
-            return DocumentConverterResult(title=title, text_content=md_content)
+            return DocumentConverterResult(
+                title=title, text_content=md_content, metadata={"cacheable": cacheable}
+            )
         except ImportError:
             return DocumentConverterResult(
-                title=None, text_content="PDF conversion requires Mistral API key or PyPDF2."
+                title=None,
+                text_content="PDF conversion requires Mistral API key or PyPDF2.",
+                metadata={"cacheable": False},
             )
         except Exception as e:
             logger.error(f"Error converting PDF with PyPDF2: {str(e)}")
             return None
 
-    async def _convert_with_mistral(self, local_path: str) -> Tuple[str, Optional[str]]:
+    async def _convert_with_mistral(self, local_path: str) -> Tuple[str, Optional[str], bool]:
         """Convert PDF using Mistral OCR.
 
         Args:
             local_path: Path to the PDF file
 
         Returns:
-            Tuple of (markdown_content, title)
+            Tuple of (markdown_content, title, whether every page was converted)
 
         Raises:
             Exception: If Mistral OCR conversion fails
@@ -87,7 +229,8 @@ class PdfConverter(DocumentConverter):
             return await self._process_large_pdf(local_path)
 
         # Process normally for files under 50MB
-        return await self._process_single_pdf(local_path)
+        md_content, title = await self._process_single_pdf(local_path)
+        return md_content, title, True
 
     async def _process_single_pdf(self, pdf_path: str) -> Tuple[str, Optional[str]]:
         """Process a single PDF file with Mistral OCR.
@@ -99,20 +242,21 @@ class PdfConverter(DocumentConverter):
             Tuple of (markdown_content, title)
         """
         # Upload file to Mistral
-        with open(pdf_path, "rb") as file:
-            uploaded_pdf = self.mistral_client.files.upload(
-                file={
-                    "file_name": os.path.basename(pdf_path),
-                    "content": file,
-                },
-                purpose="ocr",
-            )
+        async with aiofiles.open(pdf_path, "rb") as file:
+            content = await file.read()
+        uploaded_pdf = await self.mistral_client.files.upload_async(
+            file={
+                "file_name": os.path.basename(pdf_path),
+                "content": content,
+            },
+            purpose="ocr",
+        )
 
         # Get signed URL for accessing the file
-        signed_url = self.mistral_client.files.get_signed_url(file_id=uploaded_pdf.id)
+        signed_url = await self.mistral_client.files.get_signed_url_async(file_id=uploaded_pdf.id)
 
         # Process file with OCR
-        ocr_response = self.mistral_client.ocr.process(
+        ocr_response = await self.mistral_client.ocr.process_async(
             model="mistral-ocr-latest",
             document={
                 "type": "document_url",
@@ -133,126 +277,81 @@ class PdfConverter(DocumentConverter):
 
         return md_content.strip(), title
 
-    async def _process_large_pdf(self, pdf_path: str) -> Tuple[str, Optional[str]]:
+    async def _process_large_pdf(self, pdf_path: str) -> Tuple[str, Optional[str], bool]:
         """Process a large PDF by splitting it into batches under 50MB and processing each batch.
 
+        Batches are processed concurrently, up to MISTRAL_OCR_CONCURRENCY at a time, and their
+        results are merged in page order.
+
         Args:
             pdf_path: Path to the PDF file
 
         Returns:
-            Tuple of (markdown_content, title)
+            Tuple of (markdown_content, title, whether every page was converted)
         """
-        import PyPDF2
-
-        title = None
-        combined_md = ""
         temp_dir = tempfile.mkdtemp()
 
         try:
-            # Open the PDF and get page count
-            with open(pdf_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                title = self._extract_pdf_title(reader)
-
-                # Calculate batch size
-                num_pages, pages_per_batch = self._calculate_batch_size(pdf_path, reader)
-
-                # Process in batches
-                batch_num = 1
-                for start_idx in range(0, num_pages, pages_per_batch):
-                    end_idx = min(start_idx + pages_per_batch, num_pages)
-                    batch_md = await self._process_page_batch(
-                        reader, start_idx, end_idx, temp_dir, batch_num
-                    )
-                    combined_md += batch_md
-                    batch_num += 1
-
-            return combined_md.strip(), title
+            # Splitting the PDF is CPU-bound, so it runs in the process pool. It takes time in
+            # proportion to the size of the file, so its budget grows with every 50MB batch.
+            timeout = settings.PROCESS_POOL_TASK_TIMEOUT * math.ceil(
+                os.path.getsize(pdf_path) / MAX_MISTRAL_FILE_SIZE
+            )
+            title, batches = await run_in_process(
+                _split_pdf, pdf_path, temp_dir, MAX_MISTRAL_FILE_SIZE, timeout=timeout
+            )
+
+            semaphore = asyncio.Semaphore(settings.MISTRAL_OCR_CONCURRENCY)
+            results = await asyncio.gather(
+                *(
+                    self._process_page_batch(pdf_path, batch, temp_dir, semaphore)
+                    for batch in batches
+                )
+            )
+            md_content = "".join(batch_md for batch_md, _ in results).strip()
+            return md_content, title, all(complete for _, complete in results)
 
         finally:
             self._cleanup_temp_files(temp_dir)
 
-    def _extract_pdf_title(self, reader) -> Optional[str]:
-        """Extract title from PDF metadata if available."""
-        if reader.metadata and hasattr(reader.metadata, "title"):
-            return reader.metadata.title
-        return None
-
-    def _calculate_batch_size(self, pdf_path: str, reader) -> Tuple[int, int]:
-        """Calculate number of pages and pages per batch."""
-        num_pages = len(reader.pages)
-        file_size = os.path.getsize(pdf_path)
-        avg_page_size = file_size / num_pages if num_pages > 0 else 0
-
-        # Calculate pages per batch to stay under 50MB limit (with 10% buffer)
-        pages_per_batch = max(1, int((MAX_MISTRAL_FILE_SIZE * 0.9) / avg_page_size))
-
-        logger.info(f"PDF has {num_pages} pages, avg {avg_page_size / 1024 / 1024:.2f}MB per page")
-        logger.info(f"Processing in batches of {pages_per_batch} pages")
-
-        return num_pages, pages_per_batch
-
     async def _process_page_batch(
-        self, reader, start_idx: int, end_idx: int, temp_dir: str, batch_num: int
-    ) -> str:
-        """Process a batch of PDF pages."""
-        from PyPDF2 import PdfWriter
-
-        # Create batch PDF with multiple pages
-        writer = PdfWriter()
-        for i in range(start_idx, end_idx):
-            writer.add_page(reader.pages[i])
-
-        # Save the batch to a temporary file
-        temp_batch_path = os.path.join(temp_dir, f"batch_{batch_num}.pdf")
-        with open(temp_batch_path, "wb") as batch_file:
-            writer.write(batch_file)
-
-        # Check if the batch file is still under the limit
-        batch_size = os.path.getsize(temp_batch_path)
-        if batch_size > MAX_MISTRAL_FILE_SIZE:
-            logger.warning(
-                f"Batch {batch_num} size ({batch_size / 1024 / 1024:.2f}MB) exceeds limit"
-            )
-            # Process individual pages in this batch
-            return await self._process_individual_pages(reader, start_idx, end_idx, temp_dir)
-        else:
-            # Process the batch
-            try:
-                batch_md, _ = await self._process_single_pdf(temp_batch_path)
-                logger.info(f"Processed batch {batch_num} (pages {start_idx + 1}-{end_idx})")
-                return batch_md + "\n\n"
-            except Exception as e:
-                logger.error(f"Error processing batch {batch_num}: {str(e)}")
-                # Fall back to processing pages individually
-                logger.info(
-                    f"Falling back to processing pages {start_idx + 1}-{end_idx} individually"
-                )
-                return await self._process_individual_pages(reader, start_idx, end_idx, temp_dir)
-
-    async def _process_individual_pages(
-        self, reader, start_idx: int, end_idx: int, temp_dir: str
-    ) -> str:
-        """Process individual pages when batch processing fails."""
-        from PyPDF2 import PdfWriter
+        self,
+        pdf_path: str,
+        batch: Tuple[int, int, str],
+        temp_dir: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[str, bool]:
+        """Process a batch of PDF pages, falling back to its individual pages if it fails.
 
-        pages_md = ""
-        num_pages = len(reader.pages)
-
-        for i in range(start_idx, end_idx):
-            single_writer = PdfWriter()
-            single_writer.add_page(reader.pages[i])
-            temp_page_path = os.path.join(temp_dir, f"page_{i + 1}.pdf")
-            with open(temp_page_path, "wb") as page_file:
-                single_writer.write(page_file)
-            try:
-                page_md, _ = await self._process_single_pdf(temp_page_path)
-                pages_md += page_md + "\n\n"
-                logger.info(f"Processed page {i + 1}/{num_pages}")
-            except Exception as e:
-                logger.error(f"Error processing page {i + 1}: {str(e)}")
+        Args:
+            pdf_path: Path to the original PDF file
+            batch: Tuple of (start page index, end page index, path of the batch file)
+            temp_dir: Directory for the files of individual pages
+            semaphore: Limits the number of concurrent OCR requests
 
-        return pages_md
+        Returns:
+            Tuple of (markdown content of the pages, whether every page was converted),
+            the content of pages that failed is left out
+        """
+        start_idx, end_idx, batch_path = batch
+        try:
+            async with semaphore:
+                batch_md, _ = await self._process_single_pdf(batch_path)
+            logger.info(f"Processed pages {start_idx + 1}-{end_idx}")
+            return batch_md + "\n\n", True
+        except Exception as e:
+            if end_idx - start_idx == 1:
+                logger.error(f"Error processing page {start_idx + 1}: {str(e)}")
+                return "", False
+
+            logger.error(f"Error processing pages {start_idx + 1}-{end_idx}: {str(e)}")
+            logger.info(f"Falling back to processing pages {start_idx + 1}-{end_idx} individually")
+            pages = await run_in_process(_split_pages, pdf_path, temp_dir, start_idx, end_idx)
+            results = await asyncio.gather(
+                *(self._process_page_batch(pdf_path, page, temp_dir, semaphore) for page in pages)
+            )
+            pages_md = "".join(page_md for page_md, _ in results)
+            return pages_md, all(complete for _, complete in results)
 
     def _cleanup_temp_files(self, temp_dir: str) -> None:
         """Clean up temporary files."""
@@ -264,7 +363,7 @@ class PdfConverter(DocumentConverter):
             logger.error(f"Error cleaning up temporary files: {str(e)}")
 
     async def _convert_with_pypdf(self, local_path: str) -> Tuple[str, Optional[str]]:
-        """Convert PDF using PyPDF2 as fallback.
+        """Convert PDF using PyPDF2 as fallback, in the process pool.
 
         Args:
             local_path: Path to the PDF file
@@ -275,22 +374,4 @@ class PdfConverter(DocumentConverter):
         Raises:
             ImportError: If PyPDF2 is not installed
         """
-        import PyPDF2
-
-        md_content = ""
-        title = None
-
-        with open(local_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-
-            # Try to extract title from metadata
-            if reader.metadata and hasattr(reader.metadata, "title"):
-                title = reader.metadata.title
-
-            # Extract text from each page
-            for _i, page in enumerate(reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    md_content += f"{page_text}"
-
-        return md_content.strip(), title
+        return await run_in_process(_pypdf_to_markdown, local_path)
@@ -9,6 +9,26 @@ from airweave.platform.file_handling.conversion._base import (
     DocumentConverter,
     DocumentConverterResult,
 )
+from airweave.platform.utils.process_pool import run_in_process
+
+
+def _xlsx_to_markdown(local_path: str) -> str:
+    """Convert every sheet of an XLSX file to a Markdown table.
+
+    Args:
+        local_path: Path to the XLSX file
+
+    Returns:
+        Markdown content
+    """
+    sheets = pd.read_excel(local_path, sheet_name=None)
+    md_content = ""
+
+    for sheet_name, df in sheets.items():
+        md_content += f"## {sheet_name}\n"
+        md_content += df.to_markdown(index=False) + "\n\n"
+
+    return md_content
 
 
 class XlsxConverter(DocumentConverter):
@@ -29,13 +49,7 @@ class XlsxConverter(DocumentConverter):
             return None
 
         try:
-            sheets = pd.read_excel(local_path, sheet_name=None)
-            md_content = ""
-
-            for sheet_name, df in sheets.items():
-                md_content += f"## {sheet_name}\n"
-                md_content += df.to_markdown(index=False) + "\n\n"
-
+            md_content = await run_in_process(_xlsx_to_markdown, local_path)
             return DocumentConverterResult(title=None, text_content=md_content.strip())
         except Exception as e:
             logger.error(f"Error converting XLSX file {local_path}: {str(e)}")
@@ -8,6 +8,7 @@ from uuid import uuid4
 import aiofiles
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.entities._base import FileEntity
 
@@ -46,12 +47,19 @@ class FileManager:
         # Initialize a flag to indicate if this entity should be skipped
         entity.should_skip = False
 
+        # Skip files the source already reports as too large without downloading them
+        if entity.total_size and entity.total_size > max_size:
+            self._mark_too_large(entity, entity.total_size, max_size)
+            return entity
+
         file_uuid = uuid4()
         safe_filename = self._safe_filename(entity.name)
         temp_path = os.path.join(self.base_temp_dir, f"{file_uuid}-{safe_filename}")
 
         try:
             downloaded_size = 0
+            # The checksum is computed while streaming, so the file is never held in memory
+            checksum = hashlib.sha256()
             async with aiofiles.open(temp_path, "wb") as f:
                 async for chunk in stream:
                     downloaded_size += len(chunk)
@@ -68,19 +76,10 @@ class FileManager:
                         if os.path.exists(temp_path):
                             os.remove(temp_path)
 
-                        # Add warning to entity metadata
-                        if not entity.metadata:
-                            entity.metadata = {}
-                        entity.metadata["error"] = (
-                            f"File too large (exceeded "
-                            f"{max_size / (1024 * 1024 * 1024):.1f}GB limit)"
-                        )
-                        entity.metadata["size_exceeded"] = downloaded_size
-
-                        # Set the skip flag
-                        entity.should_skip = True
+                        self._mark_too_large(entity, downloaded_size, max_size)
                         return entity
 
+                    checksum.update(chunk)
                     await f.write(chunk)
 
                     # Log progress for large files
@@ -91,14 +90,12 @@ class FileManager:
                             f"({downloaded_size}/{entity.total_size} bytes)"
                         )
 
-            # Calculate checksum and update entity
-            with open(temp_path, "rb") as f:
-                content = f.read()
-                entity.checksum = hashlib.sha256(content).hexdigest()
-                entity.local_path = temp_path
-                logger.info(f"\nlocal_path: {entity.local_path}\n")
-                entity.file_uuid = file_uuid
-                entity.total_size = downloaded_size  # Update with actual size
+            # Update entity, FileEntity.hash() reuses the checksum
+            entity.checksum = checksum.hexdigest()
+            entity.local_path = temp_path
+            logger.info(f"\nlocal_path: {entity.local_path}\n")
+            entity.file_uuid = file_uuid
+            entity.total_size = downloaded_size  # Update with actual size
 
         except Exception as e:
             logger.error(f"Error saving file {entity.name}: {str(e)}")
@@ -109,6 +106,21 @@ class FileManager:
 
         return entity
 
+    @staticmethod
+    def _mark_too_large(entity: FileEntity, size: int, max_size: int) -> None:
+        """Flag a file entity that exceeds the maximum size to be skipped."""
+        # Add warning to entity metadata, for file entities that have it
+        if "metadata" in type(entity).model_fields:
+            if not entity.metadata:
+                entity.metadata = {}
+            entity.metadata["error"] = (
+                f"File too large (exceeded {max_size / (1024 * 1024 * 1024):.1f}GB limit)"
+            )
+            entity.metadata["size_exceeded"] = size
+
+        # Set the skip flag
+        entity.should_skip = True
+
     @staticmethod
     def _safe_filename(filename: str) -> str:
         """Create a safe version of a filename."""
@@ -129,19 +141,19 @@ class FileManager:
         if access_token and "X-Amz-Algorithm" not in url:
             request_headers["Authorization"] = f"Bearer {access_token}"
 
-        # The file is downloaded in chunks
+        # The file is downloaded in chunks over a pooled connection
         timeout = httpx.Timeout(180.0, read=540.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            try:
-                async with client.stream(
-                    "GET", url, headers=request_headers, follow_redirects=True
-                ) as response:
-                    response.raise_for_status()
-                    async for chunk in response.aiter_bytes():
-                        yield chunk
-            except Exception as e:
-                logger.error(f"Error streaming file: {str(e)}")
-                raise
+        client = http_client_pool.get_client()
+        try:
+            async with client.stream(
+                "GET", url, headers=request_headers, follow_redirects=True, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming file: {str(e)}")
+            raise
 
 
 # Global instance
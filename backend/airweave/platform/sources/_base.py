@@ -1,13 +1,42 @@
 """Base source class."""
 
+import asyncio
 from abc import abstractmethod
-from typing import Any, AsyncGenerator, ClassVar, Dict, List, Optional
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import httpx
 from pydantic import BaseModel
 
 from airweave.core.logging import logger
 from airweave.platform.entities._base import ChunkEntity
 from airweave.platform.file_handling.file_manager import file_manager
+from airweave.platform.utils import rate_limiter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def _iterate(items: Iterable[T]) -> AsyncGenerator[T, None]:
+    """Iterate a synchronous iterable asynchronously."""
+    for item in items:
+        yield item
 
 
 class BaseSource:
@@ -16,6 +45,13 @@ class BaseSource:
     # Class variables for integration metadata
     _labels: ClassVar[List[str]] = []
 
+    # Maximum number of detail requests `prefetch` runs at the same time
+    _prefetch_concurrency: ClassVar[int] = 5
+
+    # Requests per second and burst size of the rate limiter shared per credential
+    _rate_limit: ClassVar[float] = 10.0
+    _rate_limit_burst: ClassVar[int] = 10
+
     @classmethod
     @abstractmethod
     async def create(
@@ -38,6 +74,186 @@ class BaseSource:
         """Generate entities for the source."""
         pass
 
+    def get_cursor(self) -> Dict[str, Any]:
+        """Get the cursor of this sync.
+
+        Sources that only read changes keep their position (watermarks, delta tokens) in
+        the cursor and update it while generating entities. The sync loads the cursor stored
+        by the previous job before the source runs, and only stores it again when the job
+        completes, so a failed job is retried from the previous position.
+
+        Returns:
+            The mutable cursor state, empty on the first job of a sync
+        """
+        if getattr(self, "_cursor", None) is None:
+            self._cursor = {}
+        return self._cursor
+
+    def set_cursor(self, cursor: Optional[Dict[str, Any]]) -> None:
+        """Replace the cursor of this sync.
+
+        Args:
+            cursor: The JSON serializable cursor state
+        """
+        self._cursor = dict(cursor or {})
+
+    def mark_incremental(self) -> None:
+        """Mark this run as incremental.
+
+        Incremental runs do not generate unchanged entities, so entities that were not
+        encountered are not treated as deleted. Only entities reported with `mark_deleted`
+        are removed.
+        """
+        self._incremental = True
+
+    def is_incremental(self) -> bool:
+        """Whether this run only generated changed entities."""
+        return getattr(self, "_incremental", False)
+
+    def mark_deleted(self, entity_id: str, child_prefix: Optional[str] = None) -> None:
+        """Report an entity that an incremental run found deleted in the source.
+
+        Args:
+            entity_id: The entity_id of the deleted entity
+            child_prefix: Prefix of the entity ids of its children (e.g. the attachments of a
+                message), which are deleted with it
+        """
+        if getattr(self, "_deleted_entity_ids", None) is None:
+            self._deleted_entity_ids = set()
+        self._deleted_entity_ids.add(entity_id)
+        if child_prefix:
+            if getattr(self, "_deleted_entity_prefixes", None) is None:
+                self._deleted_entity_prefixes = set()
+            self._deleted_entity_prefixes.add(child_prefix)
+
+    def get_deleted_entity_ids(self) -> Set[str]:
+        """Get the entity ids that this run reported as deleted."""
+        return getattr(self, "_deleted_entity_ids", None) or set()
+
+    def get_deleted_entity_prefixes(self) -> Set[str]:
+        """Get the entity id prefixes of the children of the entities reported as deleted."""
+        return getattr(self, "_deleted_entity_prefixes", None) or set()
+
+    def mark_present(self, entity_id: str) -> None:
+        """Report an unchanged entity that was not generated but still exists in the source.
+
+        Lets a run read only the changed part of a collection while deletions are still
+        found by a cheap listing of the existing ids, e.g. the primary keys of a table: entities
+        that were neither generated nor reported as present are deleted at the end of the run.
+
+        Args:
+            entity_id: The entity_id of the unchanged entity
+        """
+        if getattr(self, "_present_entity_ids", None) is None:
+            self._present_entity_ids = set()
+        self._present_entity_ids.add(entity_id)
+
+    def get_present_entity_ids(self) -> Set[str]:
+        """Get the entity ids that this run reported as present without generating them."""
+        return getattr(self, "_present_entity_ids", None) or set()
+
+    def confirm_entities(self, entity_ids: Set[str]) -> None:
+        """Receive the entity ids that this run stored or kept, before the cursor is saved.
+
+        Sources that record per-entity state in the cursor override this, so the state of
+        entities that failed to be stored is not saved and they are generated again.
+
+        Args:
+            entity_ids: The entity_ids of the stored and kept entities
+        """
+        pass
+
+    def get_rate_limiter(self, credential: str) -> rate_limiter.RateLimiter:
+        """Get the rate limiter shared by all syncs of this source using a credential.
+
+        Call `acquire()` before each request and pass each response to
+        `update_from_headers()`, or send the request with `_send_rate_limited`, so the limiter
+        adapts to the provider's rate limit headers.
+
+        Args:
+            credential: The access token or API key the requests are made with
+
+        Returns:
+            The limiter, configured with the source's `_rate_limit` and `_rate_limit_burst`
+        """
+        if getattr(self, "_rate_limiters", None) is None:
+            self._rate_limiters = {}
+        # Keyed by credential, since a refreshed token gets the limiter of the new token
+        if credential not in self._rate_limiters:
+            self._rate_limiters[credential] = rate_limiter.get_rate_limiter(
+                getattr(self, "_short_name", type(self).__name__),
+                credential,
+                self._rate_limit,
+                self._rate_limit_burst,
+            )
+        return self._rate_limiters[credential]
+
+    async def _send_rate_limited(
+        self, credential: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a request once the rate limiter of its credential allows it.
+
+        Args:
+            credential: The access token or API key the request is made with
+            send: Sends the request, e.g. `lambda: client.get(url, headers=headers)`
+
+        Returns:
+            The response, after the limiter was updated from its rate limit headers
+        """
+        limiter = self.get_rate_limiter(credential)
+        await limiter.acquire()
+        response = await send()
+        await limiter.update_from_headers(response.status_code, response.headers)
+        return response
+
+    async def prefetch(
+        self,
+        items: Union[Iterable[T], AsyncIterable[T]],
+        fetch: Callable[[T], Awaitable[R]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncGenerator[Tuple[T, R], None]:
+        """Fetch the details of listed items concurrently, yielding them in listing order.
+
+        While an item is being yielded, the fetches of the next items are already running,
+        at most `concurrency` at a time (the source's `_prefetch_concurrency` by default).
+        If a fetch fails, the error is raised when its item is reached and the remaining
+        fetches are cancelled, so fetch functions should handle errors of single items.
+
+        Args:
+            items: The listed items, for example the ids of a page of search results
+            fetch: Coroutine function fetching the details of an item
+            concurrency: Optional override of the maximum number of concurrent fetches
+
+        Yields:
+            Tuples of each item and its fetched details
+        """
+        limit = concurrency or self._prefetch_concurrency
+        iterator = aiter(items) if isinstance(items, AsyncIterable) else _iterate(items)
+        pending: Deque[Tuple[T, asyncio.Task]] = deque()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        item = await anext(iterator)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.append((item, asyncio.ensure_future(fetch(item))))
+
+                if not pending:
+                    return
+
+                item, task = pending.popleft()
+                yield item, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+
     async def process_file_entity(
         self, file_entity, download_url=None, access_token=None, headers=None
     ) -> Optional[ChunkEntity]:
@@ -49,6 +265,9 @@ class BaseSource:
             access_token: OAuth token for authentication
             headers: Custom headers for the download
 
+        Files with a version token are returned without downloading them, the sync downloads
+        them once it has determined they changed.
+
         Returns:
             The processed entity if it should be included, None if it should be skipped
         """
@@ -66,6 +285,19 @@ class BaseSource:
             logger.error(f"No access token provided for file {file_entity.name}")
             raise ValueError(f"No access token available for processing file {file_entity.name}")
 
+        # Files with a version token are only downloaded once the sync knows they changed
+        if file_entity.get_version_token():
+            file_entity.defer_download(
+                lambda: self._download_file_entity(file_entity, url, token, headers)
+            )
+            return file_entity
+
+        return await self._download_file_entity(file_entity, url, token, headers)
+
+    async def _download_file_entity(
+        self, file_entity, url: str, token: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[ChunkEntity]:
+        """Download a file entity and enrich it with its local path and checksum."""
         logger.info(f"Processing file entity: {file_entity.name}")
 
         try:
@@ -5,6 +5,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -58,9 +59,12 @@ class AsanaSource(BaseSource):
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def _get_with_auth(self, client: httpx.AsyncClient, url: str) -> Dict:
         """Make authenticated GET request to Asana API."""
-        response = await client.get(
-            url,
-            headers={"Authorization": f"Bearer {self.access_token}"},
+        response = await self._send_rate_limited(
+            self.access_token,
+            lambda: client.get(
+                url,
+                headers={"Authorization": f"Bearer {self.access_token}"},
+            ),
         )
         response.raise_for_status()
         return response.json()
@@ -305,7 +309,7 @@ class AsanaSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all entities from Asana."""
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             async for workspace_entity in self._generate_workspace_entities(client):
                 yield workspace_entity
 
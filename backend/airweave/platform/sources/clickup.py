@@ -19,6 +19,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities.clickup import (
@@ -143,7 +144,7 @@ class ClickUpSource(BaseSource):
     async def generate_entities(self) -> AsyncGenerator[Any, None]:
         """Generate all ClickUp entities (Workspaces, Spaces, Folders, Lists, Tasks, Comments)."""
         print("Generating ClickUp entities")
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # Generate Workspace entities
             async for workspace in self._fetch_workspaces(client):
                 print(f"Generating Workspace entity: {workspace}")
@@ -21,6 +21,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -104,7 +105,7 @@ class ConfluenceSource(BaseSource):
         Returns:
             list[dict]: List of accessible resources, each containing 'id' and 'url' keys
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
             try:
                 response = await client.get(
@@ -174,7 +175,9 @@ class ConfluenceSource(BaseSource):
             headers["X-Cloud-ID"] = self.cloud_id
 
         logger.debug(f"Making request to {url} with headers: {headers}")
-        response = await client.get(url, headers=headers)
+        response = await self._send_rate_limited(
+            self.access_token, lambda: client.get(url, headers=headers)
+        )
 
         if not response.is_success:
             logger.error(f"Request failed with status {response.status_code}")
@@ -253,14 +256,16 @@ class ConfluenceSource(BaseSource):
         while url:
             data = await self._get_with_auth(client, url)
 
-            for page in data.get("results", []):
+            # Page details are fetched ahead while earlier pages are processed
+            async for page, page_details in self.prefetch(
+                data.get("results", []),
+                lambda page: self._get_with_auth(
+                    client, f"{self.base_url}/wiki/api/v2/pages/{page['id']}?body-format=storage"
+                ),
+            ):
                 page_breadcrumbs = [space_breadcrumb]
                 page_id = page["id"]
 
-                # Get detailed page content with expanded body
-                page_detail_url = f"{self.base_url}/wiki/api/v2/pages/{page_id}?body-format=storage"
-                page_details = await self._get_with_auth(client, page_detail_url)
-
                 # Extract full body content
                 body_content = page_details.get("body", {}).get("storage", {}).get("value", "")
 
@@ -443,7 +448,7 @@ class ConfluenceSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:  # noqa: C901
         """Generate all Confluence content."""
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # 1) Yield all spaces (top-level)
             async for space_entity in self._generate_space_entities(client):
                 yield space_entity
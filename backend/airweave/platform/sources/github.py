@@ -10,23 +10,27 @@ and yields them as entities using the corresponding GitHub entity schemas
 References:
   https://docs.github.com/en/rest/repos/repos
   https://docs.github.com/en/rest/repos/contents
+  https://docs.github.com/en/rest/git/trees
 
 Notes:
   - This connector uses a read-only scope.
-  - For each repository, we gather basic repo metadata, then traverse the
-    repository contents recursively (default branch only).
+  - For each repository, we gather basic repo metadata, then list the
+    repository contents with one recursive Git Trees API call (default branch
+    only). Files whose blob SHA did not change since the previous sync are not
+    downloaded again.
 """
 
 import base64
 import mimetypes
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 import httpx
 import tenacity
 from tenacity import retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.configs.auth import GitHubAuthConfig
@@ -39,7 +43,9 @@ from airweave.platform.entities.github import (
 )
 from airweave.platform.sources._base import BaseSource
 from airweave.platform.utils.file_extensions import (
+    MAX_TEXT_DETECTION_SIZE,
     get_language_for_extension,
+    is_likely_binary_extension,
     is_text_file,
 )
 
@@ -57,6 +63,10 @@ class GitHubSource(BaseSource):
 
     BASE_URL = "https://api.github.com"
 
+    # Once fewer than a burst of the hourly quota remain, requests are paced until it resets
+    _rate_limit = 10.0
+    _rate_limit_burst = 100
+
     @classmethod
     async def create(
         cls, credentials: GitHubAuthConfig, config: Optional[Dict[str, Any]] = None
@@ -77,6 +87,9 @@ class GitHubSource(BaseSource):
 
         instance.branch = config.get("branch", None)
 
+        # Blob SHAs of generated files by entity_id, stored once the files are confirmed
+        instance._unconfirmed_blob_shas: Dict[str, Tuple[str, str]] = {}
+
         return instance
 
     @tenacity.retry(
@@ -102,7 +115,9 @@ class GitHubSource(BaseSource):
             "Accept": "application/vnd.github.v3+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
-        response = await client.post(url, headers=headers, json=params)
+        response = await self._send_rate_limited(
+            self.personal_access_token, lambda: client.post(url, headers=headers, json=params)
+        )
         response.raise_for_status()
         return response.json()
 
@@ -124,7 +139,9 @@ class GitHubSource(BaseSource):
             "Accept": "application/vnd.github.v3+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
-        response = await client.get(url, headers=headers, params=params)
+        response = await self._send_rate_limited(
+            self.personal_access_token, lambda: client.get(url, headers=headers, params=params)
+        )
         response.raise_for_status()
         return response.json()
 
@@ -177,7 +194,7 @@ class GitHubSource(BaseSource):
     async def _traverse_repository(
         self, client: httpx.AsyncClient, repo_name: str, branch: str
     ) -> AsyncGenerator[ChunkEntity, None]:
-        """Traverse repository contents using DFS.
+        """Traverse repository contents, falling back to DFS for truncated trees.
 
         Args:
             client: HTTP client
@@ -199,6 +216,18 @@ class GitHubSource(BaseSource):
             entity_id=repo_entity.entity_id, name=repo_entity.name, type="repository"
         )
 
+        tree = await self._get_tree(client, repo_name, branch)
+        if tree is not None:
+            async for entity in self._traverse_tree(
+                client, repo_name, tree, [repo_breadcrumb], owner, repo, branch
+            ):
+                yield entity
+            return
+
+        # The tree was too large to list in one response, so nothing can be compared
+        # against the previous sync
+        self.set_cursor({})
+
         # Track processed paths to avoid duplicates
         processed_paths = set()
 
@@ -208,6 +237,149 @@ class GitHubSource(BaseSource):
         ):
             yield entity
 
+    async def _get_tree(
+        self, client: httpx.AsyncClient, repo_name: str, branch: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """List all entries of a branch with a single recursive Git Trees API call.
+
+        Args:
+            client: HTTP client
+            repo_name: Repository name (format: "owner/repo")
+            branch: Branch name
+
+        Returns:
+            The tree entries, or None if GitHub truncated the tree
+        """
+        url = f"{self.BASE_URL}/repos/{repo_name}/git/trees/{branch}"
+        tree_data = await self._get_with_auth(client, url, {"recursive": "1"})
+
+        if tree_data.get("truncated"):
+            logger.warning(f"Tree of {repo_name} is truncated, traversing directories instead")
+            return None
+        return tree_data.get("tree", [])
+
+    async def _traverse_tree(
+        self,
+        client: httpx.AsyncClient,
+        repo_name: str,
+        tree: List[Dict[str, Any]],
+        breadcrumbs: List[Breadcrumb],
+        owner: str,
+        repo: str,
+        branch: str,
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate directory and file entities from the entries of a recursive tree.
+
+        The blob SHA of every file is stored in the cursor. When the previous sync read the
+        same branch, files whose blob SHA is unchanged are skipped before they are downloaded
+        and entries missing from the tree are reported as deleted. The SHAs of generated files
+        are only stored once `confirm_entities` reports them as stored.
+
+        Args:
+            client: HTTP client
+            repo_name: Repository name
+            tree: The entries of the recursive tree
+            breadcrumbs: Breadcrumb chain of the repository
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+
+        Yields:
+            Directory and file entities
+        """
+        cursor = self.get_cursor()
+        ref = f"{repo_name}@{branch}"
+        previous_shas = cursor.get("blob_shas", {}) if cursor.get("ref") == ref else None
+
+        if previous_shas is not None:
+            self.mark_incremental()
+            previous_paths = set(previous_shas) | set(cursor.get("directories", []))
+            self._mark_removed_paths(repo_name, tree, previous_paths)
+
+        blob_shas: Dict[str, Optional[str]] = {}
+        directories: List[str] = []
+        # Entries are sorted by path, so directories are listed before their contents
+        breadcrumbs_by_dir: Dict[str, List[Breadcrumb]] = {"": breadcrumbs}
+
+        for item in tree:
+            item_path = item["path"]
+            parent_breadcrumbs = breadcrumbs_by_dir.get(item_path.rpartition("/")[0], breadcrumbs)
+
+            if item["type"] == "tree":
+                dir_entity = GitHubDirectoryEntity(
+                    entity_id=f"{repo_name}/{item_path}",
+                    source_name="github",
+                    path=item_path,
+                    repo_name=repo,
+                    repo_owner=owner,
+                    content=f"Directory: {item_path}",
+                    breadcrumbs=parent_breadcrumbs.copy(),
+                    url=f"https://github.com/{repo_name}/tree/{branch}/{item_path}",
+                )
+                dir_breadcrumb = Breadcrumb(
+                    entity_id=dir_entity.entity_id,
+                    name=Path(item_path).name,
+                    type="directory",
+                )
+                breadcrumbs_by_dir[item_path] = parent_breadcrumbs + [dir_breadcrumb]
+                directories.append(item_path)
+                yield dir_entity
+
+            elif item["type"] == "blob":
+                if previous_shas is not None and previous_shas.get(item_path) == item["sha"]:
+                    blob_shas[item_path] = item["sha"]
+                    continue
+
+                try:
+                    file_entity = await self._get_file_entity(
+                        client, repo_name, item, parent_breadcrumbs, owner, repo, branch
+                    )
+                except Exception as e:
+                    # Not recorded, so the file is retried by the next sync
+                    logger.error(f"Error processing file {item_path}: {str(e)}")
+                    continue
+
+                if file_entity:
+                    # Listed without a SHA until stored, so it is downloaded again otherwise
+                    blob_shas[item_path] = None
+                    self._unconfirmed_blob_shas[file_entity.entity_id] = (item_path, item["sha"])
+                    yield file_entity
+                else:
+                    blob_shas[item_path] = item["sha"]
+                    if previous_shas is not None and item_path in previous_shas:
+                        # A stored text file that became binary or oversized is not kept
+                        self.mark_deleted(f"{repo_name}/{item_path}")
+
+        cursor.update(ref=ref, blob_shas=blob_shas, directories=directories)
+
+    def _mark_removed_paths(
+        self, repo_name: str, tree: List[Dict[str, Any]], previous_paths: Set[str]
+    ) -> None:
+        """Report the files and directories of the previous sync missing from the tree.
+
+        Args:
+            repo_name: Repository name
+            tree: The entries of the recursive tree
+            previous_paths: Paths of the files and directories listed by the previous sync
+        """
+        current_paths = {item["path"] for item in tree}
+        for path in previous_paths - current_paths:
+            self.mark_deleted(f"{repo_name}/{path}")
+
+    def confirm_entities(self, entity_ids: Set[str]) -> None:
+        """Store the blob SHAs of the generated files that were stored.
+
+        Args:
+            entity_ids: The entity_ids of the stored and kept entities
+        """
+        blob_shas = self.get_cursor().get("blob_shas")
+        if blob_shas is None:
+            return
+        for entity_id, (item_path, sha) in self._unconfirmed_blob_shas.items():
+            if entity_id in entity_ids:
+                blob_shas[item_path] = sha
+        self._unconfirmed_blob_shas = {}
+
     async def _traverse_directory(
         self,
         client: httpx.AsyncClient,
@@ -333,64 +505,102 @@ class GitHubSource(BaseSource):
             File entities
         """
         try:
-            # For files at root level, ensure we use the correct API path
-            file_url = f"{self.BASE_URL}/repos/{repo_name}/contents/{item_path}"
-            file_data = await self._get_with_auth(client, file_url, {"ref": branch})
-            file_size = file_data.get("size", 0)
-
-            # Get content sample for text file detection if the file is not too large
-            content_sample = None
-            content_text = None
-            if file_data.get("encoding") == "base64" and file_data.get("content"):
-                try:
-                    content_sample = base64.b64decode(file_data["content"])
-                    # Try to decode content as text for storage
-                    content_text = content_sample.decode("utf-8", errors="replace")
-                except Exception:
-                    pass
-
-            # Check if this is a text file based on extension, size, and possibly content
-            if is_text_file(item_path, file_size, content_sample):
-                # Detect language
-                language = self._detect_language_from_extension(item_path)
-
-                # Ensure we have a valid path
-                file_name = Path(item_path).name
-
-                # Set line count if we have content
-                line_count = 0
-                if content_text:
-                    try:
-                        line_count = content_text.count("\n") + 1
-                    except Exception as e:
-                        logger.error(f"Error counting lines for {item_path}: {str(e)}")
-
-                # Create file entity with guaranteed valid paths and store content in memory
-                file_entity = GitHubCodeFileEntity(
-                    entity_id=f"{repo_name}/{item_path}",
-                    source_name="github",
-                    file_id=file_data["sha"],
-                    name=file_name,
-                    mime_type=mimetypes.guess_type(item_path)[0] or "text/plain",
-                    size=file_size,
-                    path=item_path or file_name,  # Fallback to file name if path is empty
-                    repo_name=repo,
-                    repo_owner=owner,
-                    sha=file_data["sha"],
-                    breadcrumbs=breadcrumbs.copy(),
-                    url=file_data["html_url"],
-                    language=language,
-                    line_count=line_count,
-                    path_in_repo=item_path,
-                    content=content_text,  # Store the content directly in the entity
-                    last_modified=None,  # GitHub API doesn't provide this directly
-                )
-
-                # Let the file handler manage actual file processing
+            file_entity = await self._get_file_entity(
+                client, repo_name, item, breadcrumbs, owner, repo, branch
+            )
+            if file_entity:
                 yield file_entity
         except Exception as e:
             logger.error(f"Error processing file {item_path}: {str(e)}")
 
+    async def _get_file_entity(
+        self,
+        client: httpx.AsyncClient,
+        repo_name: str,
+        item: Dict[str, Any],
+        breadcrumbs: List[Breadcrumb],
+        owner: str,
+        repo: str,
+        branch: str,
+    ) -> Optional[GitHubCodeFileEntity]:
+        """Download a file and create its entity.
+
+        Args:
+            client: HTTP client
+            repo_name: Repository name
+            item: File item data from the contents or trees API
+            breadcrumbs: Current breadcrumb chain
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+
+        Returns:
+            The file entity, or None if the file is not a text file
+        """
+        item_path = item["path"]
+
+        # Binary and oversized files are skipped without downloading them
+        file_size = item.get("size", 0)
+        if file_size > MAX_TEXT_DETECTION_SIZE or is_likely_binary_extension(
+            Path(item_path).suffix.lower()
+        ):
+            return None
+
+        # For files at root level, ensure we use the correct API path
+        file_url = f"{self.BASE_URL}/repos/{repo_name}/contents/{item_path}"
+        file_data = await self._get_with_auth(client, file_url, {"ref": branch})
+        file_size = file_data.get("size", 0)
+
+        # Get content sample for text file detection if the file is not too large
+        content_sample = None
+        content_text = None
+        if file_data.get("encoding") == "base64" and file_data.get("content"):
+            try:
+                content_sample = base64.b64decode(file_data["content"])
+                # Try to decode content as text for storage
+                content_text = content_sample.decode("utf-8", errors="replace")
+            except Exception:
+                pass
+
+        # Check if this is a text file based on extension, size, and possibly content
+        if not is_text_file(item_path, file_size, content_sample):
+            return None
+
+        # Detect language
+        language = self._detect_language_from_extension(item_path)
+
+        # Ensure we have a valid path
+        file_name = Path(item_path).name
+
+        # Set line count if we have content
+        line_count = 0
+        if content_text:
+            try:
+                line_count = content_text.count("\n") + 1
+            except Exception as e:
+                logger.error(f"Error counting lines for {item_path}: {str(e)}")
+
+        # Create file entity with guaranteed valid paths and store content in memory
+        return GitHubCodeFileEntity(
+            entity_id=f"{repo_name}/{item_path}",
+            source_name="github",
+            file_id=file_data["sha"],
+            name=file_name,
+            mime_type=mimetypes.guess_type(item_path)[0] or "text/plain",
+            size=file_size,
+            path=item_path or file_name,  # Fallback to file name if path is empty
+            repo_name=repo,
+            repo_owner=owner,
+            sha=file_data["sha"],
+            breadcrumbs=breadcrumbs.copy(),
+            url=file_data["html_url"],
+            language=language,
+            line_count=line_count,
+            path_in_repo=item_path,
+            content=content_text,  # Store the content directly in the entity
+            last_modified=None,  # GitHub API doesn't provide this directly
+        )
+
     async def _create_branch(
         self, client: httpx.AsyncClient, repo_name: str, branch: str, base_branch: str
     ) -> None:
@@ -430,7 +640,7 @@ class GitHubSource(BaseSource):
         if not hasattr(self, "repo_name") or not self.repo_name:
             raise ValueError("Repository name must be specified")
 
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             repo_url = f"{self.BASE_URL}/repos/{self.repo_name}"
             repo_data = await self._get_with_auth(client, repo_url)
 
@@ -10,10 +10,11 @@ Follows the same structure as other connector implementations.
 
 import base64
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -40,6 +41,9 @@ class GmailSource(BaseSource):
     Retrieves and yields Gmail objects (threads, messages, attachments).
     """
 
+    # Fetching a thread costs 10 of the 250 quota units per user and second
+    _prefetch_concurrency = 10
+
     @classmethod
     async def create(
         cls, access_token: str, config: Optional[Dict[str, Any]] = None
@@ -58,7 +62,9 @@ class GmailSource(BaseSource):
         logger.info(f"Making authenticated GET request to: {url} with params: {params}")
         headers = {"Authorization": f"Bearer {self.access_token}"}
         try:
-            response = await client.get(url, headers=headers, params=params)
+            response = await self._send_rate_limited(
+                self.access_token, lambda: client.get(url, headers=headers, params=params)
+            )
             response.raise_for_status()
             data = response.json()
             logger.info(f"Received response from {url} - Status: {response.status_code}")
@@ -86,91 +92,16 @@ class GmailSource(BaseSource):
             threads = data.get("threads", [])
             logger.info(f"Found {len(threads)} threads on page {page_count}")
 
-            for thread_idx, thread_info in enumerate(threads):
+            # Thread details are fetched ahead while earlier threads are processed
+            thread_ids = [thread_info["id"] for thread_info in threads]
+            async for thread_id, thread_data in self.prefetch(
+                thread_ids, lambda thread_id: self._fetch_thread(client, thread_id)
+            ):
                 thread_count += 1
-                thread_id = thread_info["id"]
-                logger.info(f"Processing thread #{thread_idx + 1}/{len(threads)} (ID: {thread_id})")
-
-                # Fetch full thread detail
-                detail_url = f"{base_url}/{thread_id}"
-                logger.info(f"Fetching full thread details from: {detail_url}")
-                thread_data = await self._get_with_auth(client, detail_url)
-
-                # Collect thread information
-                snippet = thread_data.get("snippet", "")
-                history_id = thread_data.get("historyId")
-                message_list = thread_data.get("messages", [])
-
-                logger.info(f"Thread {thread_id} contains {len(message_list)} messages")
-                logger.debug(f"Thread snippet: {snippet[:50]}...")
-                logger.debug(f"Thread history ID: {history_id}")
-
-                # Calculate message count
-                message_count = len(message_list)
-
-                # Find last message date
-                last_message_date = None
-                if message_list:
-                    logger.debug("Sorting messages by date to find most recent")
-                    sorted_msgs = sorted(
-                        message_list, key=lambda m: int(m.get("internalDate", 0)), reverse=True
-                    )
-                    last_message_date_ms = sorted_msgs[0].get("internalDate")
-                    if last_message_date_ms:
-                        last_message_date = datetime.utcfromtimestamp(
-                            int(last_message_date_ms) / 1000
-                        )
-                        logger.debug(f"Last message date: {last_message_date}")
-
-                # Get label IDs from first message if available
-                label_ids = []
-                if message_list:
-                    label_ids = message_list[0].get("labelIds", [])
-                    logger.debug(f"Thread labels: {label_ids}")
-
-                # Create thread entity
-                logger.info(f"Creating thread entity for thread ID: {thread_id}")
-                thread_entity = GmailThreadEntity(
-                    entity_id=thread_id,
-                    breadcrumbs=[],  # Thread is top-level
-                    snippet=snippet,
-                    history_id=history_id,
-                    message_count=message_count,
-                    label_ids=label_ids,
-                    last_message_date=last_message_date,
-                )
-                logger.debug(f"Thread entity created: {thread_entity.dict()}")
-                yield thread_entity
-                logger.info(f"Thread entity yielded: {thread_id}")
-
-                # Create thread breadcrumb for messages
-                thread_breadcrumb = Breadcrumb(
-                    entity_id=thread_id,
-                    name=snippet[:50] + "..." if len(snippet) > 50 else snippet,
-                    type="thread",
-                )
-                logger.debug(f"Created thread breadcrumb: {thread_breadcrumb}")
-
-                # Process each message in the thread
-                logger.info(f"Processing {len(message_list)} messages in thread {thread_id}")
-                for msg_idx, message_data in enumerate(message_list):
-                    msg_id = message_data.get("id", "unknown")
-                    msg_info = (
-                        f"Processing message #{msg_idx + 1}/{len(message_list)} "
-                        f"(ID: {msg_id}) in thread {thread_id}"
-                    )
-                    logger.info(msg_info)
-
-                    msg_entity_count = 0
-                    async for entity in self._process_message(
-                        client, message_data, thread_id, thread_breadcrumb
-                    ):
-                        msg_entity_count += 1
-                        entity_type = type(entity).__name__
-                        logger.info(f"Yielding {entity_type} entity from message {msg_id}")
-                        yield entity
+                logger.info(f"Processing thread #{thread_count} (ID: {thread_id})")
 
-                    logger.info(f"Yielded {msg_entity_count} entities for message {msg_id}")
+                async for entity in self._generate_thread(client, thread_id, thread_data):
+                    yield entity
 
             # Handle pagination
             next_page_token = data.get("nextPageToken")
@@ -185,6 +116,167 @@ class GmailSource(BaseSource):
             logger.info(f"Found next page token: {next_page_token[:10]}...")
             params["pageToken"] = next_page_token
 
+    async def _fetch_thread(self, client: httpx.AsyncClient, thread_id: str) -> Dict:
+        """Fetch the full details of a thread, including its messages."""
+        detail_url = f"https://gmail.googleapis.com/gmail/v1/users/me/threads/{thread_id}"
+        logger.info(f"Fetching full thread details from: {detail_url}")
+        return await self._get_with_auth(client, detail_url)
+
+    async def _generate_thread(
+        self, client: httpx.AsyncClient, thread_id: str, thread_data: Dict
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate the GmailThreadEntity of a fetched thread and its message entities."""
+        # Collect thread information
+        snippet = thread_data.get("snippet", "")
+        history_id = thread_data.get("historyId")
+        message_list = thread_data.get("messages", [])
+
+        logger.info(f"Thread {thread_id} contains {len(message_list)} messages")
+        logger.debug(f"Thread snippet: {snippet[:50]}...")
+        logger.debug(f"Thread history ID: {history_id}")
+
+        # Calculate message count
+        message_count = len(message_list)
+
+        # Find last message date
+        last_message_date = None
+        if message_list:
+            logger.debug("Sorting messages by date to find most recent")
+            sorted_msgs = sorted(
+                message_list, key=lambda m: int(m.get("internalDate", 0)), reverse=True
+            )
+            last_message_date_ms = sorted_msgs[0].get("internalDate")
+            if last_message_date_ms:
+                last_message_date = datetime.utcfromtimestamp(int(last_message_date_ms) / 1000)
+                logger.debug(f"Last message date: {last_message_date}")
+
+        # Get label IDs from first message if available
+        label_ids = []
+        if message_list:
+            label_ids = message_list[0].get("labelIds", [])
+            logger.debug(f"Thread labels: {label_ids}")
+
+        # Create thread entity
+        logger.info(f"Creating thread entity for thread ID: {thread_id}")
+        thread_entity = GmailThreadEntity(
+            entity_id=thread_id,
+            breadcrumbs=[],  # Thread is top-level
+            snippet=snippet,
+            history_id=history_id,
+            message_count=message_count,
+            label_ids=label_ids,
+            last_message_date=last_message_date,
+        )
+        logger.debug(f"Thread entity created: {thread_entity.dict()}")
+        yield thread_entity
+        logger.info(f"Thread entity yielded: {thread_id}")
+
+        # Create thread breadcrumb for messages
+        thread_breadcrumb = Breadcrumb(
+            entity_id=thread_id,
+            name=snippet[:50] + "..." if len(snippet) > 50 else snippet,
+            type="thread",
+        )
+        logger.debug(f"Created thread breadcrumb: {thread_breadcrumb}")
+
+        # Process each message in the thread
+        logger.info(f"Processing {len(message_list)} messages in thread {thread_id}")
+        for msg_idx, message_data in enumerate(message_list):
+            msg_id = message_data.get("id", "unknown")
+            msg_info = (
+                f"Processing message #{msg_idx + 1}/{len(message_list)} "
+                f"(ID: {msg_id}) in thread {thread_id}"
+            )
+            logger.info(msg_info)
+
+            msg_entity_count = 0
+            async for entity in self._process_message(
+                client, message_data, thread_id, thread_breadcrumb
+            ):
+                msg_entity_count += 1
+                entity_type = type(entity).__name__
+                logger.info(f"Yielding {entity_type} entity from message {msg_id}")
+                yield entity
+
+            logger.info(f"Yielded {msg_entity_count} entities for message {msg_id}")
+
+    async def _get_history_id(self, client: httpx.AsyncClient) -> Optional[str]:
+        """Get the current history ID of the mailbox."""
+        profile = await self._get_with_auth(
+            client, "https://gmail.googleapis.com/gmail/v1/users/me/profile"
+        )
+        return profile.get("historyId")
+
+    async def _list_history_changes(
+        self, client: httpx.AsyncClient, start_history_id: str
+    ) -> Tuple[Dict[str, Set[str]], Set[str], Optional[str]]:
+        """List the mailbox changes since a history ID.
+
+        Args:
+            client: HTTP client
+            start_history_id: The history ID stored by the previous sync
+
+        Returns:
+            The IDs of threads with added, deleted or relabeled messages mapped to the IDs of
+            their changed messages, the IDs of deleted messages and the latest history ID
+        """
+        url = "https://gmail.googleapis.com/gmail/v1/users/me/history"
+        params = {
+            "startHistoryId": start_history_id,
+            "maxResults": 500,
+            "historyTypes": ["messageAdded", "messageDeleted", "labelAdded", "labelRemoved"],
+        }
+        changed_threads: Dict[str, Set[str]] = {}
+        deleted_message_ids: Set[str] = set()
+
+        while True:
+            data = await self._get_with_auth(client, url, params=params)
+            for record in data.get("history", []):
+                for key in ("messagesAdded", "messagesDeleted", "labelsAdded", "labelsRemoved"):
+                    for change in record.get(key, []):
+                        message = change["message"]
+                        changed_threads.setdefault(message["threadId"], set()).add(message["id"])
+                for change in record.get("messagesDeleted", []):
+                    deleted_message_ids.add(change["message"]["id"])
+
+            next_page_token = data.get("nextPageToken")
+            if not next_page_token:
+                return changed_threads, deleted_message_ids, data.get("historyId")
+            params["pageToken"] = next_page_token
+
+    def _mark_message_deleted(self, message_id: str) -> None:
+        """Report a deleted message, together with its attachments."""
+        self.mark_deleted(message_id, child_prefix=f"{message_id}_")
+
+    async def _generate_changed_thread_entities(
+        self, client: httpx.AsyncClient, changed_threads: Dict[str, Set[str]]
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate the entities of changed threads, reporting threads that were deleted.
+
+        Deleting a thread deletes each of its messages, which the history reports as deleted
+        messages. The messages of a deleted thread that appear in the history are reported
+        here as well, in case the history only listed them as added or relabeled.
+        """
+
+        async def fetch_changed_thread(thread_id: str) -> Optional[Dict]:
+            try:
+                return await self._fetch_thread(client, thread_id)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+                return None
+
+        async for thread_id, thread_data in self.prefetch(changed_threads, fetch_changed_thread):
+            if thread_data is None:
+                logger.info(f"Thread {thread_id} was deleted")
+                self.mark_deleted(thread_id)
+                for message_id in changed_threads[thread_id]:
+                    self._mark_message_deleted(message_id)
+                continue
+
+            async for entity in self._generate_thread(client, thread_id, thread_data):
+                yield entity
+
     async def _process_message(  # noqa: C901
         self,
         client: httpx.AsyncClient,
@@ -528,15 +620,58 @@ class GmailSource(BaseSource):
         safe_name = "".join(c for c in filename if c.isalnum() or c in "._- ")
         return safe_name.strip()
 
+    async def _generate_delta_entities(
+        self, client: httpx.AsyncClient
+    ) -> Optional[AsyncGenerator[ChunkEntity, None]]:
+        """Get the entities changed since the history ID stored by the previous sync.
+
+        Returns:
+            The changed entities, or None if a full sync is needed because there is no stored
+            history ID or it has expired (Gmail keeps about a week of history)
+        """
+        start_history_id = self.get_cursor().get("history_id")
+        if not start_history_id:
+            return None
+
+        try:
+            changed_threads, deleted_message_ids, history_id = await self._list_history_changes(
+                client, start_history_id
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            logger.warning(f"History ID {start_history_id} expired, running a full sync")
+            return None
+
+        logger.info(
+            f"Found {len(changed_threads)} changed threads and "
+            f"{len(deleted_message_ids)} deleted messages since history ID {start_history_id}"
+        )
+        self.mark_incremental()
+        for message_id in deleted_message_ids:
+            self._mark_message_deleted(message_id)
+        self.get_cursor()["history_id"] = history_id or start_history_id
+        return self._generate_changed_thread_entities(client, changed_threads)
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate all Gmail entities: Threads, Messages, and Attachments."""
+        """Generate all Gmail entities: Threads, Messages, and Attachments.
+
+        After the first sync, only threads changed since the history ID stored by the
+        previous sync are read.
+        """
         logger.info("===== STARTING GMAIL ENTITY GENERATION =====")
         entity_count = 0
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client_pool.client() as client:
                 logger.info("HTTP client created, starting entity generation")
-                # Generate thread entities (which also generates messages and attachments)
-                async for entity in self._generate_thread_entities(client):
+                entities = await self._generate_delta_entities(client)
+                if entities is None:
+                    # Changes made while the mailbox is read are picked up by the next sync
+                    self.get_cursor()["history_id"] = await self._get_history_id(client)
+                    # Generate thread entities (which also generates messages and attachments)
+                    entities = self._generate_thread_entities(client)
+
+                async for entity in entities:
                     entity_count += 1
                     entity_type = type(entity).__name__
                     logger.info(
@@ -20,6 +20,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import Breadcrumb, ChunkEntity
@@ -62,7 +63,9 @@ class GoogleCalendarSource(BaseSource):
     ) -> Dict:
         """Make an authenticated GET request to the Google Calendar API."""
         headers = {"Authorization": f"Bearer {self.access_token}"}
-        response = await client.get(url, headers=headers, params=params)
+        response = await self._send_rate_limited(
+            self.access_token, lambda: client.get(url, headers=headers, params=params)
+        )
         response.raise_for_status()
         return response.json()
 
@@ -72,7 +75,9 @@ class GoogleCalendarSource(BaseSource):
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
         }
-        response = await client.post(url, headers=headers, json=json_data)
+        response = await self._send_rate_limited(
+            self.access_token, lambda: client.post(url, headers=headers, json=json_data)
+        )
         response.raise_for_status()
         return response.json()
 
@@ -229,7 +234,7 @@ class GoogleCalendarSource(BaseSource):
           - Events for each calendar
           - FreeBusy data for each calendar (7-day window)
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # 1) Get the user's calendarList
             #    For each item, yield a CalendarList entity and store in memory for subsequent calls
             calendar_list_entries: List[GoogleCalendarListEntity] = []
@@ -19,6 +19,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -26,6 +27,13 @@ from airweave.platform.entities._base import ChunkEntity
 from airweave.platform.entities.google_drive import GoogleDriveDriveEntity, GoogleDriveFileEntity
 from airweave.platform.sources._base import BaseSource
 
+# File fields requested from the files and changes endpoints
+FILE_FIELDS = (
+    "id, name, mimeType, description, starred, trashed, explicitlyTrashed, parents, shared, "
+    "webViewLink, iconLink, createdTime, modifiedTime, size, md5Checksum, webContentLink"
+)
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
 
 @source(
     name="Google Drive",
@@ -54,6 +62,9 @@ class GoogleDriveSource(BaseSource):
 
         instance.exclude_patterns = config.get("exclude_patterns", [])
 
+        # Folder metadata by id, used to resolve file paths during this sync
+        instance._folders = {}
+
         return instance
 
     @retry(
@@ -68,7 +79,10 @@ class GoogleDriveSource(BaseSource):
         headers = {"Authorization": f"Bearer {self.access_token}"}
         try:
             # Add a longer timeout (30 seconds)
-            resp = await client.get(url, headers=headers, params=params, timeout=30.0)
+            resp = await self._send_rate_limited(
+                self.access_token,
+                lambda: client.get(url, headers=headers, params=params, timeout=30.0),
+            )
             logger.info(f"Request URL: {url}")  # Changed from error to info level
             resp.raise_for_status()
             return resp.json()
@@ -151,9 +165,7 @@ class GoogleDriveSource(BaseSource):
             "includeItemsFromAllDrives": str(include_all_drives).lower(),
             "supportsAllDrives": "true",
             "q": "mimeType != 'application/vnd.google-apps.folder'",
-            "fields": "nextPageToken, files(id, name, mimeType, description, starred, trashed, "
-            "explicitlyTrashed, parents, shared, webViewLink, iconLink, createdTime, "
-            "modifiedTime, size, md5Checksum, webContentLink)",
+            "fields": f"nextPageToken, files({FILE_FIELDS})",
         }
 
         if drive_id:
@@ -235,26 +247,9 @@ class GoogleDriveSource(BaseSource):
             client, corpora, include_all_drives, drive_id, context
         ):
             try:
-                # Check if file should be included based on exclusion patterns
-                if not await self._should_include_file(client, file_obj):
-                    continue  # Skip this file
-
-                # Get file entity (might be None for trashed files)
-                file_entity = self._build_file_entity(file_obj)
-
-                # Skip if the entity was None (likely a trashed file)
-                if not file_entity:
-                    continue
-
-                # Process the entity if it has a download URL
-                if file_entity.download_url:
-                    processed_entity = await self.process_file_entity(
-                        file_entity=file_entity, access_token=self.access_token
-                    )
+                processed_entity = await self._process_file(client, file_obj)
+                if processed_entity:
                     yield processed_entity
-                else:
-                    # This should never happen now that we return None for files without URLs
-                    logger.warning(f"No download URL available for {file_entity.name}")
             except Exception as e:
                 error_context = f"in drive {drive_id}" if drive_id else "in MY DRIVE"
                 logger.error(
@@ -263,6 +258,80 @@ class GoogleDriveSource(BaseSource):
                 )
                 raise
 
+    async def _process_file(
+        self, client: httpx.AsyncClient, file_obj: Dict
+    ) -> Optional[ChunkEntity]:
+        """Build and download a file entity, or return None if the file is skipped."""
+        # Check if file should be included based on exclusion patterns
+        if not await self._should_include_file(client, file_obj):
+            return None  # Skip this file
+
+        # Get file entity (might be None for trashed files)
+        file_entity = self._build_file_entity(file_obj)
+
+        # Skip if the entity was None (likely a trashed file)
+        if not file_entity:
+            return None
+
+        # Process the entity if it has a download URL
+        if file_entity.download_url:
+            return await self.process_file_entity(
+                file_entity=file_entity, access_token=self.access_token
+            )
+
+        # This should never happen now that we return None for files without URLs
+        logger.warning(f"No download URL available for {file_entity.name}")
+        return None
+
+    async def _get_start_page_token(self, client: httpx.AsyncClient) -> Optional[str]:
+        """Get the page token from which the changes API lists future changes."""
+        data = await self._get_with_auth(
+            client,
+            "https://www.googleapis.com/drive/v3/changes/startPageToken",
+            params={"supportsAllDrives": "true"},
+        )
+        return data.get("startPageToken")
+
+    async def _generate_changed_file_entities(
+        self, client: httpx.AsyncClient, page_token: str
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate entities for files changed since a page token of the changes API.
+
+        Removed and trashed files are reported as deleted. The token for the next sync is
+        stored in the cursor once all changes were listed.
+        """
+        url = "https://www.googleapis.com/drive/v3/changes"
+        params = {
+            "pageToken": page_token,
+            "pageSize": 100,
+            "includeItemsFromAllDrives": "true",
+            "supportsAllDrives": "true",
+            "includeRemoved": "true",
+            "fields": (
+                "nextPageToken, newStartPageToken, "
+                f"changes(changeType, removed, fileId, file({FILE_FIELDS}))"
+            ),
+        }
+
+        while True:
+            data = await self._get_with_auth(client, url, params=params)
+            for change in data.get("changes", []):
+                if change.get("changeType", "file") != "file":
+                    continue
+
+                file_obj = change.get("file") or {}
+                if change.get("removed") or file_obj.get("trashed"):
+                    self.mark_deleted(change["fileId"])
+                elif file_obj.get("mimeType") != FOLDER_MIME_TYPE:
+                    processed_entity = await self._process_file(client, file_obj)
+                    if processed_entity:
+                        yield processed_entity
+
+            if data.get("newStartPageToken"):
+                self.get_cursor()["page_token"] = data["newStartPageToken"]
+                return
+            params["pageToken"] = data["nextPageToken"]
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all Google Drive entities.
 
@@ -270,51 +339,122 @@ class GoogleDriveSource(BaseSource):
           - Shared drives (Drive objects)
           - Files in each shared drive
           - Files in My Drive (corpora=user)
+
+        After the first sync, only files changed since the page token stored by the previous
+        sync are read from the changes API.
         """
-        async with httpx.AsyncClient() as client:
-            # For testing: count file entities yielded
-            file_entity_count = 0
-            # Testing flag - set to True to stop after first file entity
-            stop_after_first_file = False
-
-            # 1) Generate entities for shared drives
-            async for drive_entity in self._generate_drive_entities(client):
-                yield drive_entity
-
-            # 2) For each shared drive, yield file entities
-            #    We'll re-list drives in memory so we don't have to fetch them again
-            drive_ids = []
-            async for drive_obj in self._list_drives(client):
-                drive_ids.append(drive_obj["id"])
-
-            for drive_id in drive_ids:
-                async for file_entity in self._generate_file_entities(
-                    client,
-                    corpora="drive",
-                    include_all_drives=True,
-                    drive_id=drive_id,
-                    context=f"drive {drive_id}",
-                ):
+        async with http_client_pool.client() as client:
+            page_token = self.get_cursor().get("page_token")
+            if page_token:
+                # Only read the files changed since the previous sync
+                self.mark_incremental()
+                async for drive_entity in self._generate_drive_entities(client):
+                    yield drive_entity
+                async for file_entity in self._generate_changed_file_entities(client, page_token):
                     yield file_entity
-                    file_entity_count += 1
-                    if stop_after_first_file and file_entity_count >= 4:
-                        logger.info("Stopping after first file entity for testing purposes")
-                        return
-
-            # 3) Finally, yield file entities for My Drive (corpora=user)
-            # Only reach here if we didn't find any files in shared drives
-            if not (stop_after_first_file and file_entity_count >= 4):
-                async for mydrive_file_entity in self._generate_file_entities(
-                    client, corpora="user", include_all_drives=False, context="MY DRIVE"
-                ):
-                    yield mydrive_file_entity
-                    file_entity_count += 1
-                    if stop_after_first_file and file_entity_count >= 4:
-                        logger.info("Stopping after first file entity for testing purposes")
-                        return
+                return
+
+            # Changes made while the files are listed are picked up by the next sync
+            self.get_cursor()["page_token"] = await self._get_start_page_token(client)
+
+            async for entity in self._generate_all_entities(client):
+                yield entity
+
+    async def _generate_all_entities(
+        self, client: httpx.AsyncClient
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate the entities of all shared drives and files."""
+        # For testing: count file entities yielded
+        file_entity_count = 0
+        # Testing flag - set to True to stop after first file entity
+        stop_after_first_file = False
+
+        # 1) Generate entities for shared drives
+        async for drive_entity in self._generate_drive_entities(client):
+            yield drive_entity
+
+        await self._prefetch_folders(client)
+
+        # 2) For each shared drive, yield file entities
+        #    We'll re-list drives in memory so we don't have to fetch them again
+        drive_ids = []
+        async for drive_obj in self._list_drives(client):
+            drive_ids.append(drive_obj["id"])
+
+        for drive_id in drive_ids:
+            async for file_entity in self._generate_file_entities(
+                client,
+                corpora="drive",
+                include_all_drives=True,
+                drive_id=drive_id,
+                context=f"drive {drive_id}",
+            ):
+                yield file_entity
+                file_entity_count += 1
+                if stop_after_first_file and file_entity_count >= 4:
+                    logger.info("Stopping after first file entity for testing purposes")
+                    return
+
+        # 3) Finally, yield file entities for My Drive (corpora=user)
+        # Only reach here if we didn't find any files in shared drives
+        if not (stop_after_first_file and file_entity_count >= 4):
+            async for mydrive_file_entity in self._generate_file_entities(
+                client, corpora="user", include_all_drives=False, context="MY DRIVE"
+            ):
+                yield mydrive_file_entity
+                file_entity_count += 1
+                if stop_after_first_file and file_entity_count >= 4:
+                    logger.info("Stopping after first file entity for testing purposes")
+                    return
+
+    async def _prefetch_folders(self, client: httpx.AsyncClient) -> None:
+        """Cache the metadata of all folders the user can access with a bulk listing.
+
+        Paths of the files listed afterwards are then resolved without further requests.
+        Folders missing from the listing (such as the My Drive root) are fetched on demand.
+        """
+        url = "https://www.googleapis.com/drive/v3/files"
+        params = {
+            "pageSize": 1000,
+            "corpora": "allDrives",
+            "includeItemsFromAllDrives": "true",
+            "supportsAllDrives": "true",
+            "q": f"mimeType = '{FOLDER_MIME_TYPE}' and trashed = false",
+            "fields": "nextPageToken, files(id, name, parents)",
+        }
+
+        try:
+            while True:
+                data = await self._get_with_auth(client, url, params=params)
+                for folder in data.get("files", []):
+                    self._folders[folder["id"]] = folder
+
+                next_page_token = data.get("nextPageToken")
+                if not next_page_token:
+                    break
+                params["pageToken"] = next_page_token
+        except Exception as e:
+            logger.warning(f"Failed to prefetch folders, resolving them on demand: {str(e)}")
+
+        logger.info(f"Prefetched {len(self._folders)} folders")
+
+    async def _get_folder(self, client: httpx.AsyncClient, folder_id: str) -> Optional[Dict]:
+        """Get the metadata of a folder, fetching and caching it if it was not seen yet."""
+        if folder_id not in self._folders:
+            try:
+                folder_url = f"https://www.googleapis.com/drive/v3/files/{folder_id}"
+                folder_params = {"fields": "id,name,parents,mimeType", "supportsAllDrives": "true"}
+                self._folders[folder_id] = await self._get_with_auth(
+                    client, folder_url, params=folder_params
+                )
+            except Exception as e:
+                logger.error(f"Error retrieving parent folder {folder_id}: {str(e)}")
+                # Cached as well, so a folder that cannot be read is only requested once
+                self._folders[folder_id] = None
+        return self._folders[folder_id]
 
     async def _get_file_path(self, client: httpx.AsyncClient, file_obj: Dict) -> str:
-        """Get full path of file by recursively fetching parent folders."""
+        """Get full path of file by walking up the cached parent folders."""
         path_parts = [file_obj.get("name", "")]
         file_id = file_obj.get("id", "unknown")
 
@@ -328,36 +468,26 @@ class GoogleDriveSource(BaseSource):
 
         # Start with the first parent
         current_parent_id = parents[0]
-        logger.debug(f"Starting parent resolution with ID: {current_parent_id}")
 
-        # Limit recursion depth to avoid potential infinite loops
+        # Limit depth to avoid potential infinite loops
         max_depth = 20
         depth = 0
 
         while current_parent_id and depth < max_depth:
             depth += 1
-            try:
-                # Get folder information
-                folder_url = f"https://www.googleapis.com/drive/v3/files/{current_parent_id}"
-                folder_params = {"fields": "id,name,parents,mimeType"}
-                folder_data = await self._get_with_auth(client, folder_url, params=folder_params)
-
-                # If this is the root folder or My Drive, stop recursion
-                if folder_data.get("id") == "root" or not folder_data.get("parents"):
-                    path_parts.insert(0, folder_data.get("name", "") or "My Drive")
-                    break
-
-                # Add folder name to path
-                path_parts.insert(0, folder_data.get("name", ""))
-
-                # Move to parent folder
-                parents = folder_data.get("parents", [])
-                current_parent_id = parents[0] if parents else None
+            folder_data = await self._get_folder(client, current_parent_id)
+            if folder_data is None:
+                break
 
-            except Exception as e:
-                logger.error(f"Error retrieving parent folder {current_parent_id}: {str(e)}")
+            # If this is the root folder or My Drive, stop walking up
+            if folder_data.get("id") == "root" or not folder_data.get("parents"):
+                path_parts.insert(0, folder_data.get("name", "") or "My Drive")
                 break
 
+            # Add folder name to path and move to the parent folder
+            path_parts.insert(0, folder_data.get("name", ""))
+            current_parent_id = folder_data["parents"][0]
+
         # Build path string
         final_path = "/".join(path_parts)
         logger.debug(f"Final path for {file_id}: {final_path}")
@@ -4,6 +4,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import ChunkEntity
@@ -47,9 +48,12 @@ class HubspotSource(BaseSource):
         For example, to retrieve contacts:
           GET https://api.hubapi.com/crm/v3/objects/contacts
         """
-        response = await client.get(
-            url,
-            headers={"Authorization": f"Bearer {self.access_token}"},
+        response = await self._send_rate_limited(
+            self.access_token,
+            lambda: client.get(
+                url,
+                headers={"Authorization": f"Bearer {self.access_token}"},
+            ),
         )
         response.raise_for_status()
         return response.json()
@@ -178,7 +182,7 @@ class HubspotSource(BaseSource):
         Yields:
             HubSpot entities: Contacts, Companies, Deals, and Tickets.
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # Yield contact entities
             async for contact_entity in self._generate_contact_entities(client):
                 yield contact_entity
@@ -4,6 +4,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import ChunkEntity
@@ -53,7 +54,9 @@ class IntercomSource(BaseSource):
             "Authorization": f"Bearer {self.access_token}",
             "Accept": "application/json",
         }
-        response = await client.get(url, headers=headers, params=params)
+        response = await self._send_rate_limited(
+            self.access_token, lambda: client.get(url, headers=headers, params=params)
+        )
         response.raise_for_status()
         return response.json()
 
@@ -182,7 +185,7 @@ class IntercomSource(BaseSource):
         Yields:
             Intercom entities: Contacts, Companies, Conversations, and Tickets.
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # Yield contact entities
             async for contact_entity in self._generate_contact_entities(client):
                 yield contact_entity
@@ -13,6 +13,7 @@ import httpx
 import tenacity
 from tenacity import stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -44,7 +45,7 @@ class JiraSource(BaseSource):
     async def _get_accessible_resources(access_token: str) -> list[dict]:
         """Get the list of accessible Atlassian resources for this token."""
         logger.info("Retrieving accessible Atlassian resources")
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
             try:
                 logger.debug(
@@ -116,7 +117,9 @@ class JiraSource(BaseSource):
 
         logger.debug(f"Request headers: {headers}")
         try:
-            response = await client.get(url, headers=headers)
+            response = await self._send_rate_limited(
+                self.access_token, lambda: client.get(url, headers=headers)
+            )
             response.raise_for_status()
             data = response.json()
             logger.debug(f"Response status: {response.status_code}")
@@ -266,55 +269,54 @@ class JiraSource(BaseSource):
         logger.info(f"Starting issue entity generation for project: {project_key} ({project.name})")
 
         # Setup for pagination
-        search_url = f"{self.base_url}/rest/api/3/search"
-        start_at = 0
         max_results = 50
-        page = 1
         total_issues = 0
 
-        while True:
-            # Construct parameters with JQL query for the project
-            params = {
-                "jql": f"project = {project_key}",
-                "startAt": start_at,
-                "maxResults": max_results,
-                "fields": "summary,description,status,issuetype,created,updated",
-            }
-
-            # Convert params to URL query string
-            query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-            full_url = f"{search_url}?{query_string}"
-
-            logger.info(f"Fetching issues page {page} for project {project_key}")
-            data = await self._get_with_auth(client, full_url)
-
-            # Log response overview
-            total = data.get("total", 0)
+        data = await self._fetch_issue_page(client, project_key, 0, max_results)
+        total = data.get("total", 0)
+        issues = data.get("issues", [])
+        logger.info(f"Found {len(issues)} issues on page 1 (total available: {total})")
+
+        for issue_data in issues:
+            total_issues += 1
+            yield self._create_issue_entity(issue_data, project)
+
+        # Once the total is known, the remaining pages are fetched concurrently
+        async for start_at, data in self.prefetch(
+            range(max_results, total, max_results),
+            lambda start_at: self._fetch_issue_page(client, project_key, start_at, max_results),
+        ):
             issues = data.get("issues", [])
-            logger.info(f"Found {len(issues)} issues on page {page} (total available: {total})")
+            logger.info(f"Found {len(issues)} issues at startAt={start_at}")
 
-            # Process each issue
             for issue_data in issues:
                 total_issues += 1
-                issue_entity = self._create_issue_entity(issue_data, project)
-                yield issue_entity
-
-            # Check if we've processed all issues
-            start_at += max_results
-            page += 1
+                yield self._create_issue_entity(issue_data, project)
+
+        logger.info(f"Completed fetching all {total_issues} issues for project {project_key}")
+
+    async def _fetch_issue_page(
+        self, client: httpx.AsyncClient, project_key: str, start_at: int, max_results: int
+    ) -> Dict[str, Any]:
+        """Fetch one page of the JQL search for the issues of a project."""
+        params = {
+            "jql": f"project = {project_key}",
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": "summary,description,status,issuetype,created,updated",
+        }
 
-            if start_at >= total:
-                logger.info(
-                    f"Completed fetching all {total_issues} issues for project {project_key}"
-                )
-                break
+        # Convert params to URL query string
+        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        full_url = f"{self.base_url}/rest/api/3/search?{query_string}"
 
-            logger.debug(f"Moving to next page, startAt={start_at}")
+        logger.info(f"Fetching issues for project {project_key} at startAt={start_at}")
+        return await self._get_with_auth(client, full_url)
 
     async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
         """Generate all entities from Jira."""
         logger.info("Starting Jira entity generation process")
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             project_count = 0
             issue_count = 0
             # Track already processed entity IDs with their type to avoid duplicates
@@ -1,6 +1,5 @@
 """Linear source implementation for Airweave platform."""
 
-import asyncio
 import re
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 from uuid import uuid4
@@ -8,6 +7,7 @@ from uuid import uuid4
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -43,11 +43,13 @@ class LinearSource(BaseSource):
     RATE_LIMIT_PERIOD = 1.0
     MAX_RETRIES = 3
 
+    # Half of the hourly quota may be used at once before requests are paced
+    _rate_limit = REQUESTS_PER_SECOND
+    _rate_limit_burst = REQUESTS_PER_HOUR // 2
+
     def __init__(self):
         """Initialize the LinearSource with rate limiting state."""
         super().__init__()
-        self._request_times = []
-        self._lock = asyncio.Lock()
         self._stats = {
             "api_calls": 0,
             "rate_limit_waits": 0,
@@ -77,42 +79,13 @@ class LinearSource(BaseSource):
         return instance
 
     async def _wait_for_rate_limit(self):
-        """Implement adaptive rate limiting for Linear API requests.
+        """Wait for the rate limiter shared by all syncs using this Linear token.
 
-        Manages request timing to stay within API limits by dynamically
-        adjusting wait times based on current usage patterns.
+        Requests are paced at the hourly quota once it runs low, based on the
+        X-RateLimit-Requests-* headers of the responses.
         """
-        async with self._lock:
-            current_time = asyncio.get_event_loop().time()
-
-            # Track hourly request count
-            hour_ago = current_time - 3600
-            self._request_times = [t for t in self._request_times if t > hour_ago]
-            hourly_count = len(self._request_times)
-
-            # Adaptive throttling based on usage
-            wait_time = 0
-            if hourly_count >= 1000:  # >83% of quota - heavy throttling
-                wait_time = 3.0
-            elif hourly_count >= 900:  # 75-83% of quota - medium throttling
-                wait_time = 2.0
-            elif hourly_count >= 600:  # 50-75% of quota - light throttling
-                wait_time = 1.0
-
-            # Apply throttling if needed
-            if wait_time > 0 and self._request_times:
-                last_request = max(self._request_times)
-                sleep_time = last_request + wait_time - current_time
-                if sleep_time > 0:
-                    logger.debug(
-                        f"Rate limit throttling ({hourly_count}/1200 requests). "
-                        f"Waiting {sleep_time:.2f}s"
-                    )
-                    self._stats["rate_limit_waits"] += 1
-                    await asyncio.sleep(sleep_time)
-
-            # Record this request
-            self._request_times.append(current_time)
+        if await self.get_rate_limiter(self.access_token).acquire() > 0:
+            self._stats["rate_limit_waits"] += 1
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def _post_with_auth(self, client: httpx.AsyncClient, query: str) -> Dict:
@@ -140,13 +113,11 @@ class LinearSource(BaseSource):
                 },
                 json={"query": query},
             )
+            await self.get_rate_limiter(self.access_token).update_from_headers(
+                response.status_code, response.headers
+            )
             response.raise_for_status()
 
-            # Monitor rate limit status
-            if "X-RateLimit-Requests-Remaining" in response.headers:
-                remaining = int(response.headers.get("X-RateLimit-Requests-Remaining", "0"))
-                logger.debug(f"Rate limit remaining: {remaining}")
-
             return response.json()
         except httpx.HTTPStatusError as e:
             # Log error details
@@ -763,7 +734,7 @@ class LinearSource(BaseSource):
         Yields:
             All Linear entities (teams, projects, users, issues, attachments)
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # Generate team entities
             try:
                 logger.info("Starting team entity generation")
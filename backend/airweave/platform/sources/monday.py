@@ -9,6 +9,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.configs.auth import MondayAuthConfig
@@ -454,7 +455,7 @@ class MondaySource(BaseSource):
             - Subitems per item
             - Updates per item or board
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # 1) Boards
             async for board_entity in self._generate_board_entities(client):
                 yield board_entity
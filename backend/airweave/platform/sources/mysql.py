@@ -6,10 +6,11 @@ using the PolymorphicEntity system.
 """
 
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Type
 
 import aiomysql
 
+from airweave.core.config import settings
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import ChunkEntity, PolymorphicEntity
@@ -64,6 +65,7 @@ class MySQLSource(BaseSource):
         """Initialize the MySQL source."""
         self.pool: Optional[aiomysql.Pool] = None
         self.entity_classes: Dict[str, Type[PolymorphicEntity]] = {}
+        self.incremental_column: str = ""
 
     @classmethod
     async def create(
@@ -84,6 +86,7 @@ class MySQLSource(BaseSource):
         """
         instance = cls()
         instance.config = credentials.model_dump()
+        instance.incremental_column = (config or {}).get("incremental_column") or ""
         return instance
 
     async def _connect(self) -> None:
@@ -203,8 +206,163 @@ class MySQLSource(BaseSource):
                 tables = await cursor.fetchall()
                 return [table[0] for table in tables]
 
+    def _build_batch_query(
+        self,
+        schema: str,
+        table: str,
+        primary_keys: List[str],
+        last_key: Optional[Tuple[Any, ...]],
+        offset: int,
+        watermark: Optional[Tuple[str, Any]] = None,
+        columns: str = "*",
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        """Build the query for the next batch of rows of a table.
+
+        Tables with a primary key are paged by key (keyset pagination), so every batch is
+        an index range scan. Tables without a primary key fall back to LIMIT/OFFSET.
+
+        Args:
+            schema: Schema name
+            table: Table name
+            primary_keys: Primary key columns of the table
+            last_key: Primary key values of the last row of the previous batch
+            offset: Number of rows already fetched
+            watermark: Optional incremental column and the value from which rows are read
+            columns: The columns to select
+
+        Returns:
+            The query and its parameters
+        """
+        conditions = []
+        params: List[Any] = []
+        if watermark is not None:
+            # Rows at the watermark itself are read again, as more of them may have been written
+            conditions.append(f"`{watermark[0]}` >= %s")
+            params.append(watermark[1])
+
+        key_columns = ", ".join(f"`{pk}`" for pk in primary_keys)
+        if primary_keys and last_key is not None:
+            placeholders = ", ".join(["%s"] * len(primary_keys))
+            conditions.append(f"({key_columns}) > ({placeholders})")
+            params.extend(last_key)
+
+        query = f"SELECT {columns} FROM `{schema}`.`{table}`"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        batch_size = settings.SQL_SOURCE_BATCH_SIZE
+        if primary_keys:
+            query += f" ORDER BY {key_columns} LIMIT {batch_size}"
+        else:
+            query += f" LIMIT {batch_size} OFFSET {offset}"
+        return query, tuple(params)
+
+    def _get_watermark(
+        self,
+        schema: str,
+        table: str,
+        entity_class: Type[PolymorphicEntity],
+        primary_keys: List[str],
+    ) -> Tuple[Optional[str], Optional[Tuple[str, Any]]]:
+        """Get the incremental column of a table and the watermark of the previous sync.
+
+        Tables without a primary key are always read completely, as their deleted rows
+        cannot be found from a listing of their keys.
+
+        Returns:
+            The incremental column (None if the table does not have it) and the column with
+            the stored watermark (None on the first sync of the table)
+        """
+        column = self.incremental_column
+        if not column or column not in entity_class.model_fields or not primary_keys:
+            return None, None
+
+        watermark = self.get_cursor().get("watermarks", {}).get(f"{schema}.{table}")
+        if watermark is None:
+            return column, None
+        return column, (column, watermark)
+
+    async def _generate_table_entities(
+        self, cursor: aiomysql.Cursor, schema: str, table: str
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate entities for the rows of a table and advance its watermark."""
+        entity_class = self.entity_classes[f"{schema}.{table}"]
+        primary_keys = entity_class.model_fields["primary_key_columns"].default_factory()
+        watermark_column, watermark = self._get_watermark(schema, table, entity_class, primary_keys)
+
+        new_watermark = None
+        last_key = None
+        offset = 0
+
+        while True:
+            batch_query, params = self._build_batch_query(
+                schema, table, primary_keys, last_key, offset, watermark
+            )
+            await cursor.execute(batch_query, params or None)
+            records = await cursor.fetchall()
+
+            # Break if no more records
+            if not records:
+                break
+
+            # Get column names from cursor description
+            columns = [column[0] for column in cursor.description]
+
+            # Process the batch
+            for record in records:
+                # Convert record to dictionary using column names
+                data = dict(zip(columns, record, strict=False))
+                pk_values = [str(data[pk]) for pk in primary_keys]
+                entity_id = f"{schema}.{table}:" + ":".join(pk_values)
+
+                value = data.get(watermark_column) if watermark_column else None
+                if value is not None and (new_watermark is None or value > new_watermark):
+                    new_watermark = value
+
+                entity = entity_class(entity_id=entity_id, **data)
+                yield entity
+
+            # Continue after the last row of this batch
+            last_key = tuple(data[pk] for pk in primary_keys)
+            offset += len(records)
+
+        if watermark is not None:
+            await self._mark_rows_present(cursor, schema, table, primary_keys)
+        if new_watermark is not None:
+            watermarks = self.get_cursor().setdefault("watermarks", {})
+            watermarks[f"{schema}.{table}"] = (
+                new_watermark if isinstance(new_watermark, (int, float)) else str(new_watermark)
+            )
+
+    async def _mark_rows_present(
+        self, cursor: aiomysql.Cursor, schema: str, table: str, primary_keys: List[str]
+    ) -> None:
+        """Report every row of a table as present, reading only its primary keys.
+
+        Rows that were not changed since the watermark are not generated, so this listing
+        is what keeps them from being deleted, while deleted rows are still removed.
+        """
+        key_columns = ", ".join(f"`{pk}`" for pk in primary_keys)
+        last_key = None
+        while True:
+            query, params = self._build_batch_query(
+                schema, table, primary_keys, last_key, 0, columns=key_columns
+            )
+            await cursor.execute(query, params or None)
+            records = await cursor.fetchall()
+            if not records:
+                break
+            for record in records:
+                self.mark_present(f"{schema}.{table}:" + ":".join(str(value) for value in record))
+            last_key = tuple(records[-1])
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate entities for all tables in specified schemas."""
+        """Generate entities for all tables in specified schemas.
+
+        All tables are read in one consistent-snapshot transaction, so every query sees the
+        same snapshot and rows committed while the tables are read are picked up by the next
+        sync instead of being skipped by a watermark that already passed them.
+        """
         try:
             await self._connect()
 
@@ -225,52 +383,25 @@ class MySQLSource(BaseSource):
                         f"Tables not found in schema '{schema}': {', '.join(invalid_tables)}"
                     )
 
+            for table in tables:
+                # Create entity class if not already created
+                if f"{schema}.{table}" not in self.entity_classes:
+                    self.entity_classes[f"{schema}.{table}"] = await self._create_entity_class(
+                        schema, table
+                    )
+
             async with self.pool.acquire() as conn:
                 async with conn.cursor() as cursor:
-                    for table in tables:
-                        # Create entity class if not already created
-                        if f"{schema}.{table}" not in self.entity_classes:
-                            self.entity_classes[
-                                f"{schema}.{table}"
-                            ] = await self._create_entity_class(schema, table)
-
-                        entity_class = self.entity_classes[f"{schema}.{table}"]
-
-                        # Fetch and yield data
-                        BATCH_SIZE = 50
-                        offset = 0
-
-                        while True:
-                            # Fetch records in batches using LIMIT and OFFSET
-                            batch_query = f"""
-                                SELECT *
-                                FROM `{schema}`.`{table}`
-                                LIMIT {BATCH_SIZE} OFFSET {offset}
-                            """
-                            await cursor.execute(batch_query)
-                            records = await cursor.fetchall()
-
-                            # Break if no more records
-                            if not records:
-                                break
-
-                            # Get column names from cursor description
-                            columns = [column[0] for column in cursor.description]
-
-                            # Process the batch
-                            for record in records:
-                                # Convert record to dictionary using column names
-                                data = dict(zip(columns, record, strict=False))
-                                model_fields = entity_class.model_fields
-                                primary_keys = model_fields["primary_key_columns"].default_factory()
-                                pk_values = [str(data[pk]) for pk in primary_keys]
-                                entity_id = f"{schema}.{table}:" + ":".join(pk_values)
-
-                                entity = entity_class(entity_id=entity_id, **data)
+                    await cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                    await cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+                    try:
+                        for table in tables:
+                            async for entity in self._generate_table_entities(
+                                cursor, schema, table
+                            ):
                                 yield entity
-
-                            # Increment offset for next batch
-                            offset += BATCH_SIZE
+                    finally:
+                        await conn.rollback()
 
         finally:
             if self.pool:
@@ -5,15 +5,27 @@ with full aggregated content from Notion, handling API rate limits, and converti
 responses to entity objects.
 """
 
-import asyncio
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 import httpx
 from httpx import ReadTimeout, TimeoutException
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -45,6 +57,11 @@ class NotionSource(BaseSource):
     RATE_LIMIT_PERIOD = 1.0  # Time period in seconds
     MAX_RETRIES = 3
 
+    # Pages are built concurrently up to the request rate limit
+    _prefetch_concurrency = RATE_LIMIT_REQUESTS
+    _rate_limit = RATE_LIMIT_REQUESTS / RATE_LIMIT_PERIOD
+    _rate_limit_burst = RATE_LIMIT_REQUESTS
+
     @classmethod
     async def create(cls, credentials, config: Optional[Dict[str, Any]] = None) -> "NotionSource":
         """Create a new Notion source."""
@@ -56,8 +73,6 @@ class NotionSource(BaseSource):
     def __init__(self):
         """Initialize rate limiting state and tracking."""
         super().__init__()
-        self._request_times = []
-        self._lock = asyncio.Lock()
         self._processed_pages: Set[str] = set()
         self._processed_databases: Set[str] = set()
         self._child_databases_to_process: Set[str] = set()
@@ -75,32 +90,9 @@ class NotionSource(BaseSource):
         logger.info("Initialized comprehensive Notion source with content aggregation")
 
     async def _wait_for_rate_limit(self):
-        """Implement rate limiting for Notion API requests."""
-        async with self._lock:
-            current_time = asyncio.get_event_loop().time()
-
-            # Remove old request times
-            self._request_times = [
-                t for t in self._request_times if current_time - t < self.RATE_LIMIT_PERIOD
-            ]
-
-            if len(self._request_times) >= self.RATE_LIMIT_REQUESTS:
-                # Wait until enough time has passed
-                sleep_time = self._request_times[0] + self.RATE_LIMIT_PERIOD - current_time
-                if sleep_time > 0:
-                    logger.debug(
-                        f"Rate limit reached. Waiting {sleep_time:.2f}s before next request"
-                    )
-                    self._stats["rate_limit_waits"] += 1
-                    await asyncio.sleep(sleep_time)
-
-                # Clean up old requests again after waiting
-                current_time = asyncio.get_event_loop().time()
-                self._request_times = [
-                    t for t in self._request_times if current_time - t < self.RATE_LIMIT_PERIOD
-                ]
-
-            self._request_times.append(current_time)
+        """Wait for the rate limiter shared by all syncs using this Notion token."""
+        if await self.get_rate_limiter(self.access_token).acquire() > 0:
+            self._stats["rate_limit_waits"] += 1
 
     @retry(
         retry=retry_if_exception_type((TimeoutException, ReadTimeout)),
@@ -128,6 +120,9 @@ class NotionSource(BaseSource):
                 )
                 logger.debug(f"Response body: {response.text[:200]}...")
 
+            await self.get_rate_limiter(self.access_token).update_from_headers(
+                response.status_code, response.headers
+            )
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -162,6 +157,9 @@ class NotionSource(BaseSource):
                 )
                 logger.debug(f"Response body: {response.text[:200]}...")
 
+            await self.get_rate_limiter(self.access_token).update_from_headers(
+                response.status_code, response.headers
+            )
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -268,37 +266,14 @@ class NotionSource(BaseSource):
             database_entity = self._create_database_entity(schema)
             yield database_entity
 
-            # Query all pages in the database
-            async for page in self._query_database_pages(client, database_id):
-                page_id = page["id"]
-                if page_id in self._processed_pages:
-                    continue
-
-                try:
-                    # Create breadcrumbs for database pages
-                    breadcrumbs = [
-                        Breadcrumb(
-                            entity_id=database_id, name=database_entity.title, type="database"
-                        )
-                    ]
-
-                    # Create comprehensive page entity with aggregated content
-                    page_entity, files = await self._create_comprehensive_page_entity(
-                        client, page, breadcrumbs, database_id, schema
-                    )
-                    yield page_entity
-
-                    # Process and yield file entities with downloaded files
-                    for file_entity in files:
-                        processed_file = await self._process_and_yield_file(file_entity)
-                        if processed_file:
-                            yield processed_file
-
-                    self._processed_pages.add(page_id)
-
-                except Exception as e:
-                    logger.error(f"Error processing database page {page_id}: {str(e)}")
-                    continue
+            # Create breadcrumbs for database pages
+            breadcrumbs = [
+                Breadcrumb(entity_id=database_id, name=database_entity.title, type="database")
+            ]
+            async for entity in self._generate_database_page_entities(
+                client, database_id, schema, breadcrumbs
+            ):
+                yield entity
 
     async def _query_database_pages(
         self, client: httpx.AsyncClient, database_id: str
@@ -334,44 +309,29 @@ class NotionSource(BaseSource):
         """Process pages that are not in databases with full content aggregation."""
         logger.info("Phase 4: Processing standalone pages with aggregation")
 
-        for page in all_pages:
-            page_id = page["id"]
-            if page_id in self._processed_pages:
-                continue
-
-            parent = page.get("parent", {})
-            parent_type = parent.get("type", "")
-
-            # Skip database pages (already processed)
-            if parent_type == "database_id":
-                continue
-
-            try:
-                # Get full page details
-                full_page = await self._get_with_auth(
-                    client, f"https://api.notion.com/v1/pages/{page_id}"
-                )
-
-                # Build breadcrumbs for standalone pages
-                breadcrumbs = await self._build_page_breadcrumbs(client, full_page)
-
-                # Create comprehensive page entity with aggregated content
-                page_entity, files = await self._create_comprehensive_page_entity(
-                    client, full_page, breadcrumbs
-                )
-                yield page_entity
+        # Database pages were already processed
+        standalone_pages = [
+            page
+            for page in all_pages
+            if page["id"] not in self._processed_pages
+            and page.get("parent", {}).get("type", "") != "database_id"
+        ]
+
+        async def build_standalone_page(page: dict):
+            # Get full page details
+            full_page = await self._get_with_auth(
+                client, f"https://api.notion.com/v1/pages/{page['id']}"
+            )
 
-                # Process and yield file entities with downloaded files
-                for file_entity in files:
-                    processed_file = await self._process_and_yield_file(file_entity)
-                    if processed_file:
-                        yield processed_file
+            # Build breadcrumbs for standalone pages
+            breadcrumbs = await self._build_page_breadcrumbs(client, full_page)
 
-                self._processed_pages.add(page_id)
+            return await self._create_comprehensive_page_entity(client, full_page, breadcrumbs)
 
-            except Exception as e:
-                logger.error(f"Error processing standalone page {page_id}: {str(e)}")
-                continue
+        async for entity in self._generate_prefetched_page_entities(
+            standalone_pages, build_standalone_page
+        ):
+            yield entity
 
     # Phase 5: Child Database Processing
     async def _process_child_databases(
@@ -413,45 +373,76 @@ class NotionSource(BaseSource):
                     self._processed_databases.add(database_id)
 
                     # Process all pages in this child database
-                    async for page in self._query_database_pages(client, database_id):
-                        page_id = page["id"]
-                        if page_id in self._processed_pages:
-                            continue
-
-                        try:
-                            # Create breadcrumbs for child database pages
-                            page_breadcrumbs = breadcrumbs + [
-                                Breadcrumb(
-                                    entity_id=database_id,
-                                    name=database_entity.title,
-                                    type="database",
-                                )
-                            ]
-
-                            # Create comprehensive page entity
-                            page_entity, files = await self._create_comprehensive_page_entity(
-                                client, page, page_breadcrumbs, database_id, schema
-                            )
-                            yield page_entity
-
-                            # Process and yield file entities with downloaded files
-                            for file_entity in files:
-                                processed_file = await self._process_and_yield_file(file_entity)
-                                if processed_file:
-                                    yield processed_file
-
-                            self._processed_pages.add(page_id)
-
-                        except Exception as e:
-                            logger.error(
-                                f"Error processing child database page {page_id}: {str(e)}"
-                            )
-                            continue
+                    page_breadcrumbs = breadcrumbs + [
+                        Breadcrumb(
+                            entity_id=database_id,
+                            name=database_entity.title,
+                            type="database",
+                        )
+                    ]
+                    async for entity in self._generate_database_page_entities(
+                        client, database_id, schema, page_breadcrumbs
+                    ):
+                        yield entity
 
                 except Exception as e:
                     logger.error(f"Error processing child database {database_id}: {str(e)}")
                     continue
 
+    async def _generate_database_page_entities(
+        self,
+        client: httpx.AsyncClient,
+        database_id: str,
+        schema: dict,
+        breadcrumbs: List[Breadcrumb],
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate the entities of all pages in a database."""
+        pages = (
+            page
+            async for page in self._query_database_pages(client, database_id)
+            if page["id"] not in self._processed_pages
+        )
+
+        async def build_database_page(page: dict):
+            return await self._create_comprehensive_page_entity(
+                client, page, breadcrumbs, database_id, schema
+            )
+
+        async for entity in self._generate_prefetched_page_entities(pages, build_database_page):
+            yield entity
+
+    async def _generate_prefetched_page_entities(
+        self,
+        pages: Union[List[dict], AsyncIterable[dict]],
+        build_page: Callable[[dict], Awaitable[Tuple[NotionPageEntity, List[NotionFileEntity]]]],
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Build page entities concurrently and yield them with their files in page order.
+
+        Pages that fail to build are logged and skipped.
+        """
+
+        async def build_or_skip(page: dict):
+            try:
+                return await build_page(page)
+            except Exception as e:
+                logger.error(f"Error processing page {page['id']}: {str(e)}")
+                return None
+
+        async for page, result in self.prefetch(pages, build_or_skip):
+            if result is None:
+                continue
+
+            page_entity, files = result
+            yield page_entity
+
+            # Process and yield file entities with downloaded files
+            for file_entity in files:
+                processed_file = await self._process_and_yield_file(file_entity)
+                if processed_file:
+                    yield processed_file
+
+            self._processed_pages.add(page["id"])
+
     async def _build_page_breadcrumbs(
         self, client: httpx.AsyncClient, page: dict
     ) -> List[Breadcrumb]:
@@ -501,9 +492,6 @@ class NotionSource(BaseSource):
 
         logger.info(f"Creating comprehensive page entity: {title} ({page_id})")
 
-        # Reset child database tracking for this page
-        self._child_databases_to_process.clear()
-
         # Aggregate all content from blocks
         content_result = await self._aggregate_page_content(client, page_id, breadcrumbs)
 
@@ -1153,7 +1141,7 @@ class NotionSource(BaseSource):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client_pool.client() as client:
                 # Phase 1: Top-Level Discovery
                 discovered = await self._discover_all_objects(client)
 
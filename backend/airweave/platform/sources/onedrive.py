@@ -20,6 +20,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -59,7 +60,10 @@ class OneDriveSource(BaseSource):
         """Make an authenticated GET request to Microsoft Graph API with retry logic."""
         headers = {"Authorization": f"Bearer {self.access_token}"}
         try:
-            resp = await client.get(url, headers=headers, params=params, timeout=30.0)
+            resp = await self._send_rate_limited(
+                self.access_token,
+                lambda: client.get(url, headers=headers, params=params, timeout=30.0),
+            )
             logger.info(f"Request URL: {url}")
             resp.raise_for_status()
             return resp.json()
@@ -305,6 +309,32 @@ class OneDriveSource(BaseSource):
 
         return entity
 
+    async def _process_drive_item(
+        self, client: httpx.AsyncClient, item: Dict, drive_id: str, drive_name: str
+    ) -> Optional[ChunkEntity]:
+        """Download and process a file DriveItem, returning None for skipped items."""
+        # Skip folders early
+        if "folder" in item:
+            return None
+
+        # Fetch the individual item to get download URL
+        download_url = await self._get_download_url(client, drive_id, item["id"])
+
+        # Build the entity with the download URL
+        file_entity = self._build_file_entity(item, drive_name, drive_id, download_url)
+
+        if not file_entity:
+            return None
+
+        # Process the file entity (download and process content)
+        if not file_entity.download_url:
+            logger.warning(f"No download URL available for {file_entity.name}")
+            return None
+
+        return await self.process_file_entity(
+            file_entity=file_entity, access_token=self.access_token
+        )
+
     async def _generate_drive_item_entities(
         self, client: httpx.AsyncClient, drive_id: str, drive_name: str
     ) -> AsyncGenerator[ChunkEntity, None]:
@@ -312,30 +342,13 @@ class OneDriveSource(BaseSource):
         file_count = 0
         async for item in self._list_all_drive_items_recursively(client, drive_id):
             try:
-                # Skip folders early
-                if "folder" in item:
-                    continue
-
-                # Fetch the individual item to get download URL
-                download_url = await self._get_download_url(client, drive_id, item["id"])
-
-                # Build the entity with the download URL
-                file_entity = self._build_file_entity(item, drive_name, drive_id, download_url)
-
-                if not file_entity:
-                    continue
-
-                # Process the file entity (download and process content)
-                if file_entity.download_url:
-                    processed_entity = await self.process_file_entity(
-                        file_entity=file_entity, access_token=self.access_token
-                    )
-                    if processed_entity:
-                        yield processed_entity
-                        file_count += 1
-                        logger.info(f"Processed file {file_count}: {file_entity.name}")
-                else:
-                    logger.warning(f"No download URL available for {file_entity.name}")
+                processed_entity = await self._process_drive_item(
+                    client, item, drive_id, drive_name
+                )
+                if processed_entity:
+                    yield processed_entity
+                    file_count += 1
+                    logger.info(f"Processed file {file_count}: {processed_entity.name}")
 
             except Exception as e:
                 logger.error(f"Failed to process item {item.get('name', 'unknown')}: {str(e)}")
@@ -344,14 +357,76 @@ class OneDriveSource(BaseSource):
 
         logger.info(f"Total files processed: {file_count}")
 
+    async def _get_latest_delta_link(self, client: httpx.AsyncClient, drive_id: str) -> str:
+        """Get a delta link from which the delta endpoint returns all future changes."""
+        url = f"https://graph.microsoft.com/v1.0/drives/{drive_id}/root/delta"
+        data = await self._get_with_auth(client, url, params={"token": "latest"})
+        return data.get("@odata.deltaLink")
+
+    async def _list_changes(
+        self, client: httpx.AsyncClient, delta_link: str
+    ) -> Optional[List[Dict]]:
+        """List the DriveItems changed since the delta link stored by the previous sync.
+
+        Args:
+            client: The HTTPX client for making requests
+            delta_link: The stored @odata.deltaLink
+
+        Returns:
+            The changed items, or None if a full sync is needed because the delta link expired
+            or a folder was deleted. Personal drives do not report the children of deleted
+            folders, so those can only be removed by a full sync.
+        """
+        items = []
+        url = delta_link
+        try:
+            while url:
+                data = await self._get_with_auth(client, url)
+                items.extend(data.get("value", []))
+                url = data.get("@odata.nextLink")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 410:
+                raise
+            logger.warning("OneDrive delta link expired, running a full sync")
+            return None
+
+        if any("deleted" in item and "folder" in item for item in items):
+            logger.info("Folders were deleted since the previous sync, running a full sync")
+            return None
+
+        self.get_cursor()["delta_link"] = data.get("@odata.deltaLink")
+        return items
+
+    async def _generate_changed_item_entities(
+        self, client: httpx.AsyncClient, items: List[Dict], drive_id: str, drive_name: str
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate entities for changed files and report deleted ones."""
+        for item in items:
+            if "deleted" in item:
+                self.mark_deleted(item["id"])
+                continue
+
+            try:
+                processed_entity = await self._process_drive_item(
+                    client, item, drive_id, drive_name
+                )
+                if processed_entity:
+                    yield processed_entity
+            except Exception as e:
+                logger.error(f"Failed to process item {item.get('name', 'unknown')}: {str(e)}")
+                continue
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all OneDrive entities.
 
+        After the first sync, only items changed since the delta link stored by the previous
+        sync are read. The app folder does not support delta queries and is always read fully.
+
         Yields entities in the following order:
           - OneDriveDriveEntity for the user's drive
           - OneDriveDriveItemEntity for each file in the drive
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # 1) Generate drive entity
             drive_entity = None
             async for drive in self._generate_drive_entity(client):
@@ -367,6 +442,22 @@ class OneDriveSource(BaseSource):
             drive_id = drive_entity.entity_id
             drive_name = drive_entity.drive_type or "OneDrive"
 
+            if drive_id != "appfolder":
+                delta_link = self.get_cursor().get("delta_link")
+                items = await self._list_changes(client, delta_link) if delta_link else None
+                if items is not None:
+                    self.mark_incremental()
+                    async for entity in self._generate_changed_item_entities(
+                        client, items, drive_id, drive_name
+                    ):
+                        yield entity
+                    return
+
+                # Changes made while the drive is listed are picked up by the next sync
+                self.get_cursor()["delta_link"] = await self._get_latest_delta_link(
+                    client, drive_id
+                )
+
             logger.info(f"Starting to process files from drive: {drive_id} ({drive_name})")
 
             async for file_entity in self._generate_drive_item_entities(
@@ -14,6 +14,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -60,7 +61,9 @@ class OutlookCalendarSource(BaseSource):
             "Accept": "application/json",
         }
         try:
-            response = await client.get(url, headers=headers, params=params)
+            response = await self._send_rate_limited(
+                self.access_token, lambda: client.get(url, headers=headers, params=params)
+            )
             response.raise_for_status()
             data = response.json()
             logger.debug(f"Received response from {url} - Status: {response.status_code}")
@@ -449,7 +452,7 @@ class OutlookCalendarSource(BaseSource):
         entity_count = 0
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client_pool.client() as client:
                 logger.info("HTTP client created, starting entity generation")
 
                 # Generate calendar entities and their events
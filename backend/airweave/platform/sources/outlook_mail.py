@@ -14,6 +14,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
@@ -60,7 +61,9 @@ class OutlookMailSource(BaseSource):
         logger.debug(f"Making authenticated GET request to: {url} with params: {params}")
         headers = {"Authorization": f"Bearer {self.access_token}"}
         try:
-            response = await client.get(url, headers=headers, params=params)
+            response = await self._send_rate_limited(
+                self.access_token, lambda: client.get(url, headers=headers, params=params)
+            )
             response.raise_for_status()
             data = response.json()
             logger.debug(f"Received response from {url} - Status: {response.status_code}")
@@ -198,8 +201,11 @@ class OutlookMailSource(BaseSource):
         folder_breadcrumb: Breadcrumb,
     ) -> AsyncGenerator[ChunkEntity, None]:
         """Generate OutlookMessageEntity objects and their attachments for a given folder."""
+        # Messages are listed with a delta query, so the next sync only reads the changes
+        delta_link = self._previous_delta_links.get(folder_entity.entity_id)
+
         # Skip folders with no messages
-        if folder_entity.total_item_count == 0:
+        if folder_entity.total_item_count == 0 and not delta_link:
             logger.debug(f"Skipping folder {folder_entity.display_name} - no messages")
             return
 
@@ -208,8 +214,11 @@ class OutlookMailSource(BaseSource):
             f"({folder_entity.total_item_count} items)"
         )
 
-        url = f"{self.GRAPH_BASE_URL}/me/mailFolders/{folder_entity.entity_id}/messages"
-        params = {"$top": 50}  # Fetch 50 messages at a time
+        folder_delta_url = (
+            f"{self.GRAPH_BASE_URL}/me/mailFolders/{folder_entity.entity_id}/messages/delta"
+        )
+        url = delta_link or folder_delta_url
+        params = None if delta_link else {"$top": 50}  # Fetch 50 messages at a time
 
         page_count = 0
         message_count = 0
@@ -221,36 +230,29 @@ class OutlookMailSource(BaseSource):
                     f"Fetching message list page #{page_count} for folder "
                     f"{folder_entity.display_name}"
                 )
-                data = await self._get_with_auth(client, url, params=params)
+                try:
+                    data = await self._get_with_auth(client, url, params=params)
+                except httpx.HTTPStatusError as e:
+                    if not (delta_link and e.response.status_code == 410):
+                        raise
+                    # The stored delta link expired, list the folder from scratch
+                    logger.warning(f"Delta link of folder {folder_entity.display_name} expired")
+                    delta_link = None
+                    url = folder_delta_url
+                    params = {"$top": 50}
+                    continue
+
                 messages = data.get("value", [])
                 logger.info(
                     f"Found {len(messages)} messages on page {page_count} in folder "
                     f"{folder_entity.display_name}"
                 )
 
-                for msg_idx, message_data in enumerate(messages):
-                    message_count += 1
-                    message_id = message_data.get("id", "unknown")
-                    logger.debug(
-                        f"Processing message #{msg_idx + 1}/{len(messages)} (ID: {message_id}) "
-                        f"in folder {folder_entity.display_name}"
-                    )
-
-                    # If message doesn't have full data, fetch it
-                    if "body" not in message_data:
-                        logger.debug(f"Fetching full message details for {message_id}")
-                        message_url = f"{self.GRAPH_BASE_URL}/me/messages/{message_id}"
-                        message_data = await self._get_with_auth(client, message_url)
-
-                    # Process the message
-                    try:
-                        async for entity in self._process_message(
-                            client, message_data, folder_entity.display_name, folder_breadcrumb
-                        ):
-                            yield entity
-                    except Exception as e:
-                        logger.error(f"Error processing message {message_id}: {str(e)}")
-                        # Continue with other messages even if one fails
+                message_count += len(messages)
+                async for entity in self._process_message_page(
+                    client, messages, folder_entity, folder_breadcrumb
+                ):
+                    yield entity
 
                 # Handle pagination
                 url = data.get("@odata.nextLink")
@@ -258,6 +260,9 @@ class OutlookMailSource(BaseSource):
                     logger.debug("Following pagination to next page")
                     params = None  # params are included in the nextLink
                 else:
+                    self.get_cursor()["delta_links"][folder_entity.entity_id] = data.get(
+                        "@odata.deltaLink"
+                    )
                     logger.info(
                         f"Completed folder {folder_entity.display_name}. "
                         f"Processed {message_count} messages in {page_count} pages."
@@ -270,6 +275,43 @@ class OutlookMailSource(BaseSource):
             )
             raise
 
+    async def _process_message_page(
+        self,
+        client: httpx.AsyncClient,
+        messages: List[Dict],
+        folder_entity: OutlookMailFolderEntity,
+        folder_breadcrumb: Breadcrumb,
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Process a page of a message delta query, reporting removed messages."""
+        for msg_idx, message_data in enumerate(messages):
+            message_id = message_data.get("id", "unknown")
+
+            if "@removed" in message_data:
+                # Attachments are deleted with the message
+                self.mark_deleted(message_id, child_prefix=f"{message_id}_attachment_")
+                continue
+
+            logger.debug(
+                f"Processing message #{msg_idx + 1}/{len(messages)} (ID: {message_id}) "
+                f"in folder {folder_entity.display_name}"
+            )
+
+            # If message doesn't have full data, fetch it
+            if "body" not in message_data:
+                logger.debug(f"Fetching full message details for {message_id}")
+                message_url = f"{self.GRAPH_BASE_URL}/me/messages/{message_id}"
+                message_data = await self._get_with_auth(client, message_url)
+
+            # Process the message
+            try:
+                async for entity in self._process_message(
+                    client, message_data, folder_entity.display_name, folder_breadcrumb
+                ):
+                    yield entity
+            except Exception as e:
+                logger.error(f"Error processing message {message_id}: {str(e)}")
+                # Continue with other messages even if one fails
+
     async def _process_message(
         self,
         client: httpx.AsyncClient,
@@ -505,12 +547,23 @@ class OutlookMailSource(BaseSource):
             # Don't re-raise - continue with other messages even if attachments fail
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate all Outlook mail entities: Folders, Messages and Attachments."""
+        """Generate all Outlook mail entities: Folders, Messages and Attachments.
+
+        Messages of folders with a delta link stored by the previous sync are read
+        incrementally. Folders are always listed, since they are cheap to read.
+        """
         logger.info("===== STARTING OUTLOOK MAIL ENTITY GENERATION =====")
         entity_count = 0
 
+        # Delta links of folders that no longer exist are dropped from the cursor
+        cursor = self.get_cursor()
+        self._previous_delta_links = cursor.get("delta_links") or {}
+        cursor["delta_links"] = {}
+        if self._previous_delta_links:
+            self.mark_incremental()
+
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client_pool.client() as client:
                 logger.info("HTTP client created, starting entity generation")
 
                 # Start with top-level folders and recursively process all folders and contents
@@ -7,10 +7,11 @@ using the PolymorphicEntity system.
 
 import json
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Type, Union
 
 import asyncpg
 
+from airweave.core.config import settings
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import ChunkEntity, PolymorphicEntity
@@ -60,6 +61,7 @@ class PostgreSQLSource(BaseSource):
         """Initialize the PostgreSQL source."""
         self.conn: Optional[asyncpg.Connection] = None
         self.entity_classes: Dict[str, Type[PolymorphicEntity]] = {}
+        self.incremental_column: str = ""
 
     @classmethod
     async def create(
@@ -80,6 +82,7 @@ class PostgreSQLSource(BaseSource):
         """
         instance = cls()
         instance.config = credentials.model_dump()
+        instance.incremental_column = (config or {}).get("incremental_column") or ""
         return instance
 
     async def _connect(self) -> None:
@@ -271,22 +274,26 @@ class PostgreSQLSource(BaseSource):
 
         return processed_data
 
+    @staticmethod
+    def _parse_json_values(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the string values of a record that are valid JSON."""
+        # Simply try to convert all strings to JSON
+        for key, value in data.items():
+            if isinstance(value, str):
+                try:
+                    parsed_value = json.loads(value)
+                    data[key] = parsed_value
+                except (json.JSONDecodeError, ValueError):
+                    # Keep as string if not valid JSON
+                    pass
+        return data
+
     async def _process_table_batch(
         self, schema: str, table: str, entity_class: Type[PolymorphicEntity], batch: List
     ) -> AsyncGenerator[ChunkEntity, None]:
         """Process a batch of records from a table."""
         for record in batch:
-            data = dict(record)
-
-            # Simply try to convert all strings to JSON
-            for key, value in data.items():
-                if isinstance(value, str):
-                    try:
-                        parsed_value = json.loads(value)
-                        data[key] = parsed_value
-                    except (json.JSONDecodeError, ValueError):
-                        # Keep as string if not valid JSON
-                        pass
+            data = self._parse_json_values(dict(record))
 
             model_fields = entity_class.model_fields
             primary_keys = model_fields["primary_key_columns"].default_factory()
@@ -298,15 +305,139 @@ class PostgreSQLSource(BaseSource):
 
             yield entity_class(entity_id=entity_id, **processed_data)
 
+    async def _get_column_type(self, schema: str, table: str, column: str) -> Optional[str]:
+        """Get the data type of a column, or None if the table has no such column."""
+        query = """
+            SELECT data_type
+            FROM information_schema.columns
+            WHERE table_schema = $1 AND table_name = $2 AND column_name = $3
+        """
+        return await self.conn.fetchval(query, schema, table, column)
+
+    async def _build_table_query(
+        self, schema: str, table: str, primary_keys: List[str]
+    ) -> Tuple[str, List[Any], Optional[str], Any]:
+        """Build the query that reads the rows of a table.
+
+        Tables tracked with the incremental column only read the rows changed since the
+        watermark stored by the previous sync. With 'xmin', the watermark is the oldest
+        transaction that was still running when the table was read, so rows of transactions
+        that committed while it was read are picked up by the next sync. Tables without a
+        primary key are always read completely, as their deleted rows cannot be found from
+        a listing of their keys.
+
+        Args:
+            schema: Schema name
+            table: Table name
+            primary_keys: Primary key columns of the table
+
+        Returns:
+            The query, its arguments, the column to track the new watermark with (None if the
+            watermark is known up front or the table is not tracked), and the new watermark
+        """
+        query = f'SELECT * FROM "{schema}"."{table}"'
+        column = self.incremental_column
+        if not column or not primary_keys:
+            return query, [], None, None
+
+        watermark = self.get_cursor().get("watermarks", {}).get(f"{schema}.{table}")
+
+        if column == "xmin":
+            new_watermark = await self.conn.fetchval(
+                "SELECT txid_snapshot_xmin(txid_current_snapshot()) % 4294967296"
+            )
+            if watermark is None:
+                return query, [], None, new_watermark
+            # Compare by age, which is safe across transaction id wraparound
+            return (
+                f"{query} WHERE age(xmin) <= age($1::text::xid)",
+                [str(watermark)],
+                None,
+                new_watermark,
+            )
+
+        column_type = await self._get_column_type(schema, table, column)
+        if column_type is None:
+            return query, [], None, None
+        if watermark is None:
+            return query, [], column, None
+        # Rows at the watermark itself are read again, as more of them may have been written
+        return (
+            f'{query} WHERE "{column}" >= $1::text::{column_type}',
+            [str(watermark)],
+            column,
+            None,
+        )
+
+    async def _generate_table_entities(
+        self, schema: str, table: str, entity_class: Type[PolymorphicEntity]
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate entities for the rows of a table and advance its watermark."""
+        primary_keys = entity_class.model_fields["primary_key_columns"].default_factory()
+        query, args, watermark_column, new_watermark = await self._build_table_query(
+            schema, table, primary_keys
+        )
+
+        # Stream the table through a server-side cursor instead of paging with
+        # OFFSET, which rescans all skipped rows for every batch
+        cursor = await self.conn.cursor(query, *args)
+
+        while True:
+            records = await cursor.fetch(settings.SQL_SOURCE_BATCH_SIZE)
+
+            # Break if no more records
+            if not records:
+                break
+
+            if watermark_column:
+                values = [r[watermark_column] for r in records if r[watermark_column] is not None]
+                if values and (new_watermark is None or max(values) > new_watermark):
+                    new_watermark = max(values)
+
+            # Process the batch
+            async for entity in self._process_table_batch(schema, table, entity_class, records):
+                yield entity
+
+        if args:
+            await self._mark_rows_present(schema, table, primary_keys)
+        if new_watermark is not None:
+            watermarks = self.get_cursor().setdefault("watermarks", {})
+            watermarks[f"{schema}.{table}"] = (
+                new_watermark if isinstance(new_watermark, int) else str(new_watermark)
+            )
+
+    async def _mark_rows_present(self, schema: str, table: str, primary_keys: List[str]) -> None:
+        """Report every row of a table as present, reading only its primary keys.
+
+        Rows that were not changed since the watermark are not generated, so this listing
+        is what keeps them from being deleted, while deleted rows are still removed.
+        """
+        key_columns = ", ".join(f'"{pk}"' for pk in primary_keys)
+        cursor = await self.conn.cursor(f'SELECT {key_columns} FROM "{schema}"."{table}"')
+        while True:
+            records = await cursor.fetch(settings.SQL_SOURCE_BATCH_SIZE)
+            if not records:
+                break
+            for record in records:
+                data = self._parse_json_values(dict(record))
+                self.mark_present(
+                    f"{schema}.{table}:" + ":".join(str(data[pk]) for pk in primary_keys)
+                )
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate entities for all tables in specified schemas."""
+        """Generate entities for all tables in specified schemas.
+
+        All tables are read in one repeatable read transaction, so every query sees the same
+        snapshot and rows committed while the tables are read are picked up by the next sync
+        instead of being skipped by a watermark that already passed them.
+        """
         try:
             await self._connect()
             schema = self.config.get("schema", "public")
             tables = await self._get_table_list(schema)
 
-            # Start a transaction
-            async with self.conn.transaction():
+            # Read every table from the same snapshot
+            async with self.conn.transaction(isolation="repeatable_read", readonly=True):
                 for table in tables:
                     # Create entity class if not already created
                     if f"{schema}.{table}" not in self.entity_classes:
@@ -315,28 +446,9 @@ class PostgreSQLSource(BaseSource):
                         )
 
                     entity_class = self.entity_classes[f"{schema}.{table}"]
-                    BATCH_SIZE = 50
-                    offset = 0
-
-                    while True:
-                        # Fetch records in batches using LIMIT and OFFSET
-                        batch_query = (
-                            f'SELECT * FROM "{schema}"."{table}" LIMIT {BATCH_SIZE} OFFSET {offset}'
-                        )
-                        records = await self.conn.fetch(batch_query)
-
-                        # Break if no more records
-                        if not records:
-                            break
-
-                        # Process the batch
-                        async for entity in self._process_table_batch(
-                            schema, table, entity_class, records
-                        ):
-                            yield entity
 
-                        # Increment offset for next batch
-                        offset += BATCH_SIZE
+                    async for entity in self._generate_table_entities(schema, table, entity_class):
+                        yield entity
 
         finally:
             if self.conn:
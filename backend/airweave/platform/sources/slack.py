@@ -5,6 +5,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import ChunkEntity
@@ -16,6 +17,13 @@ from airweave.platform.entities.slack import (
 from airweave.platform.sources._base import BaseSource
 
 
+def _max_ts(current: Optional[str], ts: Optional[str]) -> Optional[str]:
+    """Get the newer of two Slack message timestamps."""
+    if not ts or (current and float(current) >= float(ts)):
+        return current
+    return ts
+
+
 @source(
     name="Slack",
     short_name="slack",
@@ -31,6 +39,10 @@ class SlackSource(BaseSource):
     then yields them as entities using their respective Slack entity schemas.
     """
 
+    # Slack's Tier 3 methods, such as conversations.history, allow about 50 requests a minute
+    _rate_limit = 50 / 60
+    _rate_limit_burst = 10
+
     @classmethod
     async def create(cls, credentials, config: Optional[Dict[str, Any]] = None) -> "SlackSource":
         """Create a new Slack source instance."""
@@ -53,7 +65,9 @@ class SlackSource(BaseSource):
             "Content-Type": "application/json",
         }
 
-        response = await client.get(url, headers=headers, params=params)
+        response = await self._send_rate_limited(
+            self.access_token, lambda: client.get(url, headers=headers, params=params)
+        )
         response.raise_for_status()
         data = response.json()
 
@@ -156,12 +170,19 @@ class SlackSource(BaseSource):
         url = "https://slack.com/api/conversations.history"
         params = {"channel": channel_id, "limit": 200}
 
+        # Only read messages posted after the newest one seen by the previous sync
+        oldest_by_channel = self.get_cursor().setdefault("oldest", {})
+        newest_ts = oldest_by_channel.get(channel_id)
+        if newest_ts:
+            params["oldest"] = newest_ts
+
         try:
             while True:
                 try:
                     data = await self._get_with_auth(client, url, params=params)
 
                     for message in data.get("messages", []):
+                        newest_ts = _max_ts(newest_ts, message.get("ts"))
                         yield SlackMessageEntity(
                             entity_id=f"{channel_id}-{message.get('ts')}",
                             channel_id=channel_id,
@@ -181,6 +202,7 @@ class SlackSource(BaseSource):
 
                     next_cursor = data.get("response_metadata", {}).get("next_cursor")
                     if not next_cursor:
+                        oldest_by_channel[channel_id] = newest_ts
                         break
                     params["cursor"] = next_cursor
 
@@ -216,9 +238,13 @@ class SlackSource(BaseSource):
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all entities from Slack.
 
-        Channels, Users, and Messages.
+        Channels, Users, and Messages. After the first sync, only messages posted since the
+        previous sync are read. Edits and deletions of older messages are not picked up.
         """
-        async with httpx.AsyncClient() as client:
+        if any(self.get_cursor().get("oldest", {}).values()):
+            self.mark_incremental()
+
+        async with http_client_pool.client() as client:
             # Yield channel entities
             async for channel_entity in self._generate_channel_entities(client):
                 yield channel_entity
@@ -21,6 +21,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from airweave.core.http_client import http_client_pool
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.configs.auth import StripeAuthConfig
 from airweave.platform.decorators import source
@@ -91,7 +92,7 @@ class StripeSource(BaseSource):
         """
         # Use Basic authentication with the API key as the username and no password
         auth = httpx.BasicAuth(username=self.api_key, password="")
-        response = await client.get(url, auth=auth)
+        response = await self._send_rate_limited(self.api_key, lambda: client.get(url, auth=auth))
         response.raise_for_status()
         return response.json()
 
@@ -484,7 +485,7 @@ class StripeSource(BaseSource):
         - Refunds
         - Subscriptions
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # 1) Single Balance resource
             async for balance_entity in self._generate_balance_entity(client):
                 yield balance_entity
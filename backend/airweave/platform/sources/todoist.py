@@ -4,6 +4,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import httpx
 
+from airweave.core.http_client import http_client_pool
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import Breadcrumb, ChunkEntity
@@ -36,6 +37,10 @@ class TodoistSource(BaseSource):
     The Todoist entity schemas are defined in entities/todoist.py.
     """
 
+    # Todoist allows 1000 requests per user in a 15 minute window
+    _rate_limit = 1000 / 900
+    _rate_limit_burst = 50
+
     @classmethod
     async def create(cls, credentials, config: Optional[Dict[str, Any]] = None) -> "TodoistSource":
         """Create a new Todoist source instance."""
@@ -51,7 +56,9 @@ class TodoistSource(BaseSource):
         """
         headers = {"Authorization": f"Bearer {self.access_token}"}
         try:
-            response = await client.get(url, headers=headers)
+            response = await self._send_rate_limited(
+                self.access_token, lambda: client.get(url, headers=headers)
+            )
             response.raise_for_status()
 
             # Depending on the endpoint, responses may be a list or a dict.
@@ -245,7 +252,7 @@ class TodoistSource(BaseSource):
           - yield tasks not associated with any section
           - yield TodoistCommentEntities for each task
         """
-        async with httpx.AsyncClient() as client:
+        async with http_client_pool.client() as client:
             # 1) Generate (and yield) all Projects
             async for project_entity in self._generate_project_entities(client):
                 yield project_entity
@@ -1,21 +1,65 @@
 """Module for entity processing within the sync architecture."""
 
+import asyncio
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid5
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
-from airweave.platform.entities._base import BaseEntity, DestinationAction
+from airweave.platform.entities._base import BaseEntity, DestinationAction, FileEntity
 from airweave.platform.sync.context import SyncContext
 
+# Namespace for the deterministic destination IDs of processed entities
+POINT_ID_NAMESPACE = UUID("9b3c5b1e-0f4e-4d5e-8a46-2f1d6c7e8a90")
+
+
+def get_point_id(sync_id: UUID, entity_id: str, chunk_index: int) -> UUID:
+    """Get the deterministic destination ID of a processed entity.
+
+    Args:
+        sync_id: The sync the entity belongs to
+        entity_id: The source ID of the parent entity
+        chunk_index: Position of the processed entity among those produced by its parent
+
+    Returns:
+        The same UUID for the same inputs, so rewrites of an entity overwrite its points
+    """
+    return uuid5(POINT_ID_NAMESPACE, f"{sync_id}:{entity_id}:{chunk_index}")
+
 
 class EntityProcessor:
     """Processes entities through a pipeline of stages."""
 
-    def __init__(self):
-        """Initialize the entity processor with empty tracking dictionary."""
+    def __init__(
+        self,
+        hash_preload_max_entities: int = 0,
+        hash_commit_batch_size: int = 1000,
+        download_concurrency: int = 8,
+    ):
+        """Initialize the entity processor with empty tracking dictionary.
+
+        Args:
+            hash_preload_max_entities: Preload the stored hashes of syncs with at most this
+                many entities at job start instead of looking them up per batch (0 disables)
+            hash_commit_batch_size: Number of written entities after which the destinations
+                are flushed and the hashes of the confirmed entities are stored
+            download_concurrency: Max number of files downloaded at the same time, across
+                all batches of the sync
+        """
         self._entities_encountered_count: Dict[str, Set[str]] = {}
+        self._persisted_entity_ids: Set[str] = set()
+        self._hash_preload_max_entities = hash_preload_max_entities
+        self._stored_hashes: Optional[Dict[str, Tuple[UUID, str]]] = None
+
+        # Entities written to the destinations whose hashes wait for the writes to be applied
+        self._hash_commit_batch_size = hash_commit_batch_size
+        self._unconfirmed: List[Tuple[BaseEntity, DestinationAction]] = []
+        self._failed_entity_ids: Set[str] = set()
+        self._flush_lock = asyncio.Lock()
+
+        self._download_semaphore = asyncio.Semaphore(download_concurrency)
 
     def initialize_tracking(self, sync_context: SyncContext) -> None:
         """Initialize entity tracking with entity types from the DAG.
@@ -35,6 +79,33 @@ class EntityProcessor:
             if node.name.endswith("Entity"):
                 self._entities_encountered_count[node.name] = set()
 
+    async def preload_entity_hashes(self, sync_context: SyncContext, db: AsyncSession) -> None:
+        """Load the stored id and hash of every entity of the sync into memory.
+
+        Only done for syncs that have at most `hash_preload_max_entities` stored entities.
+        Once loaded, action decisions are made without querying the database.
+
+        Args:
+            sync_context: The sync context
+            db: The database session
+        """
+        self._stored_hashes = None
+        if self._hash_preload_max_entities <= 0:
+            return
+
+        entity_count = await crud.entity.get_count_by_sync_id(db=db, sync_id=sync_context.sync.id)
+        if entity_count is None or entity_count > self._hash_preload_max_entities:
+            sync_context.logger.info(
+                f"Not preloading entity hashes for sync with {entity_count} entities "
+                f"(limit: {self._hash_preload_max_entities})"
+            )
+            return
+
+        self._stored_hashes = await crud.entity.get_hashes_by_sync_id(
+            db=db, sync_id=sync_context.sync.id
+        )
+        sync_context.logger.info(f"Preloaded {len(self._stored_hashes)} entity hashes")
+
     async def process(
         self,
         entity: BaseEntity,
@@ -42,93 +113,253 @@ class EntityProcessor:
         sync_context: SyncContext,
         db: AsyncSession,
     ) -> List[BaseEntity]:
-        """Process an entity through the complete pipeline."""
-        # Flag to track if we've already accounted for this entity in stats
-        entity_accounted_for = False
-
-        try:
-            sync_context.logger.info(f"Processing entity {entity.entity_id} through pipeline")
+        """Process a single entity through the complete pipeline."""
+        return await self.process_batch([entity], source_node, sync_context, db)
 
-            # Track the current entity
-            entity_type = entity.__class__.__name__
-
-            # Validate entity type is known
-            if entity_type not in self._entities_encountered_count:
-                self._entities_encountered_count[entity_type] = set()
+    async def process_batch(
+        self,
+        entities: List[BaseEntity],
+        source_node: schemas.DagNode,
+        sync_context: SyncContext,
+        db: AsyncSession,
+    ) -> List[BaseEntity]:
+        """Process a batch of entities through the complete pipeline.
 
-            # If we encounter the same entity from a different path, silently skip it
-            if entity.entity_id in self._entities_encountered_count[entity_type]:
-                sync_context.logger.info("\nalready encountered this entity, so silently skip\n")
-                return []
+        Each stage runs once for the whole batch: a single action lookup, one embedding
+        request for all produced entities and one write per destination. A failure in a
+        per-entity stage (hashing, transforming) only skips that entity, a failure in a
+        shared stage skips every entity of the batch that has not been accounted for yet.
+        """
+        # Entities of this batch that are not yet accounted for in the stats
+        pending: List[BaseEntity] = []
 
-            # Add the entity id to the entity_type set - we're processing it now
-            self._entities_encountered_count[entity_type].add(entity.entity_id)
+        try:
+            pending = self._filter_new_entities(entities, sync_context)
 
             # Update progress tracker with latest entities encountered
             await sync_context.progress.update_entities_encountered_count(
                 self._entities_encountered_count
             )
 
-            # Stage 1: Enrich entity with metadata
-            enriched_entity = await self._enrich(entity, sync_context)
+            if not pending:
+                return []
 
-            # Stage 2: Determine action for entity
-            db_entity, action = await self._determine_action(enriched_entity, sync_context, db)
-            sync_context.logger.info(f"Determined action {action} for entity {entity.entity_id}")
+            sync_context.logger.info(f"Processing batch of {len(pending)} entities")
 
-            # Stage 2.5: Skip further processing if KEEP
-            if action == DestinationAction.KEEP:
-                await sync_context.progress.increment("kept", 1)
-                entity_accounted_for = True
-                return []
+            # Stage 1: Enrich entities with metadata and compute their hashes
+            pending = await self._enrich_and_hash(pending, sync_context)
 
-            # Stage 3: Process entity through DAG
-            processed_entities = await self._transform(
-                enriched_entity, source_node, sync_context, db
-            )
-            sync_context.logger.info(
-                f"Transformed entity {entity.entity_id} into {len(processed_entities)} entities"
-            )
+            # Stage 2: Determine action for all entities with a single lookup
+            decisions = await self._determine_actions(pending, sync_context, db)
 
-            # Check if transformation resulted in no entities
-            if len(processed_entities) == 0:
-                sync_context.logger.warning(
-                    f"Transformation resulted in 0 entities for {entity.entity_id}, "
-                    "marking as skipped"
-                )
-                await sync_context.progress.increment("skipped", 1)
-                entity_accounted_for = True
+            # Stage 2.5: Skip further processing for KEEP
+            to_transform = await self._keep_unchanged(decisions, sync_context, db)
+            pending = [entity for entity, _, _ in to_transform]
+
+            # Stage 2.6: Download the changed files whose download the source deferred
+            to_transform = await self._download_files(to_transform, sync_context)
+            pending = [entity for entity, _, _ in to_transform]
+
+            # Stage 3: Process entities through DAG
+            transformed = await self._transform_batch(to_transform, source_node, sync_context, db)
+            pending = [entity for entity, _, _, _ in transformed]
+
+            if not transformed:
                 return []
 
-            # Stage 4: Compute vector
-            processed_entities_with_vector = await self._compute_vector(
-                processed_entities, sync_context
-            )
+            # Stage 4: Compute vectors for the whole batch at once
+            all_processed_entities = [
+                processed_entity
+                for _, processed_entities, _, _ in transformed
+                for processed_entity in processed_entities
+            ]
+            await self._compute_vector(all_processed_entities, sync_context)
 
             # Stage 5: Persist entities based on action
-            await self._persist(
-                enriched_entity, processed_entities_with_vector, db_entity, action, sync_context, db
-            )
+            await self._persist(transformed, sync_context, db)
+            pending = []
 
-            entity_accounted_for = True
-            return processed_entities
+            # Stage 6: Store the hashes of the written entities once enough have piled up
+            if len(self._unconfirmed) >= self._hash_commit_batch_size:
+                await self.flush(sync_context, db)
+
+            return all_processed_entities
 
         except Exception as e:
             sync_context.logger.error(
-                f"Error processing entity {entity.entity_id}: {type(e).__name__}: {str(e)}"
+                f"Error processing batch of {len(entities)} entities: {type(e).__name__}: {str(e)}"
             )
 
-            # If we haven't already accounted for this entity in stats, mark it as skipped
-            if not entity_accounted_for:
+            # Mark every entity we haven't accounted for yet as skipped
+            for entity in pending:
                 await sync_context.progress.increment("skipped", 1)
                 sync_context.logger.warning(
                     f"Entity {entity.entity_id} marked as skipped due to processing error"
                 )
 
             # DON'T RE-RAISE! Just return empty list to indicate no entities were produced
-            # This allows the sync to continue with other entities
+            # This allows the sync to continue with other batches
             return []
 
+    async def _enrich_and_hash(
+        self, entities: List[BaseEntity], sync_context: SyncContext
+    ) -> List[BaseEntity]:
+        """Enrich entities with metadata and compute their hashes.
+
+        Entities that cannot be hashed are skipped.
+        """
+        hashed_entities = []
+        for entity in entities:
+            enriched_entity = await self._enrich(entity, sync_context)
+            try:
+                enriched_entity.hash()
+            except Exception as e:
+                await self._skip_entity(entity, e, sync_context)
+                continue
+            hashed_entities.append(enriched_entity)
+        return hashed_entities
+
+    async def _keep_unchanged(
+        self,
+        decisions: List[Tuple[BaseEntity, Optional[UUID], DestinationAction]],
+        sync_context: SyncContext,
+        db: AsyncSession,
+    ) -> List[Tuple[BaseEntity, Optional[UUID], DestinationAction]]:
+        """Mark unchanged entities as kept and return the decisions that need processing."""
+        to_transform = []
+        kept_db_entity_ids = []
+        for entity, db_entity_id, action in decisions:
+            if action == DestinationAction.KEEP:
+                kept_db_entity_ids.append(db_entity_id)
+                self._persisted_entity_ids.add(entity.entity_id)
+            else:
+                to_transform.append((entity, db_entity_id, action))
+
+        # Record that this job has seen the kept entities, so they are not orphaned
+        if kept_db_entity_ids:
+            await crud.entity.bulk_update_sync_job_id(
+                db=db, ids=kept_db_entity_ids, sync_job_id=sync_context.sync_job.id
+            )
+            await sync_context.progress.increment("kept", len(kept_db_entity_ids))
+        return to_transform
+
+    async def _download_files(
+        self,
+        to_transform: List[Tuple[BaseEntity, Optional[UUID], DestinationAction]],
+        sync_context: SyncContext,
+    ) -> List[Tuple[BaseEntity, Optional[UUID], DestinationAction]]:
+        """Download the files of a batch concurrently, now that they are known to have changed.
+
+        Files that fail to download or are too large are skipped.
+        """
+
+        async def download(file: FileEntity) -> Optional[FileEntity]:
+            async with self._download_semaphore:
+                return await file.download()
+
+        files = [
+            entity
+            for entity, _, _ in to_transform
+            if isinstance(entity, FileEntity) and entity.download_pending
+        ]
+        if not files:
+            return to_transform
+
+        downloaded = await asyncio.gather(*(download(file) for file in files))
+        failed = {
+            file.entity_id
+            for file, result in zip(files, downloaded, strict=True)
+            if result is None or result.should_skip
+        }
+        if failed:
+            sync_context.logger.warning(f"Skipping {len(failed)} files that were not downloaded")
+            await sync_context.progress.increment("skipped", len(failed))
+
+        return [decision for decision in to_transform if decision[0].entity_id not in failed]
+
+    async def _transform_batch(
+        self,
+        to_transform: List[Tuple[BaseEntity, Optional[UUID], DestinationAction]],
+        source_node: schemas.DagNode,
+        sync_context: SyncContext,
+        db: AsyncSession,
+    ) -> List[Tuple[BaseEntity, List[BaseEntity], Optional[UUID], DestinationAction]]:
+        """Process entities through the DAG one after another, as they share the session.
+
+        Entities whose transformation fails or produces nothing are skipped.
+        """
+        transformed = []
+        for entity, db_entity_id, action in to_transform:
+            try:
+                processed_entities = await self._transform(entity, source_node, sync_context, db)
+            except Exception as e:
+                await self._skip_entity(entity, e, sync_context)
+                continue
+
+            # Check if transformation resulted in no entities
+            if len(processed_entities) == 0:
+                sync_context.logger.warning(
+                    f"Transformation resulted in 0 entities for {entity.entity_id}, "
+                    "marking as skipped"
+                )
+                await sync_context.progress.increment("skipped", 1)
+                continue
+
+            transformed.append((entity, processed_entities, db_entity_id, action))
+        return transformed
+
+    def get_encountered_entity_ids(self) -> Set[str]:
+        """Get the ids of all entities encountered during this sync, regardless of type."""
+        return set().union(*self._entities_encountered_count.values())
+
+    def mark_encountered(self, entity: BaseEntity) -> None:
+        """Record an entity that is not processed as encountered, so it is not orphaned."""
+        entity_type = entity.__class__.__name__
+        self._entities_encountered_count.setdefault(entity_type, set()).add(entity.entity_id)
+
+    def get_persisted_entity_ids(self) -> Set[str]:
+        """Get the ids of the entities this sync stored or kept, once destinations are flushed."""
+        return self._persisted_entity_ids
+
+    def _filter_new_entities(
+        self, entities: List[BaseEntity], sync_context: SyncContext
+    ) -> List[BaseEntity]:
+        """Filter out entities that were already encountered during this sync.
+
+        If we encounter the same entity from a different path, it is silently skipped.
+        """
+        new_entities = []
+        for entity in entities:
+            entity_type = entity.__class__.__name__
+
+            # Validate entity type is known
+            if entity_type not in self._entities_encountered_count:
+                self._entities_encountered_count[entity_type] = set()
+
+            if entity.entity_id in self._entities_encountered_count[entity_type]:
+                sync_context.logger.info(
+                    f"Already encountered entity {entity.entity_id}, silently skipping"
+                )
+                continue
+
+            # Add the entity id to the entity_type set - we're processing it now
+            self._entities_encountered_count[entity_type].add(entity.entity_id)
+            new_entities.append(entity)
+
+        return new_entities
+
+    async def _skip_entity(
+        self, entity: BaseEntity, error: Exception, sync_context: SyncContext
+    ) -> None:
+        """Mark a single entity as skipped after a processing error."""
+        sync_context.logger.error(
+            f"Error processing entity {entity.entity_id}: {type(error).__name__}: {str(error)}"
+        )
+        await sync_context.progress.increment("skipped", 1)
+        sync_context.logger.warning(
+            f"Entity {entity.entity_id} marked as skipped due to processing error"
+        )
+
     async def _enrich(self, entity: BaseEntity, sync_context: SyncContext) -> BaseEntity:
         """Enrich entity with sync metadata."""
         entity.source_name = sync_context.source._name
@@ -138,44 +369,48 @@ class EntityProcessor:
 
         return entity
 
-    async def _determine_action(
-        self, entity: BaseEntity, sync_context: SyncContext, db: AsyncSession
-    ) -> tuple[schemas.Entity, DestinationAction]:
-        """Determine what action to take for an entity."""
-        sync_context.logger.info(
-            f"Determining action for entity {entity.entity_id} (type: {type(entity).__name__})"
-        )
+    async def _determine_actions(
+        self, entities: List[BaseEntity], sync_context: SyncContext, db: AsyncSession
+    ) -> List[Tuple[BaseEntity, Optional[UUID], DestinationAction]]:
+        """Determine what action to take for each entity of a batch.
 
-        db_entity = await crud.entity.get_by_entity_and_sync_id(
-            db=db, entity_id=entity.entity_id, sync_id=sync_context.sync.id
-        )
-
-        current_hash = entity.hash()
+        Stored hashes come from the preloaded hash map if available, otherwise they are
+        fetched with a single query for the whole batch.
 
-        if db_entity:
-            sync_context.logger.info(
-                f"Found existing entity in DB with id {db_entity.id}, "
-                f"comparing hashes: stored={db_entity.hash}, current={current_hash}"
+        Returns:
+            A list of (entity, db_entity_id, action) tuples in the order of `entities`
+        """
+        if self._stored_hashes is not None:
+            stored_hashes = self._stored_hashes
+        else:
+            stored_hashes = await crud.entity.get_hashes_by_entity_ids(
+                db=db,
+                entity_ids=[entity.entity_id for entity in entities],
+                sync_id=sync_context.sync.id,
             )
 
-            if db_entity.hash != current_hash:
+        decisions = []
+        for entity in entities:
+            db_entity_id, stored_hash = stored_hashes.get(entity.entity_id, (None, None))
+
+            if db_entity_id is None:
+                action = DestinationAction.INSERT
+            elif stored_hash != entity.hash():
                 action = DestinationAction.UPDATE
-                sync_context.logger.info(
-                    f"Hashes differ for entity {entity.entity_id}, will UPDATE"
-                )
             else:
                 action = DestinationAction.KEEP
-                sync_context.logger.info(
-                    f"Hashes match for entity {entity.entity_id}, will KEEP (no changes)"
-                )
-        else:
-            action = DestinationAction.INSERT
-            sync_context.logger.info(
-                f"No existing entity found for {entity.entity_id} in sync "
-                f"{sync_context.sync.id}, will INSERT"
-            )
 
-        return db_entity, action
+            decisions.append((entity, db_entity_id, action))
+
+        action_counts = {}
+        for _, _, action in decisions:
+            action_counts[action.value] = action_counts.get(action.value, 0) + 1
+        sync_context.logger.info(
+            f"Determined actions for {len(decisions)} entities: "
+            + ", ".join(f"{count} {action}" for action, count in action_counts.items())
+        )
+
+        return decisions
 
     async def _transform(
         self,
@@ -215,33 +450,117 @@ class EntityProcessor:
 
     async def _persist(
         self,
-        parent_entity: BaseEntity,
-        processed_entities: List[BaseEntity],
-        db_entity: schemas.Entity,
-        action: DestinationAction,
+        batch: List[Tuple[BaseEntity, List[BaseEntity], Optional[UUID], DestinationAction]],
         sync_context: SyncContext,
         db: AsyncSession,
     ) -> None:
-        """Persist entities to destinations based on action.
+        """Write a batch of entities to the destinations based on action.
+
+        Their hashes are stored by `flush` once the writes are known to be applied, so an
+        entity whose points were lost is not kept as unchanged by the next sync.
 
         Args:
-            parent_entity: The parent entity of the processed entities
-            processed_entities: The entities to persist
-            db_entity: The database entity to update
-            action: The action to take
+            batch: Tuples of (parent entity, processed entities, db entity id, action)
             sync_context: The sync context
             db: The database session
         """
-        if action == DestinationAction.KEEP:
-            await self._handle_keep(sync_context)
-        elif action == DestinationAction.INSERT:
-            await self._handle_insert(
-                parent_entity, processed_entities, db_entity, sync_context, db
-            )
-        elif action == DestinationAction.UPDATE:
-            await self._handle_update(
-                parent_entity, processed_entities, db_entity, sync_context, db
+        # Prepare entities with parent reference
+        for parent_entity, processed_entities, _, _ in batch:
+            for processed_entity in processed_entities:
+                if (
+                    not hasattr(processed_entity, "parent_entity_id")
+                    or not processed_entity.parent_entity_id
+                ):
+                    processed_entity.parent_entity_id = parent_entity.entity_id
+
+        await self._write_to_destinations(batch, sync_context)
+
+        self._unconfirmed.extend((parent_entity, action) for parent_entity, _, _, action in batch)
+
+    async def flush(self, sync_context: SyncContext, db: AsyncSession) -> None:
+        """Wait until the destination writes are applied, then store the entity hashes.
+
+        Entities whose destination writes failed are skipped, so the next sync processes
+        them again instead of keeping them as unchanged.
+
+        Args:
+            sync_context: The sync context
+            db: The database session
+        """
+        async with self._flush_lock:
+            entities, self._unconfirmed = self._unconfirmed, []
+            try:
+                for destination in sync_context.destinations:
+                    self._failed_entity_ids.update(await destination.flush())
+
+                confirmed = [
+                    (entity, action)
+                    for entity, action in entities
+                    if entity.entity_id not in self._failed_entity_ids
+                ]
+                # Insert new and update changed entities in the database with one statement
+                await self._upsert_db_entities(
+                    [entity for entity, _ in confirmed], sync_context, db
+                )
+                self._persisted_entity_ids.update(entity.entity_id for entity, _ in confirmed)
+            except Exception:
+                await sync_context.progress.increment("skipped", len(entities))
+                raise
+
+        if len(confirmed) < len(entities):
+            sync_context.logger.warning(
+                f"Skipping {len(entities) - len(confirmed)} entities whose destination "
+                "writes failed"
             )
+            await sync_context.progress.increment("skipped", len(entities) - len(confirmed))
+
+        inserts = sum(1 for _, action in confirmed if action == DestinationAction.INSERT)
+        updates = len(confirmed) - inserts
+        if inserts:
+            await sync_context.progress.increment("inserted", inserts)
+        if updates:
+            await sync_context.progress.increment("updated", updates)
+
+    async def _write_to_destinations(
+        self,
+        batch: List[Tuple[BaseEntity, List[BaseEntity], Optional[UUID], DestinationAction]],
+        sync_context: SyncContext,
+    ) -> None:
+        """Write the processed entities of a batch to every destination.
+
+        Args:
+            batch: Tuples of (parent entity, processed entities, db entity id, action)
+            sync_context: The sync context
+        """
+        # Give every processed entity a deterministic destination ID, so rewriting an
+        # entity overwrites its existing points instead of adding new ones
+        for parent_entity, processed_entities, _, _ in batch:
+            for chunk_index, processed_entity in enumerate(processed_entities):
+                processed_entity.db_entity_id = get_point_id(
+                    sync_context.sync.id, parent_entity.entity_id, chunk_index
+                )
+
+        # Write to destinations: all processed entities of the batch are upserted in a
+        # single bulk insert, then updated entities drop the points they no longer produce
+        # with a single delete
+        processed_entities = [
+            processed_entity
+            for _, batch_processed_entities, _, _ in batch
+            for processed_entity in batch_processed_entities
+        ]
+        updated_ids = [
+            parent_entity.entity_id
+            for parent_entity, _, _, action in batch
+            if action == DestinationAction.UPDATE
+        ]
+        for destination in sync_context.destinations:
+            await destination.bulk_insert(processed_entities)
+            if updated_ids:
+                await destination.bulk_delete_by_parent_ids(
+                    updated_ids,
+                    sync_context.sync.id,
+                    exclude_ids=[entity.db_entity_id for entity in processed_entities],
+                )
 
     async def _compute_vector(
         self,
@@ -334,90 +653,26 @@ class EntityProcessor:
             sync_context.logger.error(f"Error computing vectors: {str(e)}")
             raise
 
-    async def _handle_keep(self, sync_context: SyncContext) -> None:
-        """Handle KEEP action."""
-        await sync_context.progress.increment(kept=1)
-
-    async def _handle_insert(
+    async def _upsert_db_entities(
         self,
-        parent_entity: BaseEntity,
-        processed_entities: List[BaseEntity],
-        db_entity: Optional[schemas.Entity],
+        parent_entities: List[BaseEntity],
         sync_context: SyncContext,
         db: AsyncSession,
     ) -> None:
-        """Handle INSERT action."""
-        if len(processed_entities) == 0:
-            sync_context.logger.warning(
-                f"No processed entities to insert for {parent_entity.entity_id}, marking as skipped"
-            )
-            await sync_context.progress.increment("skipped", 1)
+        """Store the hashes of inserted and updated parent entities with one commit."""
+        if not parent_entities:
             return
 
-        # Prepare entities with parent reference
-        for processed_entity in processed_entities:
-            if (
-                not hasattr(processed_entity, "parent_entity_id")
-                or not processed_entity.parent_entity_id
-            ):
-                processed_entity.parent_entity_id = parent_entity.entity_id
-
-        # Insert into database
-        new_db_entity = await crud.entity.create(
+        await crud.entity.bulk_upsert(
             db=db,
-            obj_in=schemas.EntityCreate(
-                sync_job_id=sync_context.sync_job.id,
-                sync_id=sync_context.sync.id,
-                entity_id=parent_entity.entity_id,
-                hash=parent_entity.hash(),
-            ),
+            objs_in=[
+                schemas.EntityCreate(
+                    sync_job_id=sync_context.sync_job.id,
+                    sync_id=sync_context.sync.id,
+                    entity_id=parent_entity.entity_id,
+                    hash=parent_entity.hash(),
+                )
+                for parent_entity in parent_entities
+            ],
             organization_id=sync_context.sync.organization_id,
         )
-        parent_entity.db_entity_id = new_db_entity.id
-
-        # Insert to destinations
-        for destination in sync_context.destinations:
-            await destination.bulk_insert(processed_entities)
-
-        await sync_context.progress.increment("inserted", 1)
-
-    async def _handle_update(
-        self,
-        parent_entity: BaseEntity,
-        processed_entities: List[BaseEntity],
-        db_entity: schemas.Entity,
-        sync_context: SyncContext,
-        db: AsyncSession,
-    ) -> None:
-        """Handle UPDATE action."""
-        if len(processed_entities) == 0:
-            sync_context.logger.warning(
-                f"No processed entities to update for {parent_entity.entity_id}, marking as skipped"
-            )
-            await sync_context.progress.increment("skipped", 1)
-            return
-
-        # Prepare entities with parent reference
-        for processed_entity in processed_entities:
-            if (
-                not hasattr(processed_entity, "parent_entity_id")
-                or not processed_entity.parent_entity_id
-            ):
-                processed_entity.parent_entity_id = parent_entity.entity_id
-
-        # Update hash in database
-        await crud.entity.update(
-            db=db,
-            db_obj=db_entity,
-            obj_in=schemas.EntityUpdate(hash=parent_entity.hash()),
-        )
-        parent_entity.db_entity_id = db_entity.id
-
-        # Update in destinations (delete then insert)
-        for destination in sync_context.destinations:
-            await destination.bulk_delete_by_parent_id(
-                parent_entity.entity_id, sync_context.sync.id
-            )
-            await destination.bulk_insert(processed_entities)
-
-        await sync_context.progress.increment("updated", 1)
@@ -14,6 +14,11 @@ from airweave.core.logging import LoggerConfigurator
 from airweave.platform.auth.services import oauth2_service
 from airweave.platform.destinations._base import BaseDestination
 from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.embedding_models.cache import (
+    CachedEmbeddingModel,
+    get_embedding_cache_backend,
+)
+from airweave.platform.embedding_models.coalescer import EmbeddingCoalescer
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
 from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
 from airweave.platform.entities._base import BaseEntity
@@ -75,7 +80,11 @@ class SyncFactory:
         )
 
         # Create entity processor
-        entity_processor = EntityProcessor()
+        entity_processor = EntityProcessor(
+            hash_preload_max_entities=settings.SYNC_ENTITY_HASH_PRELOAD_MAX_ENTITIES,
+            hash_commit_batch_size=settings.SYNC_ENTITY_HASH_COMMIT_BATCH_SIZE,
+            download_concurrency=settings.SYNC_FILE_DOWNLOAD_CONCURRENCY,
+        )
 
         # Create worker pool
         worker_pool = AsyncWorkerPool(max_workers=max_workers)
@@ -85,6 +94,8 @@ class SyncFactory:
             entity_processor=entity_processor,
             worker_pool=worker_pool,
             sync_context=sync_context,
+            batch_size=settings.SYNC_ENTITY_BATCH_SIZE,
+            batch_max_wait=settings.SYNC_ENTITY_BATCH_MAX_WAIT_MS / 1000,
         )
 
         # Initialize entity tracking
@@ -133,7 +144,6 @@ class SyncFactory:
             white_label=white_label,
             access_token=access_token,
         )
-        embedding_model = cls._get_embedding_model(sync=sync)
         destinations = await cls._create_destination_instances(
             db=db,
             sync=sync,
@@ -144,6 +154,7 @@ class SyncFactory:
         entity_map = await cls._get_entity_definition_map(db=db)
 
         progress = SyncProgress(sync_job.id)
+        embedding_model = cls._get_embedding_model(sync=sync, progress=progress)
         router = SyncDAGRouter(dag, entity_map)
 
         # Create a contextualized logger with sync job metadata
@@ -256,13 +267,20 @@ class SyncFactory:
         return credential
 
     @classmethod
-    def _get_embedding_model(cls, sync: schemas.Sync) -> BaseEmbeddingModel:
+    def _get_embedding_model(
+        cls, sync: schemas.Sync, progress: Optional[SyncProgress] = None
+    ) -> BaseEmbeddingModel:
         """Get embedding model instance.
 
         If OpenAI API key is available, it will use OpenAI embeddings instead of local.
+        The model is wrapped in a coalescer, so that the small embedding requests of
+        concurrent workers are sent as batched requests. Each batch is first looked up in
+        the embedding cache (if enabled), so only texts that were never embedded before
+        reach the model.
 
         Args:
             sync (schemas.Sync): The sync configuration
+            progress (Optional[SyncProgress]): The progress to report embedding cache hits to
 
         Returns:
             BaseEmbeddingModel: The embedding model to use
@@ -272,11 +290,22 @@ class SyncFactory:
 
         if settings.OPENAI_API_KEY:
             logger.info(f"Using OpenAI embedding model (text-embedding-3-small) for sync {sync.id}")
-            return OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
-
-        # Otherwise use the local model
-        logger.info(f"Using local embedding model (MiniLM-L6-v2) for sync {sync.id}")
-        return LocalText2Vec()
+            model = OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
+        else:
+            # Otherwise use the local model
+            logger.info(f"Using local embedding model (MiniLM-L6-v2) for sync {sync.id}")
+            model = LocalText2Vec()
+
+        cache_backend = get_embedding_cache_backend()
+        if cache_backend is not None:
+            model = CachedEmbeddingModel(model, cache_backend, progress=progress)
+
+        return EmbeddingCoalescer(
+            model,
+            max_batch_size=settings.EMBEDDING_BATCH_SIZE,
+            max_batch_tokens=settings.EMBEDDING_BATCH_MAX_TOKENS,
+            max_wait=settings.EMBEDDING_BATCH_MAX_WAIT_MS / 1000,
+        )
 
     @classmethod
     async def _create_destination_instances(
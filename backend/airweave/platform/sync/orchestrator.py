@@ -1,8 +1,10 @@
 """Module for data synchronization with improved architecture."""
 
 from datetime import datetime
+from typing import List, Tuple
+from uuid import UUID
 
-from airweave import schemas
+from airweave import crud, schemas
 from airweave.core.shared_models import SyncJobStatus
 from airweave.core.sync_job_service import sync_job_service
 from airweave.db.session import get_db_context
@@ -12,6 +14,9 @@ from airweave.platform.sync.entity_processor import EntityProcessor
 from airweave.platform.sync.stream import AsyncSourceStream
 from airweave.platform.sync.worker_pool import AsyncWorkerPool
 
+# Number of orphaned entities deleted per destination call and database statement
+ORPHAN_DELETE_BATCH_SIZE = 1000
+
 
 # Refactored Orchestrator
 class SyncOrchestrator:
@@ -22,6 +27,8 @@ class SyncOrchestrator:
         entity_processor: EntityProcessor,
         worker_pool: AsyncWorkerPool,
         sync_context: SyncContext,
+        batch_size: int = 64,
+        batch_max_wait: float = 0.2,
     ):
         """Initialize the sync orchestrator with provided components.
 
@@ -29,10 +36,14 @@ class SyncOrchestrator:
             entity_processor: The entity processor to use
             worker_pool: The worker pool to use
             sync_context: The sync context with all required resources
+            batch_size: Maximum number of entities processed together in one batch
+            batch_max_wait: Maximum number of seconds to wait for a batch to fill up
         """
         self.worker_pool = worker_pool
         self.entity_processor = entity_processor
         self.sync_context = sync_context
+        self.batch_size = batch_size
+        self.batch_max_wait = batch_max_wait
 
     async def run(self) -> schemas.Sync:
         """Run a sync with full async processing."""
@@ -53,6 +64,13 @@ class SyncOrchestrator:
             # Get source node from DAG
             source_node = self.sync_context.dag.get_source_node()
 
+            # Load stored entity hashes up front for small enough syncs
+            async with get_db_context() as db:
+                await self.entity_processor.preload_entity_hashes(self.sync_context, db)
+
+                # Resume the source from the position stored by the previous job
+                await self._load_source_cursor(db)
+
             # Process entity stream
             await self._process_entity_stream(source_node)
 
@@ -93,6 +111,19 @@ class SyncOrchestrator:
 
             raise
 
+        finally:
+            await self._close_embedding_model()
+
+    async def _close_embedding_model(self) -> None:
+        """Close the embedding model, stopping its batch timer and releasing its HTTP client."""
+        close = getattr(self.sync_context.embedding_model, "close", None)
+        if close is None:
+            return
+        try:
+            await close()
+        except Exception as e:
+            self.sync_context.logger.warning(f"Error closing embedding model: {e}")
+
     async def _process_entity_stream(self, source_node) -> None:
         """Process stream of entities from source."""
         error_occurred = False
@@ -106,21 +137,31 @@ class SyncOrchestrator:
             self.sync_context.source.generate_entities(), logger=self.sync_context.logger
         ) as stream:
             try:
-                # Process entities as they come
-                async for entity in stream.get_entities():
-                    if getattr(entity, "should_skip", False):
-                        await self.sync_context.progress.increment("skipped")
-                        continue  # Do not process further
+                # Process entities in micro-batches as they come
+                async for batch in stream.get_entity_batches(
+                    batch_size=self.batch_size, max_wait=self.batch_max_wait
+                ):
+                    entities = []
+                    for entity in batch:
+                        if getattr(entity, "should_skip", False):
+                            # Still in the source, so its stored points must not be orphaned
+                            self.entity_processor.mark_encountered(entity)
+                            await self.sync_context.progress.increment("skipped")
+                            continue  # Do not process further
+                        entities.append(entity)
 
-                    # Submit each entity for processing in the worker pool
+                    if not entities:
+                        continue
+
+                    # Submit each batch for processing in the worker pool
                     task = await self.worker_pool.submit(
-                        self._process_single_entity,
-                        entity=entity,
+                        self._process_entity_batch,
+                        entities=entities,
                         source_node=source_node,
                     )
 
-                    # Pythonic way to save entity for error reporting
-                    task.entity = entity
+                    # Pythonic way to save entities for error reporting
+                    task.entities = entities
 
                     # If we have too many pending tasks, wait for some to complete
                     if len(self.worker_pool.pending_tasks) >= self.worker_pool.max_workers * 2:
@@ -130,21 +171,158 @@ class SyncOrchestrator:
                 await self.worker_pool.wait_for_completion()
                 self.sync_context.logger.info("All entity processing tasks completed")
 
+                # Barrier: make sure every buffered destination write has been applied
+                await self._flush_destinations()
+
+                # Finalize stage: remove entities that no longer exist in the source
+                await self._cleanup_orphaned_entities()
+
+                # Only persist the source position once everything up to it is stored
+                await self._save_source_cursor()
+
             except Exception as e:
                 self.sync_context.logger.error(f"Error during entity stream processing: {e}")
                 error_occurred = True
+                await self._flush_destinations(raise_errors=False)
                 raise
             finally:
                 # Finalize progress
                 await self.sync_context.progress.finalize(is_complete=not error_occurred)
 
-    async def _process_single_entity(self, entity: BaseEntity, source_node) -> None:
-        """Process a single entity through the pipeline."""
-        # Create a new database session scope for this task
+    async def _flush_destinations(self, raise_errors: bool = True) -> None:
+        """Wait until the buffered destination writes are applied and store their hashes.
+
+        Args:
+            raise_errors: Whether to raise flush errors, or only log them when the job is
+                already failing
+        """
+        try:
+            async with get_db_context() as db:
+                await self.entity_processor.flush(self.sync_context, db)
+        except Exception as e:
+            if raise_errors:
+                raise
+            self.sync_context.logger.error(f"Error flushing destination writes: {e}")
+
+    async def _load_source_cursor(self, db) -> None:
+        """Load the cursor stored by the previous job of this sync into the source."""
+        sync_cursor = await crud.sync_cursor.get_by_sync_id(db, sync_id=self.sync_context.sync.id)
+        if sync_cursor is not None:
+            self.sync_context.source.set_cursor(sync_cursor.cursor_data)
+
+    async def _save_source_cursor(self) -> None:
+        """Store the cursor of the source, so the next job only reads newer changes."""
+        source = self.sync_context.source
+        # Entities that were generated but not stored must not be skipped by the next job
+        source.confirm_entities(self.entity_processor.get_persisted_entity_ids())
+
+        cursor_data = source.get_cursor()
+        if not cursor_data:
+            return
+
+        async with get_db_context() as db:
+            await crud.sync_cursor.upsert(
+                db, sync_id=self.sync_context.sync.id, cursor_data=cursor_data
+            )
+
+    async def _cleanup_orphaned_entities(self) -> None:
+        """Delete entities that were not encountered by this sync job.
+
+        These entities were deleted in the source since the previous run. They are removed
+        from every destination in chunks, after which their database rows are deleted.
+        """
+        if self.sync_context.source.is_incremental():
+            # Unchanged entities are not generated by incremental runs, so only the entities
+            # the source reported as deleted are removed
+            await self._remove_deleted_entities()
+            return
+
+        # Unchanged entities the source did not generate but listed as still existing
+        encountered_entity_ids = (
+            self.entity_processor.get_encountered_entity_ids()
+            | self.sync_context.source.get_present_entity_ids()
+        )
+        if not encountered_entity_ids:
+            # An empty run is far more likely a broken source than an emptied one
+            self.sync_context.logger.warning(
+                "No entities encountered during this sync job, skipping orphan cleanup"
+            )
+            return
+
         async with get_db_context() as db:
-            # Process the entity through the pipeline
+            outdated_entities = await crud.entity.get_all_outdated(
+                db=db,
+                sync_id=self.sync_context.sync.id,
+                sync_job_id=self.sync_context.sync_job.id,
+            )
+
+            # Entities that failed processing in this job were still seen in the source
+            orphaned_entities = [
+                (db_entity.entity_id, db_entity.id)
+                for db_entity in outdated_entities
+                if db_entity.entity_id not in encountered_entity_ids
+            ]
+            await self._delete_entities(db, orphaned_entities)
+
+    async def _remove_deleted_entities(self) -> None:
+        """Delete the entities that an incremental run reported as deleted in the source.
+
+        Children of the deleted entities (e.g. attachments of a deleted message) are found by
+        the entity id prefixes the source reported with them.
+        """
+        source = self.sync_context.source
+        # Entities that were deleted and then created again are kept
+        encountered_entity_ids = self.entity_processor.get_encountered_entity_ids()
+        deleted_entity_ids = source.get_deleted_entity_ids() - encountered_entity_ids
+        deleted_prefixes = source.get_deleted_entity_prefixes()
+        if not deleted_entity_ids and not deleted_prefixes:
+            return
+
+        async with get_db_context() as db:
+            stored = await crud.entity.get_hashes_by_entity_ids(
+                db, list(deleted_entity_ids), self.sync_context.sync.id
+            )
+            to_delete = {entity_id: db_id for entity_id, (db_id, _) in stored.items()}
+            children = await crud.entity.get_ids_by_entity_id_prefixes(
+                db, list(deleted_prefixes), self.sync_context.sync.id
+            )
+            to_delete.update(
+                (entity_id, db_id)
+                for entity_id, db_id in children.items()
+                if entity_id not in encountered_entity_ids
+            )
+            await self._delete_entities(db, list(to_delete.items()))
 
-            # No try-catch needed here anymore - entity_processor handles all errors gracefully
-            await self.entity_processor.process(
-                entity=entity, source_node=source_node, sync_context=self.sync_context, db=db
+    async def _delete_entities(self, db, entities: List[Tuple[str, UUID]]) -> None:
+        """Delete entities from every destination in chunks, then delete their database rows.
+
+        Args:
+            db: The database session
+            entities: The (entity_id, database id) pairs of the entities to delete
+        """
+        if not entities:
+            return
+
+        self.sync_context.logger.info(
+            f"Deleting {len(entities)} entities from sync {self.sync_context.sync.id}"
+        )
+
+        for i in range(0, len(entities), ORPHAN_DELETE_BATCH_SIZE):
+            chunk = entities[i : i + ORPHAN_DELETE_BATCH_SIZE]
+
+            for destination in self.sync_context.destinations:
+                await destination.bulk_delete(
+                    [entity_id for entity_id, _ in chunk], self.sync_context.sync.id
+                )
+
+            await crud.entity.bulk_remove(db=db, ids=[db_id for _, db_id in chunk])
+            await self.sync_context.progress.increment("deleted", len(chunk))
+
+    async def _process_entity_batch(self, entities: List[BaseEntity], source_node) -> None:
+        """Process a batch of entities through the pipeline."""
+        # Create a single database session scope for the whole batch
+        async with get_db_context() as db:
+            # No try-catch needed here - entity_processor handles all errors gracefully
+            await self.entity_processor.process_batch(
+                entities=entities, source_node=source_node, sync_context=self.sync_context, db=db
             )
@@ -20,6 +20,8 @@ class SyncProgressUpdate(BaseModel):
     deleted: int = 0
     kept: int = 0
     skipped: int = 0
+    embedding_cache_hits: int = 0
+    embedding_cache_misses: int = 0
     entities_encountered: dict[str, int] = {}
     is_complete: bool = False
     is_failed: bool = False
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import AsyncGenerator, Generic, Optional, TypeVar
+from typing import AsyncGenerator, Generic, List, Optional, Tuple, TypeVar
 
 from airweave.platform.entities._base import BaseEntity
 
@@ -128,3 +128,66 @@ class AsyncSourceStream(Generic[T]):
             if self.producer_exception:
                 self.logger.error("Producer encountered an error, stopping consumer")
                 raise self.producer_exception
+
+    async def get_entity_batches(
+        self, batch_size: int, max_wait: float
+    ) -> AsyncGenerator[List[T], None]:
+        """Get entities from the queue grouped into micro-batches.
+
+        A batch is yielded as soon as it holds `batch_size` entities, or when `max_wait`
+        seconds have passed since its first entity arrived, whichever comes first. This
+        keeps latency bounded for slow sources while amortizing per-entity overhead for
+        fast ones.
+
+        Args:
+            batch_size: Maximum number of entities per batch
+            max_wait: Maximum number of seconds to hold a non-empty batch open
+        """
+        if not self.producer_task:
+            await self.start()
+
+        loop = asyncio.get_running_loop()
+        batch: List[T] = []
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            timed_out, item = await self._get_item(timeout)
+            if timed_out:
+                yield batch
+                batch, deadline = [], None
+                continue
+
+            # None is our sentinel value for end of stream
+            if item is None:
+                if batch:
+                    yield batch
+                if self.producer_exception:
+                    self.logger.error("Producer failed with error, stopping consumer")
+                    raise self.producer_exception
+                break
+
+            batch.append(item)
+            if deadline is None:
+                deadline = loop.time() + max_wait
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch, deadline = [], None
+
+            if self.producer_exception:
+                self.logger.error("Producer encountered an error, stopping consumer")
+                raise self.producer_exception
+
+    async def _get_item(self, timeout: Optional[float]) -> Tuple[bool, Optional[T]]:
+        """Get the next item from the queue, waiting at most `timeout` seconds.
+
+        Returns:
+            A (timed_out, item) tuple
+        """
+        try:
+            item = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return True, None
+        self.queue.task_done()
+        return False, item
@@ -2,18 +2,23 @@
 
 import os
 from copy import deepcopy
-from typing import List
+from typing import List, Tuple
 
 from chonkie import CodeChunker, SemanticChunker
 
 from airweave.core.logging import logger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import CodeFileEntity
+from airweave.platform.transformers.structural_chunker import (
+    chunk_by_structure,
+    semantic_chunking_enabled,
+)
 from airweave.platform.transformers.utils import (
     MAX_CHUNK_SIZE,
     METADATA_SIZE,
     count_tokens,
 )
+from airweave.platform.utils.process_pool import run_in_process
 
 # Module-level shared chunkers
 _shared_semantic_chunker = None
@@ -46,6 +51,42 @@ def get_shared_code_chunker(chunk_size_limit: int):
     return _shared_code_chunker
 
 
+def _chunk_content(
+    content: str, is_text_file: bool, chunk_size_limit: int
+) -> List[Tuple[str, int, int, int]]:
+    """Chunk file content in the process pool.
+
+    Args:
+        content: The content of the file
+        is_text_file: Whether to chunk as text instead of with the code chunker
+        chunk_size_limit: Maximum number of tokens per chunk
+
+    Returns:
+        List of (text, start_index, end_index, token_count) tuples
+    """
+    if is_text_file and not semantic_chunking_enabled():
+        logger.info("Using structural chunker for text file")
+        chunks = chunk_by_structure(content, chunk_size_limit)
+        logger.debug(f"Structural chunker produced {len(chunks)} chunks")
+        # The chunks join to the content, so their spans follow from their lengths
+        spans = []
+        start_index = 0
+        for text, token_count in chunks:
+            spans.append((text, start_index, start_index + len(text), token_count))
+            start_index += len(text)
+        return spans
+
+    if is_text_file:
+        logger.info("Using semantic chunker for text file")
+        chunks = get_shared_semantic_chunker(chunk_size_limit).chunk(content)
+        logger.debug(f"Semantic chunker produced {len(chunks)} chunks")
+    else:
+        logger.info("Using code chunker for code file")
+        chunks = get_shared_code_chunker(chunk_size_limit).chunk(content)
+        logger.debug(f"Code chunker produced {len(chunks)} chunks")
+    return [(chunk.text, chunk.start_index, chunk.end_index, chunk.token_count) for chunk in chunks]
+
+
 @transformer(name="Code File Chunker")
 async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
     """Chunk a code file.
@@ -89,16 +130,7 @@ async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
     is_text_file = file_extension in ["txt", "text", "csv"]
     logger.info(f"File {file.name} has extension {file_extension}, is_text_file={is_text_file}")
 
-    if is_text_file:
-        logger.info(f"Using semantic chunker for text file {file.name}")
-        semantic_chunker = get_shared_semantic_chunker(chunk_size_limit)  # Use shared
-        chunks = semantic_chunker.chunk(file.content)
-        logger.debug(f"Semantic chunker produced {len(chunks)} chunks")
-    else:
-        logger.info(f"Using code chunker for code file {file.name}")
-        code_chunker = get_shared_code_chunker(chunk_size_limit)  # Use shared
-        chunks = code_chunker.chunk(file.content)
-        logger.debug(f"Code chunker produced {len(chunks)} chunks")
+    chunks = await run_in_process(_chunk_content, file.content, is_text_file, chunk_size_limit)
 
     if not chunks:  # If chunking failed or returned empty, return original
         logger.warning(
@@ -116,12 +148,13 @@ async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
         chunked_file = deepcopy(file)
 
         # Update the content with just this chunk
-        chunked_file.content = chunk.text
-        chunk_token_count = count_tokens(chunked_file.content)
+        # The chunkers count the tokens of each chunk, so they are not counted again
+        chunk_text, start_index, end_index, chunk_token_count = chunk
+        chunked_file.content = chunk_text
 
         logger.debug(
             f"Chunk {idx + 1}/{total_chunks} for {file.name}: {chunk_token_count} tokens, "
-            f"span: {chunk.start_index}-{chunk.end_index}"
+            f"span: {start_index}-{end_index}"
         )
 
         # Add chunk metadata to entity metadata
@@ -133,8 +166,8 @@ async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
                 "chunk_index": idx + 1,
                 "total_chunks": total_chunks,
                 "original_file_id": file.file_id,
-                "chunk_start_index": chunk.start_index,
-                "chunk_end_index": chunk.end_index,
+                "chunk_start_index": start_index,
+                "chunk_end_index": end_index,
             }
         )
 
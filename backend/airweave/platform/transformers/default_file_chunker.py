@@ -1,14 +1,24 @@
 """Default file transformer using Chonkie for improved semantic chunking."""
 
+import asyncio
 import os
 
 from chonkie import RecursiveChunker, RecursiveLevel, RecursiveRules, SemanticChunker
 
 from airweave.core.logging import logger
 from airweave.platform.decorators import transformer
-from airweave.platform.entities._base import ChunkEntity, FileEntity, ParentEntity
+from airweave.platform.entities._base import ChunkEntity, FileEntity, ParentEntity, file_sha256
+from airweave.platform.file_handling.conversion.cache import (
+    conversion_cache_key,
+    get_conversion_cache_backend,
+)
 from airweave.platform.file_handling.conversion.factory import document_converter
+from airweave.platform.transformers.structural_chunker import (
+    chunk_by_structure,
+    semantic_chunking_enabled,
+)
 from airweave.platform.transformers.utils import MAX_CHUNK_SIZE, count_tokens
+from airweave.platform.utils.process_pool import run_in_process
 
 # Module-level shared chunker
 _shared_semantic_chunker = None
@@ -74,27 +84,53 @@ async def _process_file_content(file: FileEntity) -> str:
         with open(file.local_path, "r", encoding="utf-8") as f:
             return f.read()
     else:
-        # Convert file to markdown using the document converter
-        result = await document_converter.convert(file.local_path)
-        if not result or not result.text_content:
-            logger.warning(f"No content extracted from file {file.name}")
-            return ""
-        return result.text_content
+        return await _convert_file(file)
+
+
+async def _convert_file(file: FileEntity) -> str:
+    """Convert a file to markdown, reusing the conversion of an identical file if cached."""
+    cache = get_conversion_cache_backend()
+    converter = document_converter.get_converter(file.local_path)
+    cache_key = None
+    if cache and converter:
+        checksum = file.checksum or await asyncio.to_thread(file_sha256, file.local_path)
+        cache_key = conversion_cache_key(checksum, converter)
+        text_content = await cache.get(cache_key)
+        if text_content is not None:
+            logger.info(f"Reusing cached conversion of file {file.name}")
+            return text_content
+
+    # Convert file to markdown using the document converter
+    result = await document_converter.convert(file.local_path)
+    if not result or not result.text_content:
+        logger.warning(f"No content extracted from file {file.name}")
+        return ""
+
+    if cache_key and result.metadata.get("cacheable", True):
+        await cache.set(cache_key, result.text_content)
+    return result.text_content
 
 
 def _chunk_text_content(text_content: str) -> list[str]:
-    """Chunk text content using recursive and semantic chunkers."""
+    """Chunk text content on its markdown structure, splitting oversized chunks further.
+
+    Runs in the process pool, so it must stay a module-level function.
+    """
     # Step 1: Initial chunking with RecursiveChunker
     recursive_chunker = get_recursive_chunker()
     initial_chunks = recursive_chunker.chunk(text_content)
 
-    # Step 2: Apply semantic chunking if any chunks are still too large
+    # Step 2: Split chunks that are still too large on their structure, or semantically
     final_chunk_texts = []
     semantic_chunker = None
 
     for chunk in initial_chunks:
         if chunk.token_count <= MAX_CHUNK_SIZE:
             final_chunk_texts.append(chunk.text)
+        elif not semantic_chunking_enabled():
+            final_chunk_texts.extend(
+                text for text, _ in chunk_by_structure(chunk.text, MAX_CHUNK_SIZE)
+            )
         else:
             # Use shared semantic chunker
             if not semantic_chunker:
@@ -116,7 +152,8 @@ async def file_chunker(file: FileEntity) -> list[ParentEntity | ChunkEntity]:
     2. Converts the file to markdown using AsyncMarkItDown (or reads directly if already markdown)
     3. Uses Chonkie for intelligent chunking with a two-step approach:
        - First uses RecursiveChunker with markdown rules
-       - Then applies semantic chunking if chunks are too large
+       - Then splits chunks that are too large on their structure within the token budget
+         (or semantically if CHUNKING_MODE is "semantic")
     4. Yields each chunk as a ChunkEntity
 
     Args:
@@ -138,7 +175,7 @@ async def file_chunker(file: FileEntity) -> list[ParentEntity | ChunkEntity]:
             logger.warning(f"No text content found in file {file.name}")
             return []
 
-        final_chunk_texts = _chunk_text_content(text_content)
+        final_chunk_texts = await run_in_process(_chunk_text_content, text_content)
 
         # Create parent entity for the file using all fields from original entity
         file_data = file.model_dump()
@@ -8,12 +8,17 @@ from chonkie import SemanticChunker
 from airweave.core.logging import logger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import BaseEntity
+from airweave.platform.transformers.structural_chunker import (
+    chunk_by_structure,
+    semantic_chunking_enabled,
+)
+from airweave.platform.transformers.tokenizer import tokenizer
 from airweave.platform.transformers.utils import (
     MARGIN_OF_ERROR,
     MAX_CHUNK_SIZE,
     METADATA_SIZE,
-    count_tokens,
 )
+from airweave.platform.utils.process_pool import run_in_process
 
 # Fields that should never be chunked (system fields)
 NON_CHUNKABLE_FIELDS = {
@@ -67,6 +72,25 @@ def create_semantic_chunker(content_size: int, target_size: int) -> SemanticChun
     )
 
 
+def _chunk_field(text: str, content_size: int, target_size: int) -> List[Tuple[str, int]]:
+    """Chunk the text of a field in the process pool.
+
+    Args:
+        text: The field value to chunk
+        content_size: Size of the content to chunk in tokens
+        target_size: Target size for each chunk
+
+    Returns:
+        List of (text, token_count) tuples
+    """
+    if not semantic_chunking_enabled():
+        # Slightly less than the target, like the semantic chunker, to allow some flexibility
+        return chunk_by_structure(text, int(target_size * 0.95))
+
+    chunker = create_semantic_chunker(content_size, target_size)
+    return [(chunk.text, chunk.token_count) for chunk in chunker.chunk(text)]
+
+
 def calculate_entity_size(entity_dict: Dict) -> Tuple[int, Dict[str, int]]:
     """Calculate the total size of an entity and sizes of individual fields.
 
@@ -76,22 +100,21 @@ def calculate_entity_size(entity_dict: Dict) -> Tuple[int, Dict[str, int]]:
     Returns:
         Tuple of (total_size, field_sizes_dict)
     """
-    total_size = 0
-    field_sizes = {}
+    field_texts = {}
 
     for field_name, field_value in entity_dict.items():
         if isinstance(field_value, str):
-            size = count_tokens(field_value)
-            field_sizes[field_name] = size
-            total_size += size
+            field_texts[field_name] = field_value
         elif isinstance(field_value, (dict, list)):
             # Approximate size for complex fields
             # This is a rough estimate based on JSON serialization
-            size = count_tokens(str(field_value))
-            field_sizes[field_name] = size
-            total_size += size
+            field_texts[field_name] = str(field_value)
+
+    # Count all fields in one batch, fields seen before are served from the cache
+    sizes = tokenizer.count_tokens_batch(list(field_texts.values()))
+    field_sizes = dict(zip(field_texts, sizes, strict=True))
 
-    return total_size, field_sizes
+    return sum(sizes), field_sizes
 
 
 def find_field_to_chunk(entity_dict: Dict, field_sizes: Dict[str, int]) -> Tuple[str, int]:
@@ -178,12 +201,13 @@ async def entity_chunker(entity: BaseEntity) -> List[BaseEntity]:
         # Fall back to a minimum chunk size
         target_chunk_size = max(100, int(MAX_CHUNK_SIZE * 0.2))
 
-    # Create semantic chunker optimized for this content
-    chunker = create_semantic_chunker(largest_field_size, target_chunk_size)
-    chunks = chunker.chunk(entity_dict[largest_field])
+    # Chunk on the structure of the field, or with a semantic chunker optimized for it
+    chunks = await run_in_process(
+        _chunk_field, entity_dict[largest_field], largest_field_size, target_chunk_size
+    )
 
     # Log chunk distribution
-    chunk_sizes = [count_tokens(chunk.text) for chunk in chunks]
+    chunk_sizes = [size for _, size in chunks]
     estimated_entity_sizes = [overhead + size for size in chunk_sizes]
 
     logger.info(
@@ -199,9 +223,9 @@ async def entity_chunker(entity: BaseEntity) -> List[BaseEntity]:
     chunked_entities = []
     entity_class = type(entity)
 
-    for i, chunk in enumerate(chunks):
+    for i, (chunk, _) in enumerate(chunks):
         # Create a new entity with the chunked field
-        chunked_entity_data = {**entity_dict, largest_field: chunk.text, "chunk_index": i}
+        chunked_entity_data = {**entity_dict, largest_field: chunk, "chunk_index": i}
         chunked_entity = entity_class(**chunked_entity_data)
         chunked_entities.append(chunked_entity)
 
@@ -0,0 +1,128 @@
+"""Deterministic chunker that splits markdown on its structure within a token budget.
+
+Unlike Chonkie's `SemanticChunker`, it needs no embeddings: chunk boundaries are placed at
+the coarsest markdown structure (headings, code fences, paragraphs, lines, sentences, words)
+that keeps every chunk within the budget, so chunking costs no API calls and always gives
+the same chunks for the same text.
+"""
+
+from typing import List, Sequence, Tuple
+
+from airweave.core.config import settings
+from airweave.platform.transformers.tokenizer import Tokenizer
+from airweave.platform.transformers.tokenizer import tokenizer as default_tokenizer
+
+# Separators from the coarsest to the finest structure. Separators starting with a newline
+# begin the next chunk, the others end the previous one.
+MARKDOWN_SEPARATORS = (
+    "\n# ",
+    "\n## ",
+    "\n### ",
+    "\n#### ",
+    "\n```",
+    "\n\n",
+    "\n",
+    ". ",
+    "? ",
+    "! ",
+    "; ",
+    ", ",
+    " ",
+)
+
+
+def semantic_chunking_enabled() -> bool:
+    """Check whether oversized text is split by the embedding-based `SemanticChunker`.
+
+    Returns:
+        True if `CHUNKING_MODE` is "semantic", False if it is "structural"
+
+    Raises:
+        ValueError: If `CHUNKING_MODE` is unknown
+    """
+    mode = settings.CHUNKING_MODE
+    if mode == "semantic":
+        return True
+    if mode == "structural":
+        return False
+
+    raise ValueError(f"Unknown chunking mode: {mode}")
+
+
+def _split_on(text: str, separator: str) -> List[str]:
+    """Split text on a separator, keeping the separator so the pieces join to the text."""
+    pieces = text.split(separator)
+    if separator.startswith("\n"):
+        return [pieces[0]] + [separator + piece for piece in pieces[1:]]
+    return [piece + separator for piece in pieces[:-1]] + [pieces[-1]]
+
+
+def _merge(pieces: List[Tuple[str, int]], chunk_size: int) -> List[Tuple[str, int]]:
+    """Greedily join neighbouring pieces while they stay within the budget.
+
+    Pieces are split on whitespace, so their token counts add up to the count of the
+    joined text.
+    """
+    chunks = []
+    current, current_count = "", 0
+    for piece, count in pieces:
+        if current and current_count + count > chunk_size:
+            chunks.append((current, current_count))
+            current, current_count = "", 0
+        current += piece
+        current_count += count
+    if current:
+        chunks.append((current, current_count))
+    return chunks
+
+
+def _chunk(
+    text: str,
+    token_count: int,
+    chunk_size: int,
+    tokenizer: Tokenizer,
+    separators: Sequence[str],
+) -> List[Tuple[str, int]]:
+    """Chunk text of a known token count, returning (text, token_count) tuples."""
+    if token_count <= chunk_size:
+        return [(text, token_count)]
+
+    for level, separator in enumerate(separators):
+        if separator not in text:
+            continue
+        pieces = [piece for piece in _split_on(text, separator) if piece]
+        chunks = []
+        for piece, count in zip(pieces, tokenizer.count_tokens_batch(pieces), strict=True):
+            chunks.extend(_chunk(piece, count, chunk_size, tokenizer, separators[level + 1 :]))
+        return _merge(chunks, chunk_size)
+
+    # No structure left, cut on the token offsets
+    pieces = tokenizer.split(text, chunk_size)
+    return list(zip(pieces, tokenizer.count_tokens_batch(pieces), strict=True))
+
+
+def chunk_by_structure(
+    text: str,
+    chunk_size: int,
+    tokenizer: Tokenizer = default_tokenizer,
+    separators: Sequence[str] = MARKDOWN_SEPARATORS,
+) -> List[Tuple[str, int]]:
+    """Split text into chunks of at most `chunk_size` tokens along its markdown structure.
+
+    Text that is too large is split on the coarsest separator it contains, pieces that are
+    still too large are split on the next finer separator, and neighbouring pieces are then
+    joined back up to the budget. The chunks join to the original text.
+
+    Args:
+        text: The text to chunk
+        chunk_size: Maximum number of tokens per chunk
+        tokenizer: The tokenizer counting and cutting on tokens
+        separators: Separators from the coarsest to the finest structure
+
+    Returns:
+        List of (text, token_count) tuples, the count of a joined chunk being the sum of the
+        counts of its pieces
+    """
+    if not text:
+        return []
+    return _chunk(text, tokenizer.count_tokens(text), chunk_size, tokenizer, separators)
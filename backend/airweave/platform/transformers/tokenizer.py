@@ -0,0 +1,179 @@
+"""Shared tokenization for transformers.
+
+Loading a tiktoken encoding and encoding text are the most expensive parts of chunking, so
+the encoding is loaded once per process, token counts are cached by a hash of the text,
+batches are encoded with tiktoken's multithreaded `encode_ordinary_batch`, and text that
+has to be cut on a token budget is sliced on the token offsets of a single encoding pass.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+import tiktoken
+
+# Encoding used by OpenAI's text-embedding models
+DEFAULT_ENCODING = "cl100k_base"
+TOKEN_COUNT_CACHE_SIZE = 100_000
+
+
+class Tokenizer:
+    """Tokenizer with a cached encoding and token counts cached by content hash.
+
+    Text is encoded as ordinary text, so special tokens such as `<|endoftext|>` in user
+    content are counted like any other text instead of raising an error.
+    """
+
+    def __init__(
+        self,
+        encoding: Optional[tiktoken.Encoding] = None,
+        cache_size: int = TOKEN_COUNT_CACHE_SIZE,
+    ):
+        """Initialize the tokenizer.
+
+        Args:
+            encoding: The encoding to use, defaults to cl100k_base which is loaded on first use
+            cache_size: Maximum number of token counts to cache
+        """
+        self._encoding = encoding
+        self._cache_size = cache_size
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self) -> tiktoken.Encoding:
+        """The tiktoken encoding, loaded once per process."""
+        if self._encoding is None:
+            self._encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+        return self._encoding
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Get the cache key of a text."""
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _get_count(self, key: bytes) -> Optional[int]:
+        """Get a cached token count, marking it as recently used."""
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+            return count
+
+    def _set_count(self, key: bytes, count: int) -> None:
+        """Cache a token count, evicting the least recently used count if full."""
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            if len(self._counts) > self._cache_size:
+                self._counts.popitem(last=False)
+
+    def encode(self, text: str) -> List[int]:
+        """Encode text into tokens.
+
+        Args:
+            text: The text to encode
+
+        Returns:
+            The tokens of the text
+        """
+        tokens = self.encoding.encode_ordinary(text)
+        self._set_count(self._key(text), len(tokens))
+        return tokens
+
+    def encode_batch(self, texts: Sequence[str], num_threads: int = 8) -> List[List[int]]:
+        """Encode texts into tokens in parallel threads.
+
+        Args:
+            texts: The texts to encode
+            num_threads: Number of threads tiktoken encodes with
+
+        Returns:
+            The tokens of each text
+        """
+        batch = self.encoding.encode_ordinary_batch(list(texts), num_threads=num_threads)
+        for text, tokens in zip(texts, batch, strict=True):
+            self._set_count(self._key(text), len(tokens))
+        return batch
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        """Decode tokens into text.
+
+        Args:
+            tokens: The tokens to decode
+
+        Returns:
+            The decoded text
+        """
+        return self.encoding.decode(list(tokens))
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of a text, encoding each distinct text only once.
+
+        Args:
+            text: The text to count the tokens of
+
+        Returns:
+            The number of tokens
+        """
+        key = self._key(text)
+        count = self._get_count(key)
+        if count is None:
+            count = len(self.encoding.encode_ordinary(text))
+            self._set_count(key, count)
+        return count
+
+    def count_tokens_batch(self, texts: Sequence[str]) -> List[int]:
+        """Count the tokens of texts, encoding the uncached texts in one parallel batch.
+
+        Args:
+            texts: The texts to count the tokens of
+
+        Returns:
+            The number of tokens of each text
+        """
+        keys = [self._key(text) for text in texts]
+        counts = [self._get_count(key) for key in keys]
+        missing = [i for i, count in enumerate(counts) if count is None]
+        if missing:
+            batch = self.encode_batch([texts[i] for i in missing])
+            for i, tokens in zip(missing, batch, strict=True):
+                counts[i] = len(tokens)
+        return counts
+
+    def split(self, text: str, max_tokens: int) -> List[str]:
+        """Split text into pieces of at most `max_tokens` tokens on token offsets.
+
+        The text is encoded once and sliced at the character offsets of its tokens, so the
+        pieces join to the original text. A piece cut inside a word can encode into more
+        tokens on its own, such pieces are split again.
+
+        Args:
+            text: The text to split
+            max_tokens: Maximum number of tokens per piece
+
+        Returns:
+            The pieces of the text
+        """
+        tokens = self.encode(text)
+        if len(tokens) <= max_tokens:
+            return [text] if text else []
+
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        cuts = sorted({offsets[i] for i in range(max_tokens, len(tokens), max_tokens)} - {0})
+        if not cuts:
+            return [text]
+
+        bounds = [0, *cuts, len(text)]
+        pieces = [text[start:end] for start, end in zip(bounds, bounds[1:], strict=False)]
+        result = []
+        for piece, count in zip(pieces, self.count_tokens_batch(pieces), strict=True):
+            if count <= max_tokens:
+                result.append(piece)
+            else:
+                result.extend(self.split(piece, max_tokens))
+        return result
+
+
+tokenizer = Tokenizer()
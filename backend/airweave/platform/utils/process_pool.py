@@ -0,0 +1,132 @@
+"""Process pool for CPU-bound transformer and converter work.
+
+Chunking and document parsing hold the GIL, so running them inside a coroutine stalls every
+other entity of the sync. They are run in worker processes instead. Tasks must be module-level
+functions with picklable arguments: files are passed by path rather than by content.
+"""
+
+import asyncio
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+T = TypeVar("T")
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+# Worker slots per event loop, so tasks are only submitted once a worker is free
+_worker_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the shared process pool, creating it on first use.
+
+    Returns:
+        The pool, or None if `PROCESS_POOL_WORKERS` is 0
+    """
+    global _executor
+    if settings.PROCESS_POOL_WORKERS <= 0:
+        return None
+    if _executor is None:
+        # Spawned workers do not inherit the event loop, locks or connections of this process
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(f"Started process pool with {settings.PROCESS_POOL_WORKERS} workers")
+    return _executor
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> T:
+    """Run a CPU-bound function in the process pool without blocking the event loop.
+
+    Without a pool the function runs in the default thread pool instead. Tasks wait for a free
+    worker before they are submitted, so the timeout only covers the time the task runs and
+    not the time it is queued behind other tasks.
+
+    Args:
+        func: A module-level function, so it can be pickled
+        *args: Picklable arguments, such as file paths
+        timeout: Seconds the task may run, defaults to `PROCESS_POOL_TASK_TIMEOUT`
+
+    Returns:
+        The return value of the function
+
+    Raises:
+        asyncio.TimeoutError: If the task does not finish in time. The worker processes are
+            then killed, since a hung worker cannot be cancelled, and the pool is recreated
+            on next use.
+        BrokenProcessPool: If the pool breaks again while the task is retried
+    """
+    timeout = timeout or settings.PROCESS_POOL_TASK_TIMEOUT
+    loop = asyncio.get_running_loop()
+    if settings.PROCESS_POOL_WORKERS <= 0:
+        return await asyncio.wait_for(loop.run_in_executor(None, func, *args), timeout)
+
+    async with _get_worker_slots(loop):
+        try:
+            return await _run_in_pool(loop, func, args, timeout)
+        except BrokenProcessPool:
+            # Another task's timeout or a crashed worker took the pool down, not this task
+            logger.warning(f"Process pool broke while running {func.__name__}, retrying once")
+            return await _run_in_pool(loop, func, args, timeout)
+
+
+def _get_worker_slots(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    """Get the semaphore limiting the tasks of an event loop to the number of workers."""
+    slots = _worker_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(settings.PROCESS_POOL_WORKERS)
+        _worker_slots[loop] = slots
+    return slots
+
+
+async def _run_in_pool(
+    loop: asyncio.AbstractEventLoop, func: Callable[..., T], args: tuple, timeout: float
+) -> T:
+    """Submit a task to the shared pool and wait for it, replacing the pool if it breaks."""
+    executor = get_process_pool()
+    future = loop.run_in_executor(executor, func, *args)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"{func.__name__} did not finish within the process pool task timeout")
+        _terminate_process_pool(executor)
+        raise
+    except BrokenProcessPool:
+        _discard_process_pool(executor)
+        raise
+
+
+def _terminate_process_pool(executor: ProcessPoolExecutor) -> None:
+    """Kill the workers of a pool, so a hung task does not hold a worker for good.
+
+    Other tasks running in the pool fail with `BrokenProcessPool` and are retried.
+    """
+    _discard_process_pool(executor)
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+    logger.warning("Terminated the process pool after a task timeout")
+
+
+def _discard_process_pool(executor: ProcessPoolExecutor) -> None:
+    """Stop handing out a pool, so the next task creates a new one."""
+    global _executor
+    if _executor is executor:
+        _executor = None
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool, cancelling queued tasks."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,289 @@
+"""Adaptive token-bucket rate limiting for source connectors.
+
+Limiters are keyed per source and credential, so all requests made with the same credential
+share one budget. Requests wait for a token before they are sent, and the limiter adapts to
+the `Retry-After` and `X-RateLimit-*` headers of the responses: the bucket is paused until
+the limit resets, and once fewer requests than a burst remain, the rest of the quota is
+spread over the time until it resets.
+
+With the Redis backend the bucket is shared by all workers syncing with the same credential.
+"""
+
+import asyncio
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+# Header names of the remaining quota and its reset time, checked in order
+REMAINING_HEADERS = ("x-ratelimit-remaining", "x-ratelimit-requests-remaining")
+RESET_HEADERS = ("x-ratelimit-reset", "x-ratelimit-requests-reset")
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header, given in seconds or as an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """Parse a rate limit reset header into the number of seconds until the reset.
+
+    Providers send epoch milliseconds (Linear), epoch seconds (GitHub) or a number of
+    seconds from now.
+    """
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > 1e12:
+        reset = reset / 1000 - time.time()
+    elif reset > 1e9:
+        reset = reset - time.time()
+    return max(0.0, reset)
+
+
+def _get_header(headers: Mapping[str, str], names: tuple) -> Optional[str]:
+    """Get the first of several headers present in a response."""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+class RateLimiter(ABC):
+    """Token bucket that refills at `rate` tokens per second up to `burst` tokens."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the limiter.
+
+        Args:
+            rate: Maximum sustained number of requests per second
+            burst: Number of requests that may be sent at once after an idle period
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+
+    @abstractmethod
+    async def _reserve(self) -> float:
+        """Take a token and get the number of seconds to wait before it may be used."""
+        pass
+
+    @abstractmethod
+    async def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a number of seconds.
+
+        Args:
+            seconds: The number of seconds until requests may be sent again
+        """
+        pass
+
+    async def acquire(self) -> float:
+        """Wait until a request may be sent.
+
+        Returns:
+            The number of seconds waited, 0 if the request could be sent right away
+        """
+        wait = await self._reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.2f}s before the next request")
+            await asyncio.sleep(wait)
+        return max(0.0, wait)
+
+    async def update_from_headers(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the limiter to the rate limit headers of a response.
+
+        Args:
+            status_code: The HTTP status code of the response
+            headers: The response headers (case-insensitive, such as httpx.Headers)
+        """
+        retry_after = headers.get("retry-after")
+        if retry_after is not None and (status_code == 429 or status_code >= 500):
+            seconds = _parse_retry_after(retry_after)
+            if seconds is not None:
+                logger.warning(f"Rate limited, pausing requests for {seconds:.1f}s")
+                await self.pause(seconds)
+                return
+
+        remaining = _get_header(headers, REMAINING_HEADERS)
+        reset = _get_header(headers, RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining_requests = int(float(remaining))
+        except ValueError:
+            return
+        seconds_to_reset = _parse_reset(reset)
+        if seconds_to_reset is None:
+            return
+
+        if remaining_requests <= 0:
+            logger.warning(f"Rate limit quota used up, pausing for {seconds_to_reset:.1f}s")
+            await self.pause(seconds_to_reset)
+        elif remaining_requests < self.burst and seconds_to_reset > 0:
+            # Spread the rest of the quota over the time until it resets
+            self.rate = min(self.max_rate, remaining_requests / seconds_to_reset)
+        else:
+            self.rate = self.max_rate
+
+
+class LocalRateLimiter(RateLimiter):
+    """Token bucket kept in this process."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the limiter with a full bucket."""
+        super().__init__(rate, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    async def _reserve(self) -> float:
+        """Take a token, letting the bucket go negative while requests queue up."""
+        now = time.monotonic()
+        refilled = max(0.0, now - self._updated_at) * self.rate
+        self._tokens = min(self.burst, self._tokens + refilled)
+        self._updated_at = max(now, self._paused_until)
+        self._tokens -= 1
+
+        wait = max(0.0, self._paused_until - now)
+        if self._tokens < 0:
+            wait += -self._tokens / self.rate
+        return wait
+
+    async def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = min(self._tokens, 0.0)
+
+
+# Takes a token from the bucket stored in a hash and returns the seconds to wait
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at', 'paused_until')
+local tokens = tonumber(state[1]) or burst
+local updated_at = tonumber(state[2]) or now
+local paused_until = tonumber(state[3]) or 0
+
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate) - 1
+local wait = math.max(0, paused_until - now)
+if tokens < 0 then
+    wait = wait + (-tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', math.max(now, paused_until))
+redis.call('EXPIRE', KEYS[1], math.ceil(wait + burst / rate) + 60)
+return tostring(wait)
+"""
+
+_PAUSE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local paused_until = now + tonumber(ARGV[1])
+
+local current = tonumber(redis.call('HGET', KEYS[1], 'paused_until')) or 0
+if paused_until > current then
+    redis.call('HSET', KEYS[1], 'paused_until', paused_until, 'tokens', 0)
+    redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[1])) + 60)
+end
+return 1
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """Token bucket stored in Redis and shared by all workers.
+
+    Redis errors are logged and the limiter falls back to an in-process bucket, so an
+    unavailable Redis never fails a sync.
+    """
+
+    def __init__(self, key: str, rate: float, burst: int = 1, prefix: str = "rate_limit:"):
+        """Initialize the limiter.
+
+        Args:
+            key: The key of the limiter, shared by all workers using the same credential
+            rate: Maximum sustained number of requests per second
+            burst: Number of requests that may be sent at once after an idle period
+            prefix: Prefix for the Redis key
+        """
+        super().__init__(rate, burst)
+        self.redis_key = prefix + key
+        self._fallback = LocalRateLimiter(rate, burst)
+
+    async def _reserve(self) -> float:
+        """Take a token from the shared bucket."""
+        try:
+            wait = await redis_client.client.eval(
+                _RESERVE_SCRIPT, 1, self.redis_key, self.rate, self.burst
+            )
+            return float(wait)
+        except Exception as e:
+            logger.warning(f"Rate limiter in Redis failed, limiting in process: {e}")
+            self._fallback.rate = self.rate
+            return await self._fallback._reserve()
+
+    async def pause(self, seconds: float) -> None:
+        """Stop handing out tokens to all workers for a number of seconds."""
+        try:
+            await redis_client.client.eval(_PAUSE_SCRIPT, 1, self.redis_key, seconds)
+        except Exception as e:
+            logger.warning(f"Rate limiter in Redis failed, pausing in process: {e}")
+            await self._fallback.pause(seconds)
+
+
+# In-process limiters of the most recently used credentials, bounded so that limiters of
+# rotated or deleted credentials do not accumulate
+MAX_LOCAL_LIMITERS = 1024
+_local_limiters: OrderedDict[str, LocalRateLimiter] = OrderedDict()
+
+
+def get_rate_limiter(source_name: str, credential: str, rate: float, burst: int = 1) -> RateLimiter:
+    """Get the rate limiter of a source and credential.
+
+    In-process limiters are shared by all syncs running in this process, the limiters of the
+    least recently used credentials are dropped once more than `MAX_LOCAL_LIMITERS` exist.
+
+    Args:
+        source_name: The short name of the source
+        credential: The credential the requests are made with, only its hash is used
+        rate: Maximum sustained number of requests per second
+        burst: Number of requests that may be sent at once after an idle period
+
+    Returns:
+        The limiter configured by `SOURCE_RATE_LIMIT_BACKEND`
+    """
+    credential_hash = hashlib.sha256(credential.encode("utf-8")).hexdigest()[:16]
+    key = f"{source_name}:{credential_hash}"
+
+    backend = settings.SOURCE_RATE_LIMIT_BACKEND
+    if backend == "local":
+        limiter = _local_limiters.get(key)
+        if limiter is None:
+            limiter = _local_limiters[key] = LocalRateLimiter(rate, burst)
+            if len(_local_limiters) > MAX_LOCAL_LIMITERS:
+                _local_limiters.popitem(last=False)
+        else:
+            _local_limiters.move_to_end(key)
+        return limiter
+    if backend == "redis":
+        return RedisRateLimiter(key, rate, burst)
+
+    raise ValueError(f"Unknown source rate limit backend: {backend}")
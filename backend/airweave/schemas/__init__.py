@@ -18,6 +18,7 @@ from .collection import (
     CollectionUpdate,
 )
 from .connection import Connection, ConnectionCreate, ConnectionInDBBase, ConnectionUpdate
+from .conversion_cache import ConversionCacheEntryCreate, ConversionCacheEntryUpdate
 from .dag import (
     DagEdge,
     DagEdgeCreate,
@@ -34,6 +35,7 @@ from .destination import (
     DestinationUpdate,
     DestinationWithAuthenticationFields,
 )
+from .embedding_cache import EmbeddingCacheEntryCreate, EmbeddingCacheEntryUpdate
 from .embedding_model import (
     EmbeddingModel,
     EmbeddingModelCreate,
@@ -91,6 +93,7 @@ from .sync import (
     SyncWithoutConnections,
     SyncWithSourceConnection,
 )
+from .sync_cursor import SyncCursorCreate, SyncCursorUpdate
 from .sync_job import (
     SourceConnectionJob,
     SyncJob,
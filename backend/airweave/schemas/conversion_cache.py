@@ -0,0 +1,32 @@
+"""Conversion cache schema."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ConversionCacheEntryBase(BaseModel):
+    """Base schema for ConversionCacheEntry."""
+
+    cache_key: str
+    text_content: str
+    size: int
+
+    class Config:
+        """Pydantic config for ConversionCacheEntryBase."""
+
+        from_attributes = True
+
+
+class ConversionCacheEntryCreate(ConversionCacheEntryBase):
+    """Schema for creating a ConversionCacheEntry object."""
+
+    pass
+
+
+class ConversionCacheEntryUpdate(BaseModel):
+    """Schema for updating a ConversionCacheEntry object."""
+
+    cache_key: Optional[str] = None
+    text_content: Optional[str] = None
+    size: Optional[int] = None
@@ -0,0 +1,30 @@
+"""Embedding cache schema."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class EmbeddingCacheEntryBase(BaseModel):
+    """Base schema for EmbeddingCacheEntry."""
+
+    cache_key: str
+    vector: bytes
+
+    class Config:
+        """Pydantic config for EmbeddingCacheEntryBase."""
+
+        from_attributes = True
+
+
+class EmbeddingCacheEntryCreate(EmbeddingCacheEntryBase):
+    """Schema for creating an EmbeddingCacheEntry object."""
+
+    pass
+
+
+class EmbeddingCacheEntryUpdate(BaseModel):
+    """Schema for updating an EmbeddingCacheEntry object."""
+
+    cache_key: Optional[str] = None
+    vector: Optional[bytes] = None
@@ -0,0 +1,30 @@
+"""Sync cursor schema."""
+
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SyncCursorBase(BaseModel):
+    """Base schema for SyncCursor."""
+
+    sync_id: UUID
+    cursor_data: dict[str, Any] = {}
+
+    class Config:
+        """Pydantic config for SyncCursorBase."""
+
+        from_attributes = True
+
+
+class SyncCursorCreate(SyncCursorBase):
+    """Schema for creating a SyncCursor object."""
+
+    pass
+
+
+class SyncCursorUpdate(BaseModel):
+    """Schema for updating a SyncCursor object."""
+
+    cursor_data: Optional[dict[str, Any]] = None
@@ -0,0 +1,125 @@
+"""Tests for the content-addressed embedding cache."""
+
+import time
+from typing import List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.embedding_models.cache import (
+    CachedEmbeddingModel,
+    LRUEmbeddingCacheBackend,
+)
+
+
+class RecordingModel(BaseEmbeddingModel):
+    """Embedding model that records every batch it receives."""
+
+    model_name: str = "recording"
+    vector_dimensions: int = 1
+    calls: List[List[str]] = []
+
+    async def embed(self, text, model=None, encoding_format="float", dimensions=None):
+        """Embed a single text."""
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts, model=None, encoding_format="float", dimensions=None):
+        """Embed texts as their length."""
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class TestLRUEmbeddingCacheBackend:
+    """Tests for the in-process LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test that the least recently used vector is evicted when full."""
+        backend = LRUEmbeddingCacheBackend(max_size=2)
+        await backend.set_many({"a": [1.0], "b": [2.0]})
+        await backend.get_many(["a"])
+        await backend.set_many({"c": [3.0]})
+
+        assert await backend.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+    @pytest.mark.asyncio
+    async def test_expires_after_ttl(self, monkeypatch):
+        """Test that vectors are not returned after their TTL."""
+        backend = LRUEmbeddingCacheBackend(max_size=10, ttl=60)
+        await backend.set_many({"a": [1.0]})
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+        assert await backend.get_many(["a"]) == {}
+
+
+class TestCachedEmbeddingModel:
+    """Tests for the CachedEmbeddingModel."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_embedded(self):
+        """Test that cached texts are not sent to the model again."""
+        inner = RecordingModel(calls=[])
+        model = CachedEmbeddingModel(inner, LRUEmbeddingCacheBackend(max_size=10))
+
+        assert await model.embed_many(["a", "bb"]) == [[1.0], [2.0]]
+        assert await model.embed_many(["bb", "ccc", "a"]) == [[2.0], [3.0], [1.0]]
+
+        assert inner.calls == [["a", "bb"], ["ccc"]]
+        assert (model.hits, model.misses) == (2, 3)
+        assert model.hit_rate == pytest.approx(0.4)
+
+    @pytest.mark.asyncio
+    async def test_duplicates_embedded_once(self):
+        """Test that repeated texts in one call are only embedded once."""
+        inner = RecordingModel(calls=[])
+        model = CachedEmbeddingModel(inner, LRUEmbeddingCacheBackend(max_size=10))
+
+        assert await model.embed_many(["sig", "sig"]) == [[3.0], [3.0]]
+        assert inner.calls == [["sig"]]
+
+    @pytest.mark.asyncio
+    async def test_keys_depend_on_model(self):
+        """Test that vectors of different models do not collide."""
+        backend = LRUEmbeddingCacheBackend(max_size=10)
+        first = RecordingModel(calls=[])
+        other = RecordingModel(model_name="other", calls=[])
+
+        await CachedEmbeddingModel(first, backend).embed_many(["a"])
+        await CachedEmbeddingModel(other, backend).embed_many(["a"])
+
+        assert other.calls == [["a"]]
+
+    @pytest.mark.asyncio
+    async def test_zero_vectors_not_cached(self):
+        """Test that fallback zero vectors of failed texts are embedded again."""
+
+        class FailingModel(RecordingModel):
+            async def embed_many(self, texts, model=None, encoding_format="float", dimensions=None):
+                """Embed texts as zero vectors, like a model whose texts failed."""
+                self.calls.append(list(texts))
+                return [[0.0] for _ in texts]
+
+        inner = FailingModel(calls=[])
+        model = CachedEmbeddingModel(inner, LRUEmbeddingCacheBackend(max_size=10))
+
+        await model.embed_many(["a"])
+        await model.embed_many(["a"])
+
+        assert inner.calls == [["a"], ["a"]]
+
+    @pytest.mark.asyncio
+    async def test_hits_and_misses_reported_to_progress(self):
+        """Test that cache hits and misses are added to the progress of the sync."""
+        progress = AsyncMock()
+        model = CachedEmbeddingModel(
+            RecordingModel(calls=[]), LRUEmbeddingCacheBackend(max_size=10), progress=progress
+        )
+
+        await model.embed_many(["a"])
+        await model.embed_many(["a"])
+
+        progress.increment.assert_any_call("embedding_cache_misses", 1)
+        progress.increment.assert_any_call("embedding_cache_hits", 1)
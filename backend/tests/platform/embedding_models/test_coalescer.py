@@ -0,0 +1,103 @@
+"""Tests for the EmbeddingCoalescer."""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.embedding_models.coalescer import EmbeddingCoalescer
+
+
+class RecordingModel(BaseEmbeddingModel):
+    """Embedding model that records every batch it receives."""
+
+    model_name: str = "recording"
+    vector_dimensions: int = 1
+    calls: List[List[str]] = []
+    error: Any = None
+
+    async def embed(self, text, model=None, encoding_format="float", dimensions=None):
+        """Embed a single text."""
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts, model=None, encoding_format="float", dimensions=None):
+        """Embed texts as their length."""
+        self.calls.append(list(texts))
+        if self.error:
+            raise self.error
+        return [[float(len(text))] for text in texts]
+
+
+class TestEmbeddingCoalescer:
+    """Tests for the EmbeddingCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_request(self):
+        """Test that concurrent callers are merged into one call and get their own vectors."""
+        inner = RecordingModel(calls=[])
+        coalescer = EmbeddingCoalescer(inner, max_wait=0.01)
+
+        results = await asyncio.gather(
+            coalescer.embed_many(["a", "bb"]),
+            coalescer.embed_many(["ccc"]),
+            coalescer.embed("dddd"),
+        )
+
+        assert results == [[[1.0], [2.0]], [[3.0]], [4.0]]
+        assert inner.calls == [["a", "bb", "ccc", "dddd"]]
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_batch_size(self):
+        """Test that a full batch is sent without waiting for the deadline."""
+        inner = RecordingModel(calls=[])
+        coalescer = EmbeddingCoalescer(inner, max_batch_size=2, max_wait=10)
+
+        results = await asyncio.wait_for(coalescer.embed_many(["a", "bb"]), timeout=1)
+
+        assert results == [[1.0], [2.0]]
+        assert inner.calls == [["a", "bb"]]
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_token_budget(self):
+        """Test that a batch is split when the token budget would be exceeded."""
+        inner = RecordingModel(calls=[])
+        coalescer = EmbeddingCoalescer(inner, max_batch_tokens=3, max_wait=0.01)
+
+        await coalescer.embed_many(["x" * 4, "y" * 4, "z"])
+
+        assert inner.calls == [["x" * 4], ["y" * 4, "z"]]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_sent_once(self):
+        """Test that identical texts within a batch are only embedded once."""
+        inner = RecordingModel(calls=[])
+        coalescer = EmbeddingCoalescer(inner, max_wait=0.01)
+
+        results = await asyncio.gather(coalescer.embed("same"), coalescer.embed("same"))
+
+        assert results == [[4.0], [4.0]]
+        assert inner.calls == [["same"]]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """Test that a failed batch raises for every caller in it."""
+        inner = RecordingModel(calls=[], error=RuntimeError("boom"))
+        coalescer = EmbeddingCoalescer(inner, max_wait=0.01)
+
+        results = await asyncio.gather(
+            coalescer.embed_many(["a"]), coalescer.embed_many(["b"]), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(inner.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_overrides_bypass_buffer(self):
+        """Test that model overrides are passed straight to the wrapped model."""
+        inner = RecordingModel(calls=[])
+        coalescer = EmbeddingCoalescer(inner, max_wait=10)
+
+        result = await asyncio.wait_for(coalescer.embed_many(["a"], model="other"), timeout=1)
+
+        assert result == [[1.0]]
@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from airweave.core.config import settings
@@ -83,9 +84,7 @@ class TestLocalText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {
-            "vectors": [[0.1, 0.2, 0.3] * 128, [0.4, 0.5, 0.6] * 128]
-        }
+        mock_response.json.return_value = {"vector": [0.1, 0.2, 0.3] * 128}
         mock_post.return_value = mock_response
 
         texts = ["Text 1", "Text 2"]
@@ -95,9 +94,9 @@ class TestLocalText2Vec:
         assert isinstance(result, list)
         assert len(result) == 2
         assert all(len(vec) == 384 for vec in result)
+        assert result[0] == [0.1, 0.2, 0.3] * 128
 
-        # Verify the API call - updated to match the actual implementation
-        # The method is making individual calls for each text rather than a batch call
+        # Without a batch endpoint, each text is sent concurrently in its own request
         assert mock_post.call_count == 2
         mock_post.assert_any_call(f"{model.inference_url}/vectors/", json={"text": "Text 1"})
         mock_post.assert_any_call(f"{model.inference_url}/vectors/", json={"text": "Text 2"})
@@ -109,7 +108,7 @@ class TestLocalText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {"vectors": [[0.1, 0.2, 0.3] * 128]}
+        mock_response.json.return_value = {"vector": [0.1, 0.2, 0.3] * 128}
         mock_post.return_value = mock_response
 
         texts = ["", "Text 2"]
@@ -127,6 +126,51 @@ class TestLocalText2Vec:
             json={"text": "Text 2"},  # Only non-empty text should be sent
         )
 
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.post")
+    async def test_embed_many_batch_endpoint(self, mock_post, model):
+        """Test that texts are sent in one request when a batch endpoint is configured."""
+        model.batch_endpoint = "/vectors/batch"
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.return_value = {"vectors": [[1.0] * 384, [2.0] * 384]}
+        mock_post.return_value = mock_response
+
+        result = await model.embed_many(["Text 1", "", "Text 3"])
+
+        assert result == [[1.0] * 384, [0.0] * 384, [2.0] * 384]
+        mock_post.assert_called_once_with(
+            f"{model.inference_url}/vectors/batch", json={"texts": ["Text 1", "Text 3"]}
+        )
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.post")
+    async def test_embed_many_batch_failure_falls_back(self, mock_post, model):
+        """Test that a failed batch request is retried per text, keeping the order."""
+        model.batch_endpoint = "/vectors/batch"
+
+        async def post(url, json):
+            if url.endswith("/vectors/batch"):
+                raise httpx.ConnectError("batch unavailable")
+            response = MagicMock()
+            response.raise_for_status = MagicMock()
+            response.json.return_value = {"vector": [float(len(json["text"]))] * 384}
+            return response
+
+        mock_post.side_effect = post
+
+        result = await model.embed_many(["a", "bbb"])
+
+        assert result == [[1.0] * 384, [3.0] * 384]
+        assert mock_post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self, model):
+        """Test that one pooled client is shared between calls."""
+        client = await model.get_client()
+        assert await model.get_client() is client
+        await model.close()
+
     @pytest.mark.asyncio
     async def test_embed_many_with_model_override(self, model):
         """Test that model override raises an error."""
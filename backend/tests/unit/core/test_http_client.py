@@ -0,0 +1,61 @@
+"""Unit tests for the pooled HTTP clients."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from airweave.core.http_client import HttpClientPool
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_and_stays_open():
+    """Test that the same client is handed out and not closed by the context manager."""
+    pool = HttpClientPool()
+
+    async with pool.client() as first:
+        pass
+    async with pool.client() as second:
+        pass
+
+    assert first is second
+    assert not first.is_closed
+    assert pool.get_client("other") is not first
+
+    await pool.close()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_does_not_store_cookies():
+    """Test that cookies set by one response are not sent with later requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Set-Cookie": "session=secret; Path=/"},
+            json={"cookie": request.headers.get("cookie")},
+        )
+
+    pool = HttpClientPool()
+    client = pool.get_client()
+    client._transport = httpx.MockTransport(handler)
+
+    await client.get("https://example.com/")
+    response = await client.get("https://example.com/")
+
+    assert response.json() == {"cookie": None}
+    await pool.close()
+
+
+def test_clients_are_bound_to_their_event_loop():
+    """Test that a new event loop gets a new client."""
+    pool = HttpClientPool()
+
+    async def get_client():
+        return pool.get_client()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
@@ -0,0 +1,54 @@
+"""Unit tests for the Entity CRUD operations."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.crud.crud_entity import entity as crud_entity
+from airweave.schemas.entity import EntityCreate
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_upsert_single_statement_and_commit():
+    """Test that many entities are upserted with one statement and one commit."""
+    # Arrange
+    mock_db = AsyncMock(spec=AsyncSession)
+    sync_id = uuid.uuid4()
+    sync_job_id = uuid.uuid4()
+    objs_in = [
+        EntityCreate(sync_job_id=sync_job_id, sync_id=sync_id, entity_id=entity_id, hash="h")
+        for entity_id in ["a", "b", "a"]
+    ]
+    result = MagicMock()
+    result.all.return_value = [("a", uuid.uuid4()), ("b", uuid.uuid4())]
+    mock_db.execute.return_value = result
+
+    # Act
+    db_entity_ids = await crud_entity.bulk_upsert(
+        mock_db, objs_in=objs_in, organization_id=uuid.uuid4()
+    )
+
+    # Assert
+    assert set(db_entity_ids) == {"a", "b"}
+    mock_db.execute.assert_called_once()
+    mock_db.commit.assert_called_once()
+
+    stmt = mock_db.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT ON CONSTRAINT uq_sync_id_entity_id DO UPDATE" in sql
+    # Duplicate entity ids are collapsed into a single row
+    assert len(stmt._multi_values[0]) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_upsert_empty():
+    """Test that an empty upsert does not touch the database."""
+    mock_db = AsyncMock(spec=AsyncSession)
+
+    assert await crud_entity.bulk_upsert(mock_db, objs_in=[], organization_id=uuid.uuid4()) == {}
+    mock_db.execute.assert_not_called()
@@ -0,0 +1,120 @@
+"""Unit tests for the BaseSource prefetch and rate limiting helpers."""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from airweave.platform.sources import _base
+from airweave.platform.sources._base import BaseSource
+
+
+class DummySource(BaseSource):
+    """Source without entities, used to call the helpers."""
+
+    _prefetch_concurrency = 3
+
+    @classmethod
+    async def create(cls, credentials=None, config=None):
+        """Create the source."""
+        return cls()
+
+    async def generate_entities(self):
+        """Generate no entities."""
+        if False:
+            yield
+
+
+class ConcurrencyTracker:
+    """Fetch function that records how many fetches run at the same time."""
+
+    def __init__(self):
+        """Initialize the counters."""
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, item):
+        """Fetch an item after a random delay."""
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(random.uniform(0, 0.01))
+        self.running -= 1
+        return item * 10
+
+
+@pytest.mark.asyncio
+async def test_prefetch_keeps_order_and_limit():
+    """Test that results are yielded in item order with bounded concurrency."""
+    fetch = ConcurrencyTracker()
+
+    results = [pair async for pair in DummySource().prefetch(range(20), fetch)]
+
+    assert results == [(i, i * 10) for i in range(20)]
+    assert 1 < fetch.max_running <= 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_accepts_async_iterables():
+    """Test that items can be listed by an async generator."""
+
+    async def list_items():
+        for i in range(5):
+            yield i
+
+    results = [pair async for pair in DummySource().prefetch(list_items(), ConcurrencyTracker())]
+
+    assert [item for item, _ in results] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_raises_and_cancels_pending_fetches():
+    """Test that a failed fetch is raised at its item and later fetches are cancelled."""
+    cancelled = []
+
+    async def fetch(item):
+        if item == 1:
+            raise ValueError("failed")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    with pytest.raises(ValueError):
+        async for _ in DummySource().prefetch([1, 2, 3], fetch):
+            pass
+
+    assert cancelled == [2, 3]
+
+
+def test_rate_limiter_is_kept_per_credential():
+    """Test that a refreshed credential gets its own limiter instead of the first one."""
+    source = DummySource()
+
+    with patch.object(
+        _base.rate_limiter, "get_rate_limiter", side_effect=lambda *args: MagicMock()
+    ) as get_rate_limiter:
+        first = source.get_rate_limiter("old-token")
+        second = source.get_rate_limiter("new-token")
+
+        assert first is not second
+        assert source.get_rate_limiter("old-token") is first
+        assert get_rate_limiter.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_rate_limited_updates_limiter_from_response():
+    """Test that a request waits for the limiter and the limiter reads its headers."""
+    limiter = MagicMock(acquire=AsyncMock(return_value=0), update_from_headers=AsyncMock())
+    response = httpx.Response(429, headers={"Retry-After": "3"})
+    source = DummySource()
+    source.get_rate_limiter = MagicMock(return_value=limiter)
+
+    assert await source._send_rate_limited("token", AsyncMock(return_value=response)) is response
+
+    source.get_rate_limiter.assert_called_once_with("token")
+    limiter.acquire.assert_awaited_once()
+    limiter.update_from_headers.assert_awaited_once_with(429, response.headers)
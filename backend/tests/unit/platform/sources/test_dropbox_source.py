@@ -0,0 +1,64 @@
+"""Unit tests for reading Dropbox changes with the list_folder cursor."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.platform.entities._base import Breadcrumb
+from airweave.platform.sources.dropbox import DropboxSource
+
+
+@pytest.fixture
+async def source():
+    """Create a Dropbox source."""
+    return await DropboxSource.create("token")
+
+
+@pytest.mark.asyncio
+async def test_lists_changes_and_stores_next_cursor(source):
+    """Test that all change pages are read and the new cursor is stored."""
+    source._post_with_auth = AsyncMock(
+        side_effect=[
+            {"entries": [{".tag": "file", "id": "a"}], "has_more": True, "cursor": "c2"},
+            {"entries": [{".tag": "file", "id": "b"}], "has_more": False, "cursor": "c3"},
+        ]
+    )
+
+    entries = await source._list_changes(MagicMock(), "c1")
+
+    assert [entry["id"] for entry in entries] == ["a", "b"]
+    assert source.get_cursor()["cursor"] == "c3"
+
+
+@pytest.mark.asyncio
+async def test_deleted_entries_require_full_sync(source):
+    """Test that deleted entries fall back to a full sync without moving the cursor."""
+    source._post_with_auth = AsyncMock(
+        return_value={"entries": [{".tag": "deleted", "path_lower": "/a"}], "cursor": "c2"}
+    )
+
+    assert await source._list_changes(MagicMock(), "c1") is None
+    assert "cursor" not in source.get_cursor()
+
+
+@pytest.mark.asyncio
+async def test_expired_cursor_requires_full_sync(source):
+    """Test that a cursor that can no longer be continued falls back to a full sync."""
+    source._post_with_auth = AsyncMock(side_effect=Exception("reset"))
+
+    assert await source._list_changes(MagicMock(), "c1") is None
+
+
+@pytest.mark.asyncio
+async def test_folder_breadcrumbs_match_full_traversal(source):
+    """Test that changed files get the breadcrumbs of their folders, looked up once."""
+    source._post_with_auth = AsyncMock(return_value={"id": "id:docs", "name": "Docs"})
+    folders = {"/docs/specs": Breadcrumb(entity_id="id:specs", name="Specs", type="folder")}
+
+    first = await source._get_folder_breadcrumbs(MagicMock(), "/Docs/Specs/a.pdf", folders)
+    second = await source._get_folder_breadcrumbs(MagicMock(), "/Docs/b.pdf", folders)
+
+    assert [crumb.entity_id for crumb in first] == ["id:docs", "id:specs"]
+    assert [crumb.name for crumb in second] == ["Docs"]
+    source._post_with_auth.assert_called_once()
+    assert await source._get_folder_breadcrumbs(MagicMock(), "/root.txt", folders) == []
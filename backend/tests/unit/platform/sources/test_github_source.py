@@ -0,0 +1,128 @@
+"""Unit tests for listing GitHub repositories with the Git Trees API."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.platform.entities._base import Breadcrumb
+from airweave.platform.entities.github import GitHubCodeFileEntity, GitHubDirectoryEntity
+from airweave.platform.sources import github
+from airweave.platform.sources.github import GitHubSource
+
+TREE = [
+    {"path": "src", "type": "tree", "sha": "t1"},
+    {"path": "src/main.py", "type": "blob", "sha": "b1", "size": 10},
+    {"path": "src/util.py", "type": "blob", "sha": "b2", "size": 10},
+    {"path": "logo.png", "type": "blob", "sha": "b3", "size": 10},
+]
+
+
+@pytest.fixture
+async def source():
+    """Create a GitHub source with a stubbed file download."""
+    source = await GitHubSource.create(
+        MagicMock(personal_access_token="token", repo_name="owner/repo"), {}
+    )
+    source._get_with_auth = AsyncMock(
+        side_effect=lambda client, url, params=None: {
+            "sha": "sha",
+            "size": 10,
+            "encoding": "base64",
+            "content": "cHJpbnQoMSkK",
+            "html_url": url,
+        }
+    )
+    return source
+
+
+async def traverse(source, tree, stored=True):
+    """Collect the entities generated from a tree, confirming them as stored if requested."""
+    repo_breadcrumb = Breadcrumb(entity_id="1", name="repo", type="repository")
+    entities = [
+        entity
+        async for entity in source._traverse_tree(
+            MagicMock(), "owner/repo", tree, [repo_breadcrumb], "owner", "repo", "main"
+        )
+    ]
+    source.confirm_entities({entity.entity_id for entity in entities} if stored else set())
+    return entities
+
+
+@pytest.mark.asyncio
+async def test_first_sync_downloads_text_files(source):
+    """Test that the first sync downloads every text file and stores the blob SHAs."""
+    entities = await traverse(source, TREE)
+
+    assert [type(entity) for entity in entities] == [
+        GitHubDirectoryEntity,
+        GitHubCodeFileEntity,
+        GitHubCodeFileEntity,
+    ]
+    assert [b.name for b in entities[1].breadcrumbs] == ["repo", "src"]
+    # The binary file is not downloaded
+    assert source._get_with_auth.call_count == 2
+    assert source.get_cursor()["blob_shas"] == {
+        "src/main.py": "b1",
+        "src/util.py": "b2",
+        "logo.png": "b3",
+    }
+    assert not source.is_incremental()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_blobs_are_not_downloaded(source):
+    """Test that only changed files are downloaded and removed files are reported."""
+    await traverse(source, TREE)
+    source._get_with_auth.reset_mock()
+
+    changed_tree = [
+        {"path": "src", "type": "tree", "sha": "t2"},
+        {"path": "src/main.py", "type": "blob", "sha": "b1-changed", "size": 12},
+        {"path": "logo.png", "type": "blob", "sha": "b3", "size": 10},
+    ]
+    entities = await traverse(source, changed_tree)
+
+    assert [entity.entity_id for entity in entities] == ["owner/repo/src", "owner/repo/src/main.py"]
+    assert source._get_with_auth.call_count == 1
+    assert source.is_incremental()
+    assert source.get_deleted_entity_ids() == {"owner/repo/src/util.py"}
+
+
+@pytest.mark.asyncio
+async def test_files_that_were_not_stored_are_downloaded_again(source):
+    """Test that the SHA of a file is only stored once the file is confirmed as stored."""
+    await traverse(source, TREE, stored=False)
+    assert source.get_cursor()["blob_shas"]["src/main.py"] is None
+    source._get_with_auth.reset_mock()
+
+    entities = await traverse(source, TREE)
+
+    assert [entity.entity_id for entity in entities] == [
+        "owner/repo/src",
+        "owner/repo/src/main.py",
+        "owner/repo/src/util.py",
+    ]
+    assert source.get_cursor()["blob_shas"]["src/main.py"] == "b1"
+
+
+@pytest.mark.asyncio
+async def test_file_that_became_oversized_is_deleted(source):
+    """Test that a stored file which is now too large to index is reported as deleted."""
+    await traverse(source, TREE)
+
+    changed_tree = [
+        {"path": "src", "type": "tree", "sha": "t1"},
+        {
+            "path": "src/main.py",
+            "type": "blob",
+            "sha": "b1-large",
+            "size": github.MAX_TEXT_DETECTION_SIZE + 1,
+        },
+        {"path": "src/util.py", "type": "blob", "sha": "b2", "size": 10},
+        {"path": "logo.png", "type": "blob", "sha": "b3", "size": 10},
+    ]
+    entities = await traverse(source, changed_tree)
+
+    assert [entity.entity_id for entity in entities] == ["owner/repo/src"]
+    assert source.get_deleted_entity_ids() == {"owner/repo/src/main.py"}
+    assert source.get_cursor()["blob_shas"]["src/main.py"] == "b1-large"
@@ -0,0 +1,73 @@
+"""Unit tests for reading Gmail changes from the mailbox history."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from airweave.platform.sources.gmail import GmailSource
+
+
+def http_error(status_code):
+    """Create an HTTP error with a status code."""
+    request = httpx.Request("GET", "https://gmail.googleapis.com")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+@pytest.fixture
+async def source():
+    """Create a Gmail source with a stored history ID."""
+    source = await GmailSource.create("token")
+    source.set_cursor({"history_id": "100"})
+    return source
+
+
+@pytest.mark.asyncio
+async def test_deleted_messages_are_reported_with_attachments(source):
+    """Test that deleted messages and their attachments are reported and the cursor moves."""
+    source._get_with_auth = AsyncMock(
+        return_value={
+            "history": [
+                {"messagesDeleted": [{"message": {"id": "m1", "threadId": "t1"}}]},
+                {"labelsAdded": [{"message": {"id": "m2", "threadId": "t2"}}]},
+            ],
+            "historyId": "200",
+        }
+    )
+
+    entities = await source._generate_delta_entities(MagicMock())
+
+    assert entities is not None
+    assert source.is_incremental()
+    assert source.get_deleted_entity_ids() == {"m1"}
+    assert source.get_deleted_entity_prefixes() == {"m1_"}
+    assert source.get_cursor()["history_id"] == "200"
+
+
+@pytest.mark.asyncio
+async def test_deleted_thread_is_reported_with_its_messages(source):
+    """Test that a thread that no longer exists is reported with its messages."""
+    source._fetch_thread = AsyncMock(side_effect=http_error(404))
+
+    entities = [
+        entity
+        async for entity in source._generate_changed_thread_entities(
+            MagicMock(), {"t1": {"m1", "m2"}}
+        )
+    ]
+
+    assert entities == []
+    assert source.get_deleted_entity_ids() == {"t1", "m1", "m2"}
+    assert source.get_deleted_entity_prefixes() == {"m1_", "m2_"}
+
+
+@pytest.mark.asyncio
+async def test_expired_history_requires_full_sync(source):
+    """Test that an expired history ID falls back to a full sync."""
+    source._get_with_auth = AsyncMock(side_effect=http_error(404))
+
+    assert await source._generate_delta_entities(MagicMock()) is None
+    assert not source.is_incremental()
+    assert source.get_cursor()["history_id"] == "100"
@@ -0,0 +1,81 @@
+"""Unit tests for resolving Google Drive file paths from cached folders."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.platform.sources.google_drive import FOLDER_MIME_TYPE, GoogleDriveSource
+
+FOLDERS = {
+    "root-id": {"id": "root-id", "name": "My Drive"},
+    "docs": {"id": "docs", "name": "docs", "parents": ["root-id"]},
+    "specs": {"id": "specs", "name": "specs", "parents": ["docs"]},
+}
+
+
+@pytest.fixture
+async def source():
+    """Create a Google Drive source that serves folders from a fixed tree."""
+    source = await GoogleDriveSource.create("token", {})
+    source._get_with_auth = AsyncMock(
+        side_effect=lambda client, url, params=None: FOLDERS[url.rsplit("/", 1)[1]]
+    )
+    return source
+
+
+@pytest.mark.asyncio
+async def test_folders_are_fetched_once(source):
+    """Test that each parent folder is only requested once per sync."""
+    first = {"id": "a", "name": "a.pdf", "parents": ["specs"]}
+    second = {"id": "b", "name": "b.pdf", "parents": ["specs"]}
+
+    assert await source._get_file_path(MagicMock(), first) == "My Drive/docs/specs/a.pdf"
+    assert await source._get_file_path(MagicMock(), second) == "My Drive/docs/specs/b.pdf"
+    assert source._get_with_auth.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetched_folders_need_no_requests(source):
+    """Test that paths are resolved from the bulk folder listing."""
+    source._get_with_auth = AsyncMock(return_value={"files": list(FOLDERS.values())})
+    await source._prefetch_folders(MagicMock())
+    source._get_with_auth.reset_mock()
+
+    file_obj = {"id": "a", "name": "a.pdf", "parents": ["specs"]}
+
+    assert await source._get_file_path(MagicMock(), file_obj) == "My Drive/docs/specs/a.pdf"
+    source._get_with_auth.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changes_report_deleted_files_and_store_next_token(source):
+    """Test that removed and trashed files are deleted and changed files are processed."""
+    source._get_with_auth = AsyncMock(
+        side_effect=[
+            {
+                "changes": [
+                    {"fileId": "removed", "removed": True},
+                    {"fileId": "trashed", "file": {"id": "trashed", "trashed": True}},
+                ],
+                "nextPageToken": "page-2",
+            },
+            {
+                "changes": [
+                    {"fileId": "folder", "file": {"mimeType": FOLDER_MIME_TYPE}},
+                    {"fileId": "changed", "file": {"id": "changed", "mimeType": "text/plain"}},
+                    {"changeType": "drive", "driveId": "drive"},
+                ],
+                "newStartPageToken": "next",
+            },
+        ]
+    )
+    source._process_file = AsyncMock(return_value=MagicMock())
+
+    entities = [
+        entity async for entity in source._generate_changed_file_entities(MagicMock(), "start")
+    ]
+
+    assert len(entities) == 1
+    assert source._process_file.call_args.args[1]["id"] == "changed"
+    assert source.get_deleted_entity_ids() == {"removed", "trashed"}
+    assert source.get_cursor()["page_token"] == "next"
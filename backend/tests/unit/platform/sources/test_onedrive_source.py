@@ -0,0 +1,60 @@
+"""Unit tests for reading OneDrive changes with delta queries."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.platform.sources.onedrive import OneDriveSource
+
+
+@pytest.fixture
+async def source():
+    """Create a OneDrive source."""
+    return await OneDriveSource.create("token")
+
+
+@pytest.mark.asyncio
+async def test_lists_changes_and_stores_next_delta_link(source):
+    """Test that all delta pages are read and the new delta link is stored."""
+    source._get_with_auth = AsyncMock(
+        side_effect=[
+            {"value": [{"id": "a", "file": {}}], "@odata.nextLink": "page-2"},
+            {"value": [{"id": "b", "deleted": {}, "file": {}}], "@odata.deltaLink": "next"},
+        ]
+    )
+
+    items = await source._list_changes(MagicMock(), "previous")
+
+    assert [item["id"] for item in items] == ["a", "b"]
+    assert source.get_cursor()["delta_link"] == "next"
+
+
+@pytest.mark.asyncio
+async def test_deleted_folder_requires_full_sync(source):
+    """Test that a deleted folder falls back to a full sync."""
+    source._get_with_auth = AsyncMock(
+        return_value={
+            "value": [{"id": "f", "deleted": {}, "folder": {}}],
+            "@odata.deltaLink": "next",
+        }
+    )
+
+    assert await source._list_changes(MagicMock(), "previous") is None
+    assert "delta_link" not in source.get_cursor()
+
+
+@pytest.mark.asyncio
+async def test_reports_deleted_items(source):
+    """Test that deleted items are reported and folders are skipped."""
+    source._process_drive_item = AsyncMock(return_value=MagicMock(name="file"))
+    items = [{"id": "gone", "deleted": {}}, {"id": "changed", "file": {}}]
+
+    entities = [
+        entity
+        async for entity in source._generate_changed_item_entities(
+            MagicMock(), items, "drive", "OneDrive"
+        )
+    ]
+
+    assert len(entities) == 1
+    assert source.get_deleted_entity_ids() == {"gone"}
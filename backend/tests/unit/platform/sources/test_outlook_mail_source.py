@@ -0,0 +1,25 @@
+"""Unit tests for reading Outlook mail changes with delta queries."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.platform.sources.outlook_mail import OutlookMailSource
+
+
+@pytest.mark.asyncio
+async def test_removed_messages_are_reported_with_attachments():
+    """Test that removed messages are reported together with their attachments."""
+    source = await OutlookMailSource.create("token")
+    messages = [{"id": "m1", "@removed": {"reason": "deleted"}}]
+
+    entities = [
+        entity
+        async for entity in source._process_message_page(
+            MagicMock(), messages, MagicMock(display_name="Inbox"), MagicMock()
+        )
+    ]
+
+    assert entities == []
+    assert source.get_deleted_entity_ids() == {"m1"}
+    assert source.get_deleted_entity_prefixes() == {"m1_attachment_"}
@@ -0,0 +1,43 @@
+"""Unit tests for reading only new Slack messages."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.platform.sources.slack import SlackSource
+
+
+@pytest.fixture
+async def source():
+    """Create a Slack source."""
+    return await SlackSource.create(MagicMock(access_token="token"))
+
+
+@pytest.mark.asyncio
+async def test_stores_newest_message_per_channel(source):
+    """Test that the newest message timestamp of a channel is stored after all pages."""
+    source._get_with_auth = AsyncMock(
+        side_effect=[
+            {"messages": [{"ts": "20.0"}], "response_metadata": {"next_cursor": "page-2"}},
+            {"messages": [{"ts": "10.0"}]},
+        ]
+    )
+
+    entities = [entity async for entity in source._generate_message_entities(MagicMock(), "C1")]
+
+    assert len(entities) == 2
+    assert source.get_cursor()["oldest"] == {"C1": "20.0"}
+
+
+@pytest.mark.asyncio
+async def test_reads_messages_after_stored_timestamp(source):
+    """Test that a later sync only requests messages newer than the stored timestamp."""
+    source.set_cursor({"oldest": {"C1": "20.0"}})
+    source._get_with_auth = AsyncMock(return_value={"messages": []})
+
+    entities = [entity async for entity in source._generate_message_entities(MagicMock(), "C1")]
+
+    assert entities == []
+    assert source._get_with_auth.call_args.kwargs["params"]["oldest"] == "20.0"
+    # A channel without new messages keeps its timestamp
+    assert source.get_cursor()["oldest"] == {"C1": "20.0"}
@@ -0,0 +1,110 @@
+"""Tests for the SQLite source."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from airweave.platform.sources.sqlite import SQLiteSource
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Create a SQLite database with a keyed and an unkeyed table."""
+    path = tmp_path / "test.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, version INTEGER)")
+    conn.executemany(
+        "INSERT INTO items (id, name, version) VALUES (?, ?, ?)",
+        [(i, f"item {i}", i) for i in (5, 1, 3, 2, 4)],
+    )
+    conn.execute("CREATE TABLE notes (body TEXT)")
+    conn.executemany("INSERT INTO notes (body) VALUES (?)", [("a",), ("b",), ("c",)])
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+async def _collect(source: SQLiteSource) -> list:
+    with patch("airweave.platform.sources.sqlite.settings") as mock_settings:
+        mock_settings.SQL_SOURCE_BATCH_SIZE = 2
+        return [entity async for entity in source.generate_entities()]
+
+
+def _source(database: str, tables: str, incremental_column: str = "") -> SQLiteSource:
+    source = SQLiteSource()
+    source.config = {"database": database, "tables": tables}
+    source.incremental_column = incremental_column
+    return source
+
+
+class TestSQLiteSource:
+    """Tests for batched reads of the SQLite source."""
+
+    @pytest.mark.asyncio
+    async def test_pages_by_primary_key(self, database):
+        """Test that keyed tables are read in key order across batches without duplicates."""
+        entities = await _collect(_source(database, "items"))
+
+        assert [entity.entity_id for entity in entities] == [f"main.items:{i}" for i in range(1, 6)]
+
+    @pytest.mark.asyncio
+    async def test_table_without_primary_key(self, database):
+        """Test that tables without a primary key are read completely."""
+        entities = await _collect(_source(database, "notes"))
+
+        assert sorted(entity.body for entity in entities) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_reads_changed_rows(self, database):
+        """Test that later syncs only read rows changed since the stored watermark."""
+        first = _source(database, "items", incremental_column="version")
+        assert len(await _collect(first)) == 5
+        assert not first.is_incremental()
+        assert first.get_cursor() == {"watermarks": {"main.items": 5}}
+
+        conn = sqlite3.connect(database)
+        conn.execute("UPDATE items SET name = 'changed', version = 6 WHERE id = 2")
+        conn.commit()
+        conn.close()
+
+        second = _source(database, "items", incremental_column="version")
+        second.set_cursor(first.get_cursor())
+        entities = await _collect(second)
+
+        assert [entity.entity_id for entity in entities] == ["main.items:2", "main.items:5"]
+        assert second.get_cursor() == {"watermarks": {"main.items": 6}}
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_lists_existing_rows(self, database):
+        """Test that unchanged rows are reported as present, so deleted rows can be removed."""
+        first = _source(database, "items,notes", incremental_column="version")
+        await _collect(first)
+
+        conn = sqlite3.connect(database)
+        conn.execute("DELETE FROM items WHERE id = 3")
+        conn.commit()
+        conn.close()
+
+        second = _source(database, "items,notes", incremental_column="version")
+        second.set_cursor(first.get_cursor())
+        entities = await _collect(second)
+
+        # Only the watermarked table is read incrementally, the run as a whole is not
+        assert not second.is_incremental()
+        assert second.get_present_entity_ids() == {f"main.items:{i}" for i in (1, 2, 4, 5)}
+        assert sorted(entity.body for entity in entities if hasattr(entity, "body")) == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_keyset_query(self):
+        """Test that the next batch starts after the last key of the previous one."""
+        source = SQLiteSource()
+        with patch("airweave.platform.sources.sqlite.settings") as mock_settings:
+            mock_settings.SQL_SOURCE_BATCH_SIZE = 10
+            query, params = source._build_batch_query("t", ["a", "b"], (1, "x"), 10)
+
+        assert query == 'SELECT * FROM "t" WHERE ("a", "b") > (?, ?) ORDER BY "a", "b" LIMIT 10'
+        assert params == (1, "x")
@@ -0,0 +1,330 @@
+"""Unit tests for batched entity processing in the sync pipeline."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.entities._base import ChunkEntity
+from airweave.platform.entities.dropbox import DropboxFileEntity
+from airweave.platform.sync.entity_processor import EntityProcessor, get_point_id
+from airweave.platform.sync.stream import AsyncSourceStream
+
+
+class MockChunkEntity(ChunkEntity):
+    """Mock ChunkEntity for testing."""
+
+    name: str = "Test Entity"
+
+
+@pytest.fixture
+def sync_context():
+    """Create a mock sync context with a single destination."""
+    context = MagicMock()
+    context.sync.id = uuid.uuid4()
+    context.sync.organization_id = uuid.uuid4()
+    context.sync_job.id = uuid.uuid4()
+    context.source._name = "test"
+    context.progress = AsyncMock()
+    context.embedding_model.embed_many = AsyncMock(
+        side_effect=lambda texts: [[0.1, 0.2] for _ in texts]
+    )
+    context.destinations = [AsyncMock()]
+    context.destinations[0].flush.return_value = set()
+    context.router.process_entity = AsyncMock(side_effect=lambda db, producer_id, entity: [entity])
+    return context
+
+
+class TestEntityBatches:
+    """Tests for AsyncSourceStream.get_entity_batches."""
+
+    @pytest.mark.asyncio
+    async def test_batches_by_size(self):
+        """Test that full batches are emitted and the remainder is flushed at the end."""
+
+        async def generator():
+            for i in range(5):
+                yield MockChunkEntity(entity_id=str(i))
+
+        async with AsyncSourceStream(generator()) as stream:
+            batches = [
+                batch async for batch in stream.get_entity_batches(batch_size=2, max_wait=10)
+            ]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [e.entity_id for batch in batches for e in batch] == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_batches_by_deadline(self):
+        """Test that a partial batch is emitted once the deadline passes."""
+
+        async def generator():
+            yield MockChunkEntity(entity_id="fast")
+            await asyncio.sleep(0.2)
+            yield MockChunkEntity(entity_id="slow")
+
+        async with AsyncSourceStream(generator()) as stream:
+            batches = [
+                batch async for batch in stream.get_entity_batches(batch_size=10, max_wait=0.05)
+            ]
+
+        assert [[e.entity_id for e in batch] for batch in batches] == [["fast"], ["slow"]]
+
+
+class TestProcessBatch:
+    """Tests for EntityProcessor.process_batch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_lookup_embedding_and_write(self, sync_context):
+        """Test that every shared stage runs once for the whole batch."""
+        processor = EntityProcessor()
+        entities = [MockChunkEntity(entity_id=str(i)) for i in range(3)]
+
+        with (
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+            patch("airweave.crud.entity.bulk_upsert") as mock_upsert,
+        ):
+            mock_lookup.return_value = {}
+            mock_upsert.side_effect = lambda db, objs_in, organization_id: {
+                obj.entity_id: uuid.uuid4() for obj in objs_in
+            }
+
+            result = await processor.process_batch(entities, MagicMock(), sync_context, AsyncMock())
+
+            await processor.flush(sync_context, AsyncMock())
+
+        assert len(result) == 3
+        mock_lookup.assert_called_once()
+        sync_context.embedding_model.embed_many.assert_called_once()
+        mock_upsert.assert_called_once()
+        sync_context.destinations[0].bulk_insert.assert_called_once()
+        sync_context.progress.increment.assert_any_call("inserted", 3)
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_failed_entity_only(self, sync_context):
+        """Test that a transform failure only skips the offending entity."""
+        processor = EntityProcessor()
+        entities = [MockChunkEntity(entity_id="ok"), MockChunkEntity(entity_id="broken")]
+
+        async def process_entity(db, producer_id, entity):
+            if entity.entity_id == "broken":
+                raise ValueError("boom")
+            return [entity]
+
+        sync_context.router.process_entity = AsyncMock(side_effect=process_entity)
+
+        with (
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+            patch("airweave.crud.entity.bulk_upsert") as mock_upsert,
+        ):
+            mock_lookup.return_value = {}
+            mock_upsert.side_effect = lambda db, objs_in, organization_id: {
+                obj.entity_id: uuid.uuid4() for obj in objs_in
+            }
+
+            result = await processor.process_batch(entities, MagicMock(), sync_context, AsyncMock())
+
+            await processor.flush(sync_context, AsyncMock())
+
+        assert [e.entity_id for e in result] == ["ok"]
+        sync_context.progress.increment.assert_any_call("skipped", 1)
+        sync_context.progress.increment.assert_any_call("inserted", 1)
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_unchanged_entities(self, sync_context):
+        """Test that entities with a matching stored hash are kept."""
+        processor = EntityProcessor()
+        entity = MockChunkEntity(entity_id="same")
+        entity.sync_id = sync_context.sync.id
+
+        with patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup:
+            mock_lookup.return_value = {"same": (uuid.uuid4(), entity.hash())}
+
+            result = await processor.process_batch([entity], MagicMock(), sync_context, AsyncMock())
+
+        assert result == []
+        sync_context.progress.increment.assert_any_call("kept", 1)
+        sync_context.embedding_model.embed_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_is_not_downloaded(self, sync_context):
+        """Test that a file with an unchanged version token is kept without downloading it."""
+        processor = EntityProcessor()
+        entity = DropboxFileEntity(
+            entity_id="file", file_id="file", name="a.pdf", download_url="u", content_hash="v1"
+        )
+        download = AsyncMock(return_value=entity)
+        entity.defer_download(download)
+
+        with patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup:
+            mock_lookup.return_value = {"file": (uuid.uuid4(), entity.hash())}
+
+            await processor.process_batch([entity], MagicMock(), sync_context, AsyncMock())
+
+        download.assert_not_called()
+        sync_context.progress.increment.assert_any_call("kept", 1)
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_downloaded_before_transform(self, sync_context):
+        """Test that a changed file is downloaded and a failed download is skipped."""
+        processor = EntityProcessor()
+        changed = DropboxFileEntity(
+            entity_id="changed",
+            file_id="changed",
+            name="a.pdf",
+            download_url="u",
+            content_hash="v2",
+        )
+        failing = DropboxFileEntity(
+            entity_id="failing",
+            file_id="failing",
+            name="b.pdf",
+            download_url="u",
+            content_hash="v2",
+        )
+        changed.defer_download(AsyncMock(return_value=changed))
+        failing.defer_download(AsyncMock(return_value=None))
+
+        with (
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+            patch("airweave.crud.entity.bulk_upsert") as mock_upsert,
+        ):
+            mock_lookup.return_value = {
+                "changed": (uuid.uuid4(), "old-hash"),
+                "failing": (uuid.uuid4(), "old-hash"),
+            }
+            mock_upsert.side_effect = lambda db, objs_in, organization_id: {
+                obj.entity_id: uuid.uuid4() for obj in objs_in
+            }
+
+            await processor.process_batch(
+                [changed, failing], MagicMock(), sync_context, AsyncMock()
+            )
+
+            await processor.flush(sync_context, AsyncMock())
+
+        transformed = [
+            call.kwargs["entity"] for call in sync_context.router.process_entity.call_args_list
+        ]
+        assert [entity.entity_id for entity in transformed] == ["changed"]
+        assert not changed.download_pending
+        sync_context.progress.increment.assert_any_call("skipped", 1)
+        sync_context.progress.increment.assert_any_call("updated", 1)
+
+    @pytest.mark.asyncio
+    async def test_downloads_are_bounded(self, sync_context):
+        """Test that no more files than the download concurrency are downloaded at once."""
+        processor = EntityProcessor(download_concurrency=2)
+        running = 0
+        max_running = 0
+        files = []
+        for i in range(5):
+            file = DropboxFileEntity(
+                entity_id=str(i), file_id=str(i), name="a.pdf", download_url="u", content_hash="v"
+            )
+
+            async def download(file=file):
+                nonlocal running, max_running
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return file
+
+            file.defer_download(download)
+            files.append((file, None, None))
+
+        await processor._download_files(files, sync_context)
+
+        assert max_running == 2
+        assert not any(file.download_pending for file, _, _ in files)
+
+    @pytest.mark.asyncio
+    async def test_preloaded_hashes_skip_lookup(self, sync_context):
+        """Test that preloaded hashes are used instead of per-batch lookups."""
+        processor = EntityProcessor(hash_preload_max_entities=10)
+        entity = MockChunkEntity(entity_id="same")
+
+        with (
+            patch("airweave.crud.entity.get_count_by_sync_id") as mock_count,
+            patch("airweave.crud.entity.get_hashes_by_sync_id") as mock_preload,
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+        ):
+            mock_count.return_value = 1
+            mock_preload.return_value = {"same": (uuid.uuid4(), entity.hash())}
+
+            await processor.preload_entity_hashes(sync_context, AsyncMock())
+            await processor.process_batch([entity], MagicMock(), sync_context, AsyncMock())
+
+        mock_lookup.assert_not_called()
+        sync_context.progress.increment.assert_any_call("kept", 1)
+
+    @pytest.mark.asyncio
+    async def test_preload_skipped_for_large_syncs(self, sync_context):
+        """Test that syncs above the preload limit fall back to batch lookups."""
+        processor = EntityProcessor(hash_preload_max_entities=10)
+
+        with (
+            patch("airweave.crud.entity.get_count_by_sync_id") as mock_count,
+            patch("airweave.crud.entity.get_hashes_by_sync_id") as mock_preload,
+        ):
+            mock_count.return_value = 11
+            await processor.preload_entity_hashes(sync_context, AsyncMock())
+
+        mock_preload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_upserts_deterministic_ids_and_drops_surplus(self, sync_context):
+        """Test that updates overwrite points by ID and only delete points no longer produced."""
+        processor = EntityProcessor()
+        entity = MockChunkEntity(entity_id="changed")
+        sync_context.router.process_entity = AsyncMock(
+            side_effect=lambda db, producer_id, entity: [entity, entity.model_copy()]
+        )
+
+        with (
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+            patch("airweave.crud.entity.bulk_upsert") as mock_upsert,
+        ):
+            mock_lookup.return_value = {"changed": (uuid.uuid4(), "old-hash")}
+            mock_upsert.return_value = {"changed": uuid.uuid4()}
+
+            result = await processor.process_batch([entity], MagicMock(), sync_context, AsyncMock())
+
+            await processor.flush(sync_context, AsyncMock())
+
+        expected_ids = [
+            get_point_id(sync_context.sync.id, "changed", chunk_index) for chunk_index in (0, 1)
+        ]
+        assert [e.db_entity_id for e in result] == expected_ids
+
+        destination = sync_context.destinations[0]
+        destination.bulk_insert.assert_called_once_with(result)
+        destination.bulk_delete_by_parent_ids.assert_called_once_with(
+            ["changed"], sync_context.sync.id, exclude_ids=expected_ids
+        )
+        sync_context.progress.increment.assert_any_call("updated", 1)
+
+    @pytest.mark.asyncio
+    async def test_hashes_are_stored_only_after_confirmed_writes(self, sync_context):
+        """Test that hashes wait for the flush and are not stored for failed writes."""
+        processor = EntityProcessor()
+        entities = [MockChunkEntity(entity_id="ok"), MockChunkEntity(entity_id="lost")]
+        sync_context.destinations[0].flush.return_value = {"lost"}
+
+        with (
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+            patch("airweave.crud.entity.bulk_upsert") as mock_upsert,
+        ):
+            mock_lookup.return_value = {}
+            mock_upsert.return_value = {"ok": uuid.uuid4()}
+
+            await processor.process_batch(entities, MagicMock(), sync_context, AsyncMock())
+            mock_upsert.assert_not_called()
+
+            await processor.flush(sync_context, AsyncMock())
+
+        assert [obj.entity_id for obj in mock_upsert.call_args.kwargs["objs_in"]] == ["ok"]
+        sync_context.progress.increment.assert_any_call("inserted", 1)
+        sync_context.progress.increment.assert_any_call("skipped", 1)
@@ -0,0 +1,250 @@
+"""Unit tests for the SyncOrchestrator finalize stage."""
+
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.sync.entity_processor import EntityProcessor
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+
+
+@asynccontextmanager
+async def mock_db_context():
+    """Yield a mock database session."""
+    yield AsyncMock()
+
+
+@pytest.fixture
+def orchestrator():
+    """Create an orchestrator with a mock sync context."""
+    sync_context = MagicMock()
+    sync_context.sync.id = uuid.uuid4()
+    sync_context.sync_job.id = uuid.uuid4()
+    sync_context.progress = AsyncMock()
+    sync_context.destinations = [AsyncMock()]
+    sync_context.source.is_incremental.return_value = False
+    sync_context.source.get_present_entity_ids.return_value = set()
+
+    return SyncOrchestrator(
+        entity_processor=EntityProcessor(),
+        worker_pool=MagicMock(),
+        sync_context=sync_context,
+    )
+
+
+class TestOrphanCleanup:
+    """Tests for SyncOrchestrator._cleanup_orphaned_entities."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_entities_not_encountered(self, orchestrator):
+        """Test that only entities missing from this job are deleted."""
+        orchestrator.entity_processor._entities_encountered_count = {"Entity": {"kept", "failed"}}
+        outdated = [
+            MagicMock(id=uuid.uuid4(), entity_id="failed"),
+            MagicMock(id=uuid.uuid4(), entity_id="gone"),
+        ]
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.crud.entity.get_all_outdated") as mock_outdated,
+            patch("airweave.crud.entity.bulk_remove") as mock_remove,
+        ):
+            mock_outdated.return_value = outdated
+            await orchestrator._cleanup_orphaned_entities()
+
+        sync_id = orchestrator.sync_context.sync.id
+        orchestrator.sync_context.destinations[0].bulk_delete.assert_called_once_with(
+            ["gone"], sync_id
+        )
+        assert mock_remove.call_args.kwargs["ids"] == [outdated[1].id]
+        orchestrator.sync_context.progress.increment.assert_called_once_with("deleted", 1)
+
+    @pytest.mark.asyncio
+    async def test_keeps_entities_reported_as_present(self, orchestrator):
+        """Test that unchanged entities the source listed but did not generate are kept."""
+        orchestrator.entity_processor._entities_encountered_count = {"Entity": {"changed"}}
+        orchestrator.sync_context.source.get_present_entity_ids.return_value = {"unchanged"}
+        outdated = [
+            MagicMock(id=uuid.uuid4(), entity_id="unchanged"),
+            MagicMock(id=uuid.uuid4(), entity_id="deleted"),
+        ]
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.crud.entity.get_all_outdated") as mock_outdated,
+            patch("airweave.crud.entity.bulk_remove") as mock_remove,
+        ):
+            mock_outdated.return_value = outdated
+            await orchestrator._cleanup_orphaned_entities()
+
+        orchestrator.sync_context.destinations[0].bulk_delete.assert_called_once_with(
+            ["deleted"], orchestrator.sync_context.sync.id
+        )
+        assert mock_remove.call_args.kwargs["ids"] == [outdated[1].id]
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_chunks(self, orchestrator):
+        """Test that large orphan sets are deleted in chunks."""
+        orchestrator.entity_processor._entities_encountered_count = {"Entity": {"kept"}}
+        outdated = [MagicMock(id=uuid.uuid4(), entity_id=str(i)) for i in range(5)]
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.platform.sync.orchestrator.ORPHAN_DELETE_BATCH_SIZE", 2),
+            patch("airweave.crud.entity.get_all_outdated") as mock_outdated,
+            patch("airweave.crud.entity.bulk_remove") as mock_remove,
+        ):
+            mock_outdated.return_value = outdated
+            await orchestrator._cleanup_orphaned_entities()
+
+        assert orchestrator.sync_context.destinations[0].bulk_delete.call_count == 3
+        assert mock_remove.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_skips_cleanup_for_empty_run(self, orchestrator):
+        """Test that nothing is deleted when the job encountered no entities."""
+        with patch("airweave.crud.entity.get_all_outdated") as mock_outdated:
+            await orchestrator._cleanup_orphaned_entities()
+
+        mock_outdated.assert_not_called()
+        orchestrator.sync_context.destinations[0].bulk_delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_skips_cleanup_for_incremental_run(self, orchestrator):
+        """Test that unchanged entities of an incremental run are not deleted."""
+        orchestrator.entity_processor._entities_encountered_count = {"Entity": {"changed"}}
+        orchestrator.sync_context.source.is_incremental.return_value = True
+        orchestrator.sync_context.source.get_deleted_entity_ids.return_value = set()
+        orchestrator.sync_context.source.get_deleted_entity_prefixes.return_value = set()
+
+        with patch("airweave.crud.entity.get_all_outdated") as mock_outdated:
+            await orchestrator._cleanup_orphaned_entities()
+
+        mock_outdated.assert_not_called()
+        orchestrator.sync_context.destinations[0].bulk_delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deletes_reported_entities_for_incremental_run(self, orchestrator):
+        """Test that an incremental run deletes the entities the source reported as deleted."""
+        orchestrator.entity_processor._entities_encountered_count = {"Entity": {"recreated"}}
+        orchestrator.sync_context.source.is_incremental.return_value = True
+        orchestrator.sync_context.source.get_deleted_entity_ids.return_value = {
+            "gone",
+            "recreated",
+            "unknown",
+        }
+        orchestrator.sync_context.source.get_deleted_entity_prefixes.return_value = set()
+        db_id = uuid.uuid4()
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+            patch("airweave.crud.entity.bulk_remove") as mock_remove,
+        ):
+            mock_lookup.return_value = {"gone": (db_id, "hash")}
+            await orchestrator._cleanup_orphaned_entities()
+
+        assert sorted(mock_lookup.call_args.args[1]) == ["gone", "unknown"]
+        orchestrator.sync_context.destinations[0].bulk_delete.assert_called_once_with(
+            ["gone"], orchestrator.sync_context.sync.id
+        )
+        assert mock_remove.call_args.kwargs["ids"] == [db_id]
+
+    @pytest.mark.asyncio
+    async def test_deletes_children_of_reported_entities(self, orchestrator):
+        """Test that children of deleted entities are found by their entity id prefix."""
+        orchestrator.entity_processor._entities_encountered_count = {"Entity": {"m1_new"}}
+        orchestrator.sync_context.source.is_incremental.return_value = True
+        orchestrator.sync_context.source.get_deleted_entity_ids.return_value = {"m1"}
+        orchestrator.sync_context.source.get_deleted_entity_prefixes.return_value = {"m1_"}
+        message_id, attachment_id = uuid.uuid4(), uuid.uuid4()
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.crud.entity.get_hashes_by_entity_ids") as mock_lookup,
+            patch("airweave.crud.entity.get_ids_by_entity_id_prefixes") as mock_prefixes,
+            patch("airweave.crud.entity.bulk_remove") as mock_remove,
+        ):
+            mock_lookup.return_value = {"m1": (message_id, "hash")}
+            mock_prefixes.return_value = {"m1_a1": attachment_id, "m1_new": uuid.uuid4()}
+            await orchestrator._cleanup_orphaned_entities()
+
+        assert mock_prefixes.call_args.args[1] == ["m1_"]
+        orchestrator.sync_context.destinations[0].bulk_delete.assert_called_once_with(
+            ["m1", "m1_a1"], orchestrator.sync_context.sync.id
+        )
+        assert mock_remove.call_args.kwargs["ids"] == [message_id, attachment_id]
+
+    @pytest.mark.asyncio
+    async def test_skipped_entities_are_encountered(self, orchestrator):
+        """Test that entities the source marked to skip are not treated as orphans."""
+        skipped = MagicMock(entity_id="too-large", should_skip=True)
+
+        async def generate_entities():
+            yield skipped
+
+        orchestrator.sync_context.source.generate_entities = generate_entities
+        orchestrator.worker_pool.wait_for_completion = AsyncMock()
+        orchestrator._flush_destinations = AsyncMock()
+        orchestrator._cleanup_orphaned_entities = AsyncMock()
+        orchestrator._save_source_cursor = AsyncMock()
+
+        await orchestrator._process_entity_stream(source_node=MagicMock())
+
+        assert orchestrator.entity_processor.get_encountered_entity_ids() == {"too-large"}
+        orchestrator.sync_context.progress.increment.assert_called_once_with("skipped")
+
+
+class TestSourceCursor:
+    """Tests for loading and storing the source cursor."""
+
+    @pytest.mark.asyncio
+    async def test_loads_stored_cursor(self, orchestrator):
+        """Test that the cursor of the previous job is handed to the source."""
+        with patch("airweave.crud.sync_cursor.get_by_sync_id") as mock_get:
+            mock_get.return_value = MagicMock(cursor_data={"watermarks": {"t": 1}})
+            await orchestrator._load_source_cursor(AsyncMock())
+
+        orchestrator.sync_context.source.set_cursor.assert_called_once_with(
+            {"watermarks": {"t": 1}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_saves_cursor(self, orchestrator):
+        """Test that the cursor of the source is stored for the sync."""
+        orchestrator.sync_context.source.get_cursor.return_value = {"watermarks": {"t": 2}}
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.crud.sync_cursor.upsert") as mock_upsert,
+        ):
+            await orchestrator._save_source_cursor()
+
+        assert mock_upsert.call_args.kwargs == {
+            "sync_id": orchestrator.sync_context.sync.id,
+            "cursor_data": {"watermarks": {"t": 2}},
+        }
+
+
+class TestRun:
+    """Tests for SyncOrchestrator.run."""
+
+    @pytest.mark.asyncio
+    async def test_embedding_model_closed_after_failure(self, orchestrator):
+        """Test that the embedding model is closed even when the sync fails."""
+        orchestrator.sync_context.embedding_model.close = AsyncMock()
+        orchestrator._process_entity_stream = AsyncMock(side_effect=RuntimeError("boom"))
+        orchestrator.entity_processor.preload_entity_hashes = AsyncMock()
+        orchestrator._load_source_cursor = AsyncMock()
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.platform.sync.orchestrator.sync_job_service") as mock_service,
+        ):
+            mock_service.update_status = AsyncMock()
+            with pytest.raises(RuntimeError):
+                await orchestrator.run()
+
+        orchestrator.sync_context.embedding_model.close.assert_awaited_once()
@@ -0,0 +1,82 @@
+"""Unit tests for the content-addressed conversion cache."""
+
+import asyncio
+import os
+
+import pytest
+
+from airweave.platform.file_handling.conversion._base import DocumentConverter
+from airweave.platform.file_handling.conversion.cache import (
+    DiskConversionCacheBackend,
+    conversion_cache_key,
+)
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_hit_and_miss(tmp_path):
+    """Test that stored markdown is returned for its key only."""
+    cache = DiskConversionCacheBackend(str(tmp_path), max_size=1000)
+
+    await cache.set("PdfConverter:1:abc", "# Report")
+
+    assert await cache.get("PdfConverter:1:abc") == "# Report"
+    assert await cache.get("PdfConverter:2:abc") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """Test that the least recently read entries are removed once the cache is full."""
+    cache = DiskConversionCacheBackend(str(tmp_path), max_size=25)
+    cache.EVICTION_INTERVAL = 0
+
+    await cache.set("first", "a" * 10)
+    await cache.set("second", "b" * 10)
+    os.utime(cache._path("first"), (1, 1))
+    os.utime(cache._path("second"), (2, 2))
+    # Reading the first entry makes the second one the least recently used
+    await cache.get("first")
+    await cache.set("third", "c" * 10)
+
+    assert await cache.get("first") == "a" * 10
+    assert await cache.get("second") is None
+    assert await cache.get("third") == "c" * 10
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_eviction_is_throttled(tmp_path):
+    """Test that the directory is not scanned again within the eviction interval."""
+    cache = DiskConversionCacheBackend(str(tmp_path), max_size=15)
+    cache.EVICTION_INTERVAL = 0
+    await cache.set("first", "a" * 10)
+    cache.EVICTION_INTERVAL = 60
+
+    await cache.set("second", "b" * 10)
+
+    assert await cache.get("first") == "a" * 10
+    assert await cache.get("second") == "b" * 10
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_concurrent_writes_of_a_key(tmp_path):
+    """Test that concurrent writes of the same key do not share a temporary file."""
+    cache = DiskConversionCacheBackend(str(tmp_path), max_size=100_000)
+
+    await asyncio.gather(*(cache.set("key", str(i) * 1000) for i in range(10)))
+
+    assert await cache.get("key") in {str(i) * 1000 for i in range(10)}
+    assert os.listdir(tmp_path) == [os.path.basename(cache._path("key"))]
+
+
+class MarkdownConverter(DocumentConverter):
+    """Converter used to build cache keys."""
+
+    VERSION = "2"
+
+    async def convert(self, local_path, **kwargs):
+        """Convert nothing."""
+        return None
+
+
+def test_cache_key_includes_converter_and_version():
+    """Test that the key changes with the converter version, so stale output is not reused."""
+    assert conversion_cache_key("abc", MarkdownConverter()) == "MarkdownConverter:2:abc"
@@ -0,0 +1,67 @@
+"""Unit tests for saving file entity streams."""
+
+import hashlib
+import os
+
+import pytest
+
+from airweave.platform.entities._base import FileEntity
+from airweave.platform.file_handling.file_manager import FileManager
+
+CHUNKS = [b"first chunk, ", b"second chunk, ", b"last chunk"]
+
+
+async def stream(chunks):
+    """Yield chunks like a download stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+def make_entity(**kwargs):
+    """Create a file entity with a download URL."""
+    return FileEntity(
+        entity_id="file-1",
+        file_id="file-1",
+        name="report.txt",
+        download_url="https://example.com/report.txt",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_checksum_is_computed_while_streaming():
+    """Test that the checksum is stored on the entity and reused as its hash."""
+    entity = await FileManager().handle_file_entity(stream(CHUNKS), make_entity())
+
+    expected = hashlib.sha256(b"".join(CHUNKS)).hexdigest()
+    assert entity.checksum == expected
+    assert entity.total_size == sum(len(chunk) for chunk in CHUNKS)
+
+    os.remove(entity.local_path)
+    # The file is not read again to hash the entity
+    assert entity.hash() == expected
+
+
+@pytest.mark.asyncio
+async def test_stream_exceeding_max_size_is_skipped():
+    """Test that a download is aborted and removed once it exceeds the maximum size."""
+    entity = await FileManager().handle_file_entity(stream(CHUNKS), make_entity(), max_size=20)
+
+    assert entity.should_skip
+    assert entity.local_path is None
+
+
+@pytest.mark.asyncio
+async def test_known_size_above_max_size_is_not_downloaded():
+    """Test that files reported as too large by the source are skipped without reading."""
+
+    async def failing_stream():
+        raise AssertionError("The file should not be downloaded")
+        yield b""
+
+    entity = await FileManager().handle_file_entity(
+        failing_stream(), make_entity(total_size=100), max_size=20
+    )
+
+    assert entity.should_skip
+    assert entity.local_path is None
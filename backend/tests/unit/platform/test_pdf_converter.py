@@ -0,0 +1,79 @@
+"""Unit tests for the page-parallel Mistral OCR of large PDFs."""
+
+import asyncio
+import random
+from unittest.mock import patch
+
+import pytest
+
+from airweave.platform.file_handling.conversion.converters import pdf_converter
+from airweave.platform.file_handling.conversion.converters.pdf_converter import PdfConverter
+
+BATCHES = [(0, 2, "batch_1.pdf"), (2, 4, "batch_3.pdf"), (4, 5, "batch_5.pdf")]
+
+
+async def fake_split(func, *args, timeout=None):
+    """Return fixed batches and pages instead of splitting a PDF."""
+    if func is pdf_converter._split_pdf:
+        return "Title", BATCHES
+    _, _, start_idx, end_idx = args
+    return [(i, i + 1, f"page_{i + 1}.pdf") for i in range(start_idx, end_idx)]
+
+
+@pytest.fixture
+def converter():
+    """Create a converter with a limit of two concurrent OCR requests."""
+    with (
+        patch.object(pdf_converter, "run_in_process", side_effect=fake_split),
+        patch.object(pdf_converter.settings, "MISTRAL_OCR_CONCURRENCY", 2),
+    ):
+        yield PdfConverter()
+
+
+@pytest.fixture
+def large_pdf(tmp_path):
+    """Create a stand-in for a large PDF, which is never parsed since splitting is faked."""
+    path = tmp_path / "large.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_and_merge_in_page_order(converter, large_pdf):
+    """Test that batches are processed concurrently up to the limit and merged in order."""
+    running = 0
+    max_running = 0
+
+    async def ocr(path):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(random.uniform(0, 0.02))
+        running -= 1
+        return path, None
+
+    converter._process_single_pdf = ocr
+
+    md_content, title, complete = await converter._process_large_pdf(large_pdf)
+
+    assert md_content == "batch_1.pdf\n\nbatch_3.pdf\n\nbatch_5.pdf"
+    assert title == "Title"
+    assert complete
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_pages(converter, large_pdf):
+    """Test that a failed batch is retried page by page and a failed page is reported."""
+
+    async def ocr(path):
+        if path in ("batch_3.pdf", "page_4.pdf"):
+            raise ValueError("OCR failed")
+        return path, None
+
+    converter._process_single_pdf = ocr
+
+    md_content, _, complete = await converter._process_large_pdf(large_pdf)
+
+    assert md_content == "batch_1.pdf\n\npage_3.pdf\n\nbatch_5.pdf"
+    assert not complete
@@ -124,6 +124,7 @@ class TestQdrantDestinationConnection:
         ):
             # Configure mocks with an actual string value instead of a MagicMock
             mock_settings.qdrant_url = "http://test-qdrant-settings.com:6333"
+            mock_settings.QDRANT_PREFER_GRPC = False
             mock_client = AsyncMock()
             collections_response = MagicMock()
             collections_response.collections = []
@@ -140,6 +141,28 @@ class TestQdrantDestinationConnection:
             )
             mock_client.get_collections.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_connect_to_qdrant_with_grpc(self):
+        """Test that gRPC transport is used when configured."""
+        with (
+            patch("airweave.platform.destinations.qdrant.AsyncQdrantClient") as mock_client_class,
+            patch("airweave.platform.destinations.qdrant.settings") as mock_settings,
+        ):
+            mock_settings.qdrant_url = "http://test-qdrant-settings.com:6333"
+            mock_settings.QDRANT_PREFER_GRPC = True
+            mock_settings.QDRANT_GRPC_PORT = 6334
+            mock_client_class.return_value = AsyncMock()
+
+            destination = QdrantDestination()
+            await destination.connect_to_qdrant()
+
+            mock_client_class.assert_called_once_with(
+                location="http://test-qdrant-settings.com:6333",
+                prefer_grpc=True,
+                grpc_port=6334,
+                port=None,
+            )
+
     @pytest.mark.asyncio
     async def test_close_connection(self):
         """Test closing the connection."""
@@ -183,6 +206,46 @@ class TestQdrantDestinationCollections:
             assert result is True
             destination.client.get_collections.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_setup_collection_creates_payload_indexes(self):
+        """Test that a new collection gets keyword indexes on the filter fields."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "new_collection"
+        destination.client.get_collections.return_value = MagicMock(collections=[])
+
+        await destination.setup_collection(vector_size=4)
+
+        indexed = {
+            c.kwargs["field_name"]: c.kwargs
+            for c in destination.client.create_payload_index.mock_calls
+        }
+        assert set(indexed) == {"sync_id", "entity_id", "parent_entity_id"}
+        assert all(kwargs["field_schema"] == "keyword" for kwargs in indexed.values())
+
+    @pytest.mark.asyncio
+    async def test_ensure_payload_indexes_adds_missing_only(self):
+        """Test that existing collections only get the indexes they are missing."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "old_collection"
+        existing = MagicMock()
+        existing.name = "old_collection"
+        destination.client.get_collections.return_value = MagicMock(collections=[existing])
+        destination.client.get_collection.return_value = MagicMock(
+            payload_schema={"sync_id": MagicMock()}
+        )
+
+        await destination.ensure_payload_indexes()
+
+        fields = [
+            c.kwargs["field_name"] for c in destination.client.create_payload_index.mock_calls
+        ]
+        assert fields == ["entity_id", "parent_entity_id"]
+        assert all(
+            c.kwargs["wait"] is False for c in destination.client.create_payload_index.mock_calls
+        )
+
 
 class TestQdrantDestinationOperations:
     """Tests for QdrantDestination operations."""
@@ -231,14 +294,97 @@ class TestQdrantDestinationOperations:
             for i in range(3)
         ]
 
-        # Insert entities
+        # Insert entities, they stay buffered until the destination is flushed
         await destination.bulk_insert(entities)
+        destination.client.upsert.assert_not_called()
+        await destination.flush()
 
         # Verify client call
         destination.client.upsert.assert_called_once()
         call_args = destination.client.upsert.call_args[1]
         assert call_args["collection_name"] == "test_collection"
         assert len(call_args["points"]) == 3
+        assert call_args["wait"] is True
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_uploads_full_batches_without_waiting(self):
+        """Test that full batches are uploaded in the background and flush is a barrier."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.client.upsert.return_value = MagicMock(errors=None)
+        destination.collection_name = "test_collection"
+        destination.write_batch_size = 2
+
+        entities = [
+            MockChunkEntity(
+                entity_id=f"test_entity_id_{i}",
+                db_entity_id=uuid.uuid4(),
+                vector=[0.1, 0.2, 0.3, 0.4],
+            )
+            for i in range(4)
+        ]
+        await destination.bulk_insert(entities)
+        await destination.flush()
+
+        calls = destination.client.upsert.call_args_list
+        assert [len(c.kwargs["points"]) for c in calls] == [2, 2, 1]
+        assert [c.kwargs["wait"] for c in calls] == [False, False, True]
+        # The barrier re-upserts the last uploaded point
+        assert calls[-1].kwargs["points"][0].id in {p.id for p in calls[1].kwargs["points"]}
+
+    @pytest.mark.asyncio
+    async def test_flush_reports_failed_upload_once(self):
+        """Test that a failed background upload is reported by the next flush only."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.client.upsert.side_effect = RuntimeError("upload failed")
+        destination.collection_name = "test_collection"
+        destination.write_batch_size = 1
+
+        await destination.bulk_insert(
+            [MockChunkEntity(entity_id="a", db_entity_id=uuid.uuid4(), vector=[0.1])]
+        )
+        assert await destination.flush() == {"a"}
+
+        # Later batches are not failed by the earlier upload
+        destination.client.upsert.side_effect = None
+        destination.client.upsert.return_value = MagicMock(errors=None)
+        await destination.bulk_insert(
+            [MockChunkEntity(entity_id="b", db_entity_id=uuid.uuid4(), vector=[0.1])]
+        )
+        assert await destination.flush() == set()
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_by_parent_id_keeps_excluded_points(self):
+        """Test that points listed in exclude_ids are not deleted."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "test_collection"
+        keep_id = uuid.uuid4()
+
+        await destination.bulk_delete_by_parent_id("parent", "sync", exclude_ids=[keep_id])
+
+        selector = destination.client.delete.call_args.kwargs["points_selector"]
+        assert selector.filter.must_not[0].has_id == [str(keep_id)]
+        assert {condition.key for condition in selector.filter.must} == {
+            "parent_entity_id",
+            "sync_id",
+        }
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_by_parent_ids_uses_single_request(self):
+        """Test that the points of many parents are deleted with one filtered request."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "test_collection"
+        keep_id = uuid.uuid4()
+
+        await destination.bulk_delete_by_parent_ids(["a", "b"], "sync", exclude_ids=[keep_id])
+
+        destination.client.delete.assert_called_once()
+        selector = destination.client.delete.call_args.kwargs["points_selector"]
+        assert selector.filter.must[0].match.any == ["a", "b"]
+        assert selector.filter.must_not[0].has_id == [str(keep_id)]
 
     @pytest.mark.asyncio
     async def test_search(self):
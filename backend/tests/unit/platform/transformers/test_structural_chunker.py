@@ -0,0 +1,73 @@
+"""Unit tests for the structural chunker."""
+
+from unittest.mock import patch
+
+import pytest
+import tiktoken
+
+from airweave.platform.transformers import structural_chunker
+from airweave.platform.transformers.structural_chunker import chunk_by_structure
+from airweave.platform.transformers.tokenizer import Tokenizer
+
+# Encoding with one token per byte, which needs no download
+BYTE_TOKENIZER = Tokenizer(
+    tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+)
+
+
+def chunk(text, chunk_size):
+    """Chunk text with the byte tokenizer, returning the texts of the chunks."""
+    return [text for text, _ in chunk_by_structure(text, chunk_size, BYTE_TOKENIZER)]
+
+
+DOCUMENT = (
+    "# Introduction\n\nFirst paragraph of the introduction. It has two sentences.\n\n"
+    "Second paragraph of the introduction.\n"
+    "# Usage\n\nInstall the package and run it. Then check the output carefully.\n"
+    "## Options\n\nAll options are optional."
+)
+
+
+def test_small_text_is_one_chunk():
+    """Test that text within the budget is not split."""
+    assert chunk_by_structure("A short text.", 20, BYTE_TOKENIZER) == [("A short text.", 13)]
+
+
+def test_chunks_stay_within_budget_and_join_to_text():
+    """Test that no chunk exceeds the budget and no text is lost or reordered."""
+    chunks = chunk_by_structure(DOCUMENT, 40, BYTE_TOKENIZER)
+
+    assert len(chunks) > 1
+    assert all(len(text.encode()) == count <= 40 for text, count in chunks)
+    assert "".join(text for text, _ in chunks) == DOCUMENT
+
+
+def test_splits_on_headings_first():
+    """Test that sections that fit the budget are kept whole."""
+    chunks = chunk(DOCUMENT, 120)
+
+    assert chunks[0].startswith("# Introduction")
+    assert chunks[1].startswith("\n# Usage")
+    assert chunks[1].endswith("All options are optional.")
+
+
+def test_chunking_is_deterministic():
+    """Test that the same text always gives the same chunks."""
+    assert chunk(DOCUMENT, 30) == chunk(DOCUMENT, 30)
+
+
+def test_text_without_separators_is_split_on_the_budget():
+    """Test that a long run without whitespace is cut on its token offsets."""
+    assert chunk("x" * 25, 10) == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_unknown_chunking_mode_is_rejected():
+    """Test that a misconfigured chunking mode raises instead of silently falling back."""
+    with patch.object(structural_chunker.settings, "CHUNKING_MODE", "fancy"):
+        with pytest.raises(ValueError):
+            structural_chunker.semantic_chunking_enabled()
@@ -0,0 +1,68 @@
+"""Unit tests for the shared tokenizer."""
+
+from unittest.mock import patch
+
+import tiktoken
+
+from airweave.platform.transformers.tokenizer import Tokenizer
+
+
+def make_tokenizer(cache_size=100):
+    """Create a tokenizer with one token per byte, which needs no download."""
+    encoding = tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+    return Tokenizer(encoding, cache_size=cache_size)
+
+
+def test_counts_are_cached_by_content():
+    """Test that a text is encoded once however often its tokens are counted."""
+    tokenizer = make_tokenizer()
+
+    with patch.object(
+        tokenizer.encoding, "encode_ordinary", wraps=tokenizer.encoding.encode_ordinary
+    ) as encode:
+        assert tokenizer.count_tokens("same text") == 9
+        assert tokenizer.count_tokens("same text") == 9
+
+    encode.assert_called_once()
+
+
+def test_batch_counts_encode_only_uncached_texts():
+    """Test that batch counting reuses cached counts and keeps the order of the texts."""
+    tokenizer = make_tokenizer()
+    tokenizer.count_tokens("cached")
+
+    with patch.object(
+        tokenizer.encoding,
+        "encode_ordinary_batch",
+        wraps=tokenizer.encoding.encode_ordinary_batch,
+    ) as encode_batch:
+        counts = tokenizer.count_tokens_batch(["new", "cached", "newer"])
+
+    assert counts == [3, 6, 5]
+    assert encode_batch.call_args.args[0] == ["new", "newer"]
+
+
+def test_least_recently_used_counts_are_evicted():
+    """Test that the count cache stays within its size."""
+    tokenizer = make_tokenizer(cache_size=2)
+
+    tokenizer.count_tokens_batch(["a", "bb", "ccc"])
+
+    assert len(tokenizer._counts) == 2
+    assert tokenizer._get_count(tokenizer._key("a")) is None
+
+
+def test_split_on_token_offsets_joins_to_text():
+    """Test that text is cut into pieces within the budget without losing characters."""
+    tokenizer = make_tokenizer()
+    text = "héllo wörld, " * 5
+
+    pieces = tokenizer.split(text, 8)
+
+    assert "".join(pieces) == text
+    assert all(tokenizer.count_tokens(piece) <= 8 for piece in pieces)
@@ -0,0 +1,82 @@
+"""Unit tests for running CPU-bound work in the process pool."""
+
+import asyncio
+import math
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from airweave.platform.utils import process_pool
+
+
+@pytest.fixture
+def pool_settings():
+    """Use a small pool and shut it down after the test."""
+    with patch.object(process_pool, "settings") as settings:
+        settings.PROCESS_POOL_WORKERS = 1
+        settings.PROCESS_POOL_TASK_TIMEOUT = 30
+        yield settings
+    process_pool.shutdown_process_pool()
+
+
+@pytest.mark.asyncio
+async def test_runs_in_worker_process(pool_settings):
+    """Test that tasks run in another process and return their result."""
+    assert await process_pool.run_in_process(math.factorial, 10) == 3628800
+    assert await process_pool.run_in_process(os.getpid) != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_runs_in_thread_without_workers(pool_settings):
+    """Test that tasks run in a thread of this process when the pool is disabled."""
+    pool_settings.PROCESS_POOL_WORKERS = 0
+
+    assert await process_pool.run_in_process(os.getpid) == os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_task_timeout(pool_settings):
+    """Test that a task exceeding its timeout raises."""
+    pool_settings.PROCESS_POOL_WORKERS = 0
+
+    with pytest.raises(asyncio.TimeoutError):
+        await process_pool.run_in_process(time.sleep, 1, timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_hung_worker_is_replaced(pool_settings):
+    """Test that a timed out task kills its worker and the pool is recreated."""
+    with pytest.raises(asyncio.TimeoutError):
+        await process_pool.run_in_process(time.sleep, 60, timeout=2)
+
+    assert await process_pool.run_in_process(math.factorial, 5, timeout=10) == 120
+
+
+@pytest.mark.asyncio
+async def test_queued_tasks_do_not_time_out(pool_settings):
+    """Test that time spent waiting for a free worker does not count toward the timeout."""
+    await process_pool.run_in_process(math.factorial, 5)
+
+    results = await asyncio.gather(
+        *(process_pool.run_in_process(time.sleep, 1, timeout=2) for _ in range(3))
+    )
+
+    assert results == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_task_is_retried_when_pool_breaks(pool_settings):
+    """Test that a task survives another task's timeout tearing down the pool."""
+    pool_settings.PROCESS_POOL_WORKERS = 2
+    await process_pool.run_in_process(math.factorial, 5)
+
+    hung, survivor = await asyncio.gather(
+        process_pool.run_in_process(time.sleep, 60, timeout=1),
+        process_pool.run_in_process(time.sleep, 2, timeout=10),
+        return_exceptions=True,
+    )
+
+    assert isinstance(hung, asyncio.TimeoutError)
+    assert survivor is None
@@ -0,0 +1,103 @@
+"""Unit tests for the adaptive token-bucket rate limiter."""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from airweave.platform.utils import rate_limiter
+from airweave.platform.utils.rate_limiter import LocalRateLimiter, _parse_reset
+
+
+@pytest.mark.asyncio
+async def test_burst_is_free_then_requests_wait():
+    """Test that a full bucket serves a burst and later requests wait for tokens."""
+    limiter = LocalRateLimiter(rate=10, burst=2)
+
+    assert await limiter._reserve() == 0
+    assert await limiter._reserve() == 0
+    assert await limiter._reserve() == pytest.approx(0.1, abs=0.01)
+    assert await limiter._reserve() == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_requests():
+    """Test that a 429 with Retry-After pauses the bucket."""
+    limiter = LocalRateLimiter(rate=10, burst=5)
+
+    await limiter.update_from_headers(429, httpx.Headers({"Retry-After": "3"}))
+
+    assert await limiter._reserve() == pytest.approx(3.1, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_exhausted_quota_pauses_until_reset():
+    """Test that no remaining quota pauses the bucket until the reset time."""
+    limiter = LocalRateLimiter(rate=10, burst=5)
+    reset = str(int(time.time()) + 60)
+
+    await limiter.update_from_headers(
+        200, httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+    )
+
+    assert 58 < await limiter._reserve() < 61
+
+
+@pytest.mark.asyncio
+async def test_low_quota_is_spread_until_reset():
+    """Test that a nearly used quota lowers the rate and a fresh quota restores it."""
+    limiter = LocalRateLimiter(rate=10, burst=100)
+    reset_ms = str(int((time.time() + 100) * 1000))
+
+    await limiter.update_from_headers(
+        200,
+        httpx.Headers(
+            {"X-RateLimit-Requests-Remaining": "50", "X-RateLimit-Requests-Reset": reset_ms}
+        ),
+    )
+    assert limiter.rate == pytest.approx(0.5, rel=0.05)
+
+    await limiter.update_from_headers(
+        200,
+        httpx.Headers(
+            {"X-RateLimit-Requests-Remaining": "1000", "X-RateLimit-Requests-Reset": reset_ms}
+        ),
+    )
+    assert limiter.rate == 10
+
+
+def test_parse_reset_formats():
+    """Test that reset headers in epoch seconds, epoch milliseconds and seconds are parsed."""
+    now = time.time()
+
+    assert _parse_reset(str(now + 30)) == pytest.approx(30, abs=1)
+    assert _parse_reset(str((now + 30) * 1000)) == pytest.approx(30, abs=1)
+    assert _parse_reset("30") == 30
+    assert _parse_reset("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_acquire_returns_seconds_waited():
+    """Test that acquire reports whether the request had to wait."""
+    limiter = LocalRateLimiter(rate=1000, burst=1)
+
+    assert await limiter.acquire() == 0
+    assert await limiter.acquire() > 0
+
+
+def test_local_limiters_are_bounded():
+    """Test that the limiters of the least recently used credentials are dropped."""
+    with (
+        patch.object(rate_limiter.settings, "SOURCE_RATE_LIMIT_BACKEND", "local"),
+        patch.object(rate_limiter, "MAX_LOCAL_LIMITERS", 2),
+        patch.object(rate_limiter, "_local_limiters", rate_limiter.OrderedDict()),
+    ):
+        first = rate_limiter.get_rate_limiter("github", "first", rate=10)
+        rate_limiter.get_rate_limiter("github", "second", rate=10)
+        # Using the first limiter again makes the second one the least recently used
+        assert rate_limiter.get_rate_limiter("github", "first", rate=10) is first
+        rate_limiter.get_rate_limiter("github", "third", rate=10)
+
+        assert len(rate_limiter._local_limiters) == 2
+        assert rate_limiter.get_rate_limiter("github", "first", rate=10) is first